@@ -0,0 +1,112 @@
+"""Compares the integer-cents Dollar with the previous Decimal-backed Dollar.
+
+Run with `python benchmarks/bench_dollar.py`.
+"""
+
+import timeit
+from decimal import ROUND_HALF_UP, Decimal
+
+from loan_utils.dollar import Dollar
+from loan_utils.loan import Loan
+
+CENT: Decimal = Decimal("0.01")
+
+
+class DecimalDollar:
+    """The previous Dollar: a Decimal quantized to cents after every operation."""
+
+    def __init__(self, amount: Decimal):
+        self.amount = amount
+
+    @classmethod
+    def _from_decimal(cls, amount: Decimal) -> "DecimalDollar":
+        obj = cls.__new__(cls)
+        obj.amount = amount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+        return obj
+
+    @staticmethod
+    def _check_is_dollar(other, operation: str):
+        if not isinstance(other, DecimalDollar):
+            raise TypeError(f"Unsupported operand type for {operation}")
+
+    def __add__(self, other):
+        self._check_is_dollar(other, "+")
+
+        return DecimalDollar._from_decimal(self.amount + other.amount)
+
+    def __sub__(self, other):
+        self._check_is_dollar(other, "-")
+
+        return DecimalDollar._from_decimal(self.amount - other.amount)
+
+    def __lt__(self, other):
+        self._check_is_dollar(other, "<")
+
+        return self.amount < other.amount
+
+    def multiply_by(self, multiplier) -> "DecimalDollar":
+        return DecimalDollar._from_decimal(self.amount * Decimal(str(multiplier)))
+
+    def divide_by(self, divisor) -> "DecimalDollar":
+        return DecimalDollar._from_decimal(self.amount / Decimal(str(divisor)))
+
+
+def schedule(dollar_type, loan_amount, payment, rate: float, months: int):
+    """The body of Loan.amortization_schedule without the DataFrame."""
+    balance = loan_amount
+    total_interest = dollar_type(0) if dollar_type is Dollar else DecimalDollar(Decimal(0))
+    zero = dollar_type(0) if dollar_type is Dollar else DecimalDollar(Decimal(0))
+
+    for _ in range(months):
+        interest = balance.multiply_by(rate)
+        principal = payment - interest
+        balance = balance - principal
+        total_interest = total_interest + interest
+        if balance < zero:
+            break
+
+    return total_interest
+
+
+def main():
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+    rate: float = loan.monthly_interest_rate
+    new_a, new_b = Dollar("320000.00"), Dollar("2022.62")
+    old_a, old_b = DecimalDollar(Decimal("320000.00")), DecimalDollar(Decimal("2022.62"))
+
+    cases = {
+        "add": (lambda: new_a + new_b, lambda: old_a + old_b),
+        "sub": (lambda: new_a - new_b, lambda: old_a - old_b),
+        "multiply_by": (lambda: new_a.multiply_by(rate), lambda: old_a.multiply_by(rate)),
+        "divide_by": (lambda: new_a.divide_by(12), lambda: old_a.divide_by(12)),
+        "360-month schedule": (
+            lambda: schedule(Dollar, loan.loan_amount, loan.monthly_payment, rate, 360),
+            lambda: schedule(
+                DecimalDollar,
+                DecimalDollar(loan.loan_amount.amount),
+                DecimalDollar(loan.monthly_payment.amount),
+                rate,
+                360,
+            ),
+        ),
+    }
+
+    print(f"{'operation':<20}{'cents (us)':>12}{'decimal (us)':>14}{'speedup':>10}")
+    for name, (new, old) in cases.items():
+        number: int = 200 if "schedule" in name else 100_000
+        new_time: float = min(timeit.repeat(new, number=number, repeat=5)) / number
+        old_time: float = min(timeit.repeat(old, number=number, repeat=5)) / number
+        print(
+            f"{name:<20}{new_time * 1e6:>12.3f}{old_time * 1e6:>14.3f}"
+            f"{old_time / new_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""Benchmark suite with machine-readable results and baseline comparison.
+
+Run from the repository root:
+
+    python benchmarks/run.py                         # run and print
+    python benchmarks/run.py --output results.json   # also write JSON
+    python benchmarks/run.py --save_baseline         # store benchmarks/baseline.json
+    python benchmarks/run.py --threshold 0.2 --threshold_for import_cli=0.5
+
+Every result is compared against benchmarks/baseline.json, which is committed
+with the code, and the script exits with status 1 if any benchmark is slower
+(or larger) than the baseline by more than its threshold. Timings are only
+comparable on similar machines: on a different machine, record a local
+baseline first (--save_baseline, or --baseline PATH to keep the committed one)
+and compare against that. Re-record and commit the baseline whenever a change
+intentionally moves a result.
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from loan_utils.batch import read_loans, run_batch
+from loan_utils.dollar import Dollar
+from loan_utils.loan import Loan
+from loan_utils.portfolio import amortize_portfolio, amortize_portfolio_cents
+from loan_utils.schedule_store import ScheduleStore, ScheduleWriter
+
+DEFAULT_BASELINE: Path = Path(__file__).with_name("baseline.json")
+DEFAULT_THRESHOLD: float = 0.10
+
+# Portfolios larger than this are amortized in chunks of this many loans, as
+# the batch command does, so 100k loans do not need gigabytes of matrices.
+PORTFOLIO_CHUNK: int = 10_000
+
+
+class Result:
+    """One measurement. Every benchmark here is lower-is-better."""
+
+    def __init__(self, name: str, value: float, unit: str):
+        self.name: str = name
+        self.value: float = value
+        self.unit: str = unit
+
+    def to_json(self) -> dict:
+        return {"value": self.value, "unit": self.unit}
+
+
+# --------------------
+# Measurements
+# --------------------
+def time_per_call(function: Callable, number: int, repeat: int = 5) -> float:
+    """Returns the best seconds per call over several timing runs."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def peak_memory(function: Callable) -> int:
+    """Returns the peak bytes allocated through Python while running a function."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def import_time_us(module: str) -> int:
+    """Returns the cumulative `python -X importtime` microseconds of a module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match and match.group(3) == module:
+            return int(match.group(1))
+
+    raise RuntimeError(f"{module} does not appear in the import time report.")
+
+
+# --------------------
+# Workloads
+# --------------------
+def sample_loan() -> Loan:
+    return Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+
+def sample_portfolio(n_loans: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns reproducible principal cents, rates and terms for n loans."""
+    generator: np.random.Generator = np.random.default_rng(0)
+    principal: np.ndarray = generator.integers(5_000_00, 1_000_000_00, n_loans)
+    rates: np.ndarray = np.round(generator.uniform(2.0, 9.0, n_loans), 3)
+    terms: np.ndarray = generator.choice([60, 180, 360], n_loans)
+
+    return principal, rates, terms
+
+
+def amortize_in_chunks(kernel: Callable, n_loans: int, cents: bool):
+    principal, rates, terms = sample_portfolio(n_loans)
+    amounts = principal if cents else principal / 100
+    for start in range(0, n_loans, PORTFOLIO_CHUNK):
+        stop: int = start + PORTFOLIO_CHUNK
+        kernel(amounts[start:stop], rates[start:stop], terms[start:stop])
+
+
+def sample_records_csv(n_loans: int) -> str:
+    principal, rates, terms = sample_portfolio(n_loans)
+    output: io.StringIO = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(
+        ["id", "price", "annual_interest_percentage", "down_payment_percentage", "term_years"]
+    )
+    for index, (cents, rate, term) in enumerate(zip(principal, rates, terms)):
+        writer.writerow([index, cents / 100, rate, 20, term // 12])
+
+    return output.getvalue()
+
+
+def sample_store(path: Path, n_loans: int, month_major: bool) -> ScheduleStore:
+    """Writes a 360-month store of n sample loans and opens it."""
+    principal, rates, terms = sample_portfolio(n_loans)
+    with ScheduleWriter(path, n_loans, 360, month_major) as writer:
+        for start in range(0, n_loans, PORTFOLIO_CHUNK):
+            stop: int = start + PORTFOLIO_CHUNK
+            writer.write(
+                amortize_portfolio_cents(
+                    principal[start:stop], rates[start:stop], terms[start:stop]
+                )
+            )
+
+    return ScheduleStore(path)
+
+
+def mortgage_details():
+    from loan_utils.mortgage import Mortgage
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        mortgage: Mortgage = Mortgage(
+            annual_interest_percent=6.5,
+            closing_costs=5000,
+            down_payment_percent=20.0,
+            purchase_price=400000,
+            term_years=30,
+        )
+    mortgage.mortgage_details(extra_payment=200)
+
+
+# --------------------
+# Suite
+# --------------------
+def run_suite(quick: bool, selected: str | None) -> list[Result]:
+    """Runs every benchmark whose name contains `selected`."""
+    scale: int = 10 if quick else 1
+    loan: Loan = sample_loan()
+    a, b = Dollar("320000.00"), Dollar("2022.62")
+    rate: float = loan.monthly_interest_rate
+    batch_csv: str = sample_records_csv(1000)
+
+    def batch():
+        run_batch(read_loans(io.StringIO(batch_csv), "csv"), io.StringIO())
+
+    # Month cross-sections, with and without the month-major copies.
+    store_directory = tempfile.TemporaryDirectory()
+    store_layouts: dict[str, bool] = {
+        "store_month_strided_100k": False,
+        "store_month_major_100k": True,
+    }
+    stores: dict[bool, ScheduleStore] = {
+        month_major: sample_store(
+            Path(store_directory.name) / f"{name}.bin", 100_000 // scale, month_major
+        )
+        for name, month_major in store_layouts.items()
+        if selected is None or selected in name
+    }
+
+    def month_totals(month_major: bool) -> int:
+        store: ScheduleStore = stores[month_major]
+        return sum(int(store.month(month).balance.sum()) for month in range(1, 361, 30))
+
+    timed: dict[str, tuple[Callable, int]] = {
+        "dollar_add": (lambda: a + b, 100_000 // scale),
+        "dollar_sub": (lambda: a - b, 100_000 // scale),
+        "dollar_multiply_by": (lambda: a.multiply_by(rate), 100_000 // scale),
+        "dollar_divide_by": (lambda: a.divide_by(12), 100_000 // scale),
+        "dollar_compare": (lambda: a < b, 100_000 // scale),
+        "dollar_str": (lambda: str(a), 100_000 // scale),
+        "loan_iter_schedule_30y": (lambda: sum(1 for _ in loan.iter_schedule()), 50 // scale),
+        "loan_amortization_schedule_30y": (loan.amortization_schedule, 20 // scale),
+        "mortgage_details_30y": (mortgage_details, 5),
+        "portfolio_float_1k": (lambda: amortize_in_chunks(amortize_portfolio, 1000, False), 5),
+        "portfolio_cents_1k": (
+            lambda: amortize_in_chunks(amortize_portfolio_cents, 1000, True),
+            5,
+        ),
+        "portfolio_float_100k": (
+            lambda: amortize_in_chunks(amortize_portfolio, 100_000 // scale, False),
+            1,
+        ),
+        "portfolio_cents_100k": (
+            lambda: amortize_in_chunks(amortize_portfolio_cents, 100_000 // scale, True),
+            1,
+        ),
+        "batch_1k": (batch, 1),
+        "store_month_strided_100k": (lambda: month_totals(False), 3),
+        "store_month_major_100k": (lambda: month_totals(True), 3),
+    }
+    measured_memory: dict[str, Callable] = {
+        "peak_memory_amortization_schedule_30y": loan.amortization_schedule,
+        "peak_memory_portfolio_cents_10k": lambda: amortize_in_chunks(
+            amortize_portfolio_cents, PORTFOLIO_CHUNK, True
+        ),
+    }
+    imported: dict[str, str] = {
+        "import_loan_utils_loan": "loan_utils.loan",
+        "import_cli": "loan_utils.loan_analyzer_cli",
+    }
+
+    results: list[Result] = []
+
+    def wanted(name: str) -> bool:
+        return selected is None or selected in name
+
+    for name, (function, number) in timed.items():
+        if wanted(name):
+            repeat: int = 3 if number == 1 else 5
+            results.append(Result(name, time_per_call(function, max(number, 1), repeat), "s"))
+    for name, function in measured_memory.items():
+        if wanted(name):
+            results.append(Result(name, peak_memory(function), "bytes"))
+    for name, module in imported.items():
+        if wanted(name):
+            best: int = min(import_time_us(module) for _ in range(3 if quick else 5))
+            results.append(Result(name, best, "us"))
+
+    stores.clear()
+    store_directory.cleanup()
+
+    return results
+
+
+# --------------------
+# Reporting
+# --------------------
+def metadata() -> dict:
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(
+    results: list[Result], baseline: dict, threshold: float, overrides: dict[str, float]
+) -> list[str]:
+    """Prints each result next to the baseline and returns the regressed names."""
+    regressions: list[str] = []
+    print(f"{'benchmark':<40}{'value':>14}{'baseline':>14}{'change':>10}")
+
+    for result in results:
+        previous: dict | None = baseline.get(result.name)
+        if previous is None:
+            print(f"{result.name:<40}{format_value(result.value, result.unit):>14}")
+            continue
+
+        change: float = result.value / previous["value"] - 1 if previous["value"] else 0.0
+        limit: float = overrides.get(result.name, threshold)
+        flag: str = "  REGRESSION" if change > limit else ""
+        if flag:
+            regressions.append(result.name)
+        print(
+            f"{result.name:<40}{format_value(result.value, result.unit):>14}"
+            f"{format_value(previous['value'], result.unit):>14}{change:>+10.1%}{flag}"
+        )
+
+    return regressions
+
+
+def format_value(value: float, unit: str) -> str:
+    if unit == "s":
+        for scale, suffix in [(1, "s"), (1e-3, "ms"), (1e-6, "us")]:
+            if value >= scale:
+                return f"{value / scale:.3f} {suffix}"
+        return f"{value / 1e-9:.1f} ns"
+    if unit == "bytes":
+        return f"{value / 2**20:.2f} MiB"
+
+    return f"{value / 1000:.1f} ms"
+
+
+def parse_overrides(values: list[str]) -> dict[str, float]:
+    overrides: dict[str, float] = {}
+    for value in values:
+        name, _, threshold = value.partition("=")
+        if not threshold:
+            raise argparse.ArgumentTypeError(f"Expected NAME=THRESHOLD, got {value!r}")
+        overrides[name] = float(threshold)
+
+    return overrides
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the loan-analyzer benchmarks.")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file.")
+    parser.add_argument(
+        "--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file."
+    )
+    parser.add_argument(
+        "--save_baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing.",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before a result counts as a regression.",
+    )
+    parser.add_argument(
+        "--threshold_for",
+        action="append",
+        default=[],
+        metavar="NAME=THRESHOLD",
+        help="Per-benchmark threshold, e.g. import_cli=0.5. May be repeated.",
+    )
+    parser.add_argument("--filter", type=str, help="Only run benchmarks containing this text.")
+    parser.add_argument(
+        "--quick", action="store_true", help="Fewer iterations and smaller portfolios."
+    )
+    args = parser.parse_args()
+
+    results: list[Result] = run_suite(args.quick, args.filter)
+    document: dict = {
+        "metadata": {**metadata(), "quick": args.quick},
+        "results": {result.name: result.to_json() for result in results},
+    }
+
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+
+    baseline: dict = {}
+    if args.baseline.exists() and not args.save_baseline:
+        stored: dict = json.loads(args.baseline.read_text())
+        if stored["metadata"].get("quick") != args.quick:
+            print("Warning: the baseline was recorded with a different --quick setting.")
+        baseline = stored["results"]
+    elif not args.save_baseline:
+        print(f"No baseline at {args.baseline}; run with --save_baseline to record one.")
+
+    regressions: list[str] = compare(
+        results, baseline, args.threshold, parse_overrides(args.threshold_for)
+    )
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Closed-form annuity math shared by Loan and the vectorized loan engines."""
+
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+
+from loan_utils.rate import Rate
+
+# A few hundred (rate, term) pairs cover most portfolios; the bound only keeps
+# pathological inputs from growing the cache without limit.
+ANNUITY_FACTOR_CACHE_SIZE: int = 4096
+
+
+@lru_cache(maxsize=ANNUITY_FACTOR_CACHE_SIZE)
+def monthly_payment_factor(monthly_interest_rate: float, term_months: int) -> Decimal:
+    """Returns the level payment per dollar borrowed for a nonzero monthly rate.
+
+    Results are memoized per (rate, term) with LRU eviction; lru_cache is safe to
+    call from several threads.
+    """
+    interest_rate: Decimal = Decimal(str(monthly_interest_rate))
+
+    return interest_rate / (Decimal(1) - (Decimal(1) + interest_rate) ** -term_months)
+
+
+def annuity_factor_cache_info() -> tuple[int, int, int, int]:
+    """Returns hits, misses, maxsize and current size of the payment factor cache."""
+    return monthly_payment_factor.cache_info()
+
+
+def clear_annuity_factor_cache() -> None:
+    """Empties the payment factor cache and resets its statistics."""
+    monthly_payment_factor.cache_clear()
+
+
+def prewarm_annuity_factors(
+    annual_interest_percents: Iterable[float], term_months: Iterable[int]
+) -> int:
+    """Computes the payment factor for every rate and term in a grid.
+
+    Rates are converted with Rate exactly as Loan does, so later lookups hit.
+    Returns the number of factors computed or refreshed.
+    """
+    terms: list[int] = [int(term) for term in term_months]
+    count: int = 0
+
+    for annual_interest_percent in annual_interest_percents:
+        rate: float = Rate(float(annual_interest_percent)).per_period(12)
+        if rate == 0.0:
+            continue
+        for term in terms:
+            monthly_payment_factor(rate, term)
+            count += 1
+
+    return count
+
+
+def monthly_rate(annual_interest_percent) -> np.ndarray:
+    """Converts annual percents to monthly fractions the same way Rate does."""
+    return np.asarray(annual_interest_percent, dtype=np.float64) / 100 / 12
+
+
+def annuity_factor(monthly_rate, term_months) -> np.ndarray:
+    """Returns the level payment per dollar borrowed, r / (1 - (1 + r) ** -n)."""
+    rate: np.ndarray = np.asarray(monthly_rate, dtype=np.float64)
+    term: np.ndarray = np.asarray(term_months, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        factor: np.ndarray = rate / -np.expm1(-term * np.log1p(rate))
+
+    return np.where(rate == 0.0, 1.0 / term, factor)
+
+
+def growth_minus_one(monthly_rate, months) -> np.ndarray:
+    """Returns (1 + r) ** k - 1 without cancellation for small rates."""
+    rate: np.ndarray = np.asarray(monthly_rate, dtype=np.float64)
+
+    return np.expm1(np.asarray(months, dtype=np.float64) * np.log1p(rate))
+
+
+def remaining_balance(principal, monthly_rate, payment, months) -> np.ndarray:
+    """Returns the unrounded balance after a number of level payments."""
+    principal = np.asarray(principal, dtype=np.float64)
+    rate: np.ndarray = np.asarray(monthly_rate, dtype=np.float64)
+    payment = np.asarray(payment, dtype=np.float64)
+    months = np.asarray(months, dtype=np.float64)
+    growth: np.ndarray = growth_minus_one(rate, months)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        balance: np.ndarray = principal + growth * (principal - payment / rate)
+
+    return np.where(rate == 0.0, principal - payment * months, balance)
+
+
+def cumulative_interest(principal, monthly_rate, payment, months) -> np.ndarray:
+    """Returns the unrounded interest paid over a number of level payments."""
+    principal = np.asarray(principal, dtype=np.float64)
+    payment = np.asarray(payment, dtype=np.float64)
+    months = np.asarray(months, dtype=np.float64)
+    balance: np.ndarray = remaining_balance(principal, monthly_rate, payment, months)
+
+    # Every payment is interest plus principal, so interest is what was paid
+    # beyond the reduction in balance.
+    return payment * months - (principal - balance)
+
+
+def payoff_months(principal, monthly_rate, payment) -> np.ndarray:
+    """Returns the number of level payments needed to repay a balance (NPER).
+
+    The result is fractional; the last payment is the partial one. Payments that
+    do not cover the first month's interest never pay off and give inf.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    rate: np.ndarray = np.asarray(monthly_rate, dtype=np.float64)
+    payment = np.asarray(payment, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        months: np.ndarray = -np.log1p(-rate * principal / payment) / np.log1p(rate)
+        months = np.where(rate == 0.0, principal / payment, months)
+
+    return np.where(payment > rate * principal, months, np.inf)
+
+
+def total_interest_paid(principal, monthly_rate, payment) -> np.ndarray:
+    """Returns the interest paid until payoff when the final payment is clamped."""
+    principal = np.asarray(principal, dtype=np.float64)
+    rate: np.ndarray = np.asarray(monthly_rate, dtype=np.float64)
+    payment = np.asarray(payment, dtype=np.float64)
+
+    # Tolerate float noise so an exact 360-payment loan is not counted as 361.
+    months: np.ndarray = np.ceil(payoff_months(principal, rate, payment) - 1e-9)
+    last_opening: np.ndarray = remaining_balance(principal, rate, payment, months - 1)
+    total_paid: np.ndarray = payment * (months - 1) + last_opening * (1 + rate)
+
+    return total_paid - principal
@@ -0,0 +1,209 @@
+"""Adjustable-rate mortgages evaluated over many index rate paths at once.
+
+The rate is fixed for an initial period and then resets every reset period to
+the index plus a margin, rounded and limited by the caps and floors. Between
+resets the rate and payment are constant, so each segment is amortized in
+closed form for every path at once; the payment is recast at each reset to pay
+off the balance over the rest of the term.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from loan_utils.annuity import (
+    annuity_factor,
+    cumulative_interest,
+    monthly_rate,
+    remaining_balance,
+)
+
+
+class ARMTerms:
+    """The rate adjustment terms of an ARM, with all rates in annual percent.
+
+    A 5/1 ARM with 2/2/5 caps is ARMTerms(margin, 60, 12, 2.0, 2.0, 5.0). The
+    first reset may move the rate by at most initial_cap_percent either way,
+    later resets by periodic_cap_percent up or periodic_floor_percent down (the
+    cap when not given). The rate always stays between lifetime_floor_percent
+    (the margin when not given) and the initial rate plus lifetime_cap_percent.
+    The fully indexed rate is rounded to the nearest rounding_percent; 0
+    disables rounding.
+    """
+
+    def __init__(
+        self,
+        margin_percent: float,
+        initial_fixed_months: int = 60,
+        reset_months: int = 12,
+        initial_cap_percent: float = 2.0,
+        periodic_cap_percent: float = 2.0,
+        lifetime_cap_percent: float = 5.0,
+        periodic_floor_percent: float | None = None,
+        lifetime_floor_percent: float | None = None,
+        rounding_percent: float = 0.125,
+    ):
+        if initial_fixed_months < 1 or reset_months < 1:
+            raise ValueError("The fixed period and reset period must be at least 1 month.")
+        if periodic_floor_percent is None:
+            periodic_floor_percent = periodic_cap_percent
+        if lifetime_floor_percent is None:
+            lifetime_floor_percent = margin_percent
+        if min(
+            initial_cap_percent,
+            periodic_cap_percent,
+            periodic_floor_percent,
+            lifetime_cap_percent,
+            rounding_percent,
+        ) < 0:
+            raise ValueError("Caps, floors and rounding must not be negative.")
+
+        self.margin_percent: float = margin_percent
+        self.initial_fixed_months: int = initial_fixed_months
+        self.reset_months: int = reset_months
+        self.initial_cap_percent: float = initial_cap_percent
+        self.periodic_cap_percent: float = periodic_cap_percent
+        self.lifetime_cap_percent: float = lifetime_cap_percent
+        self.periodic_floor_percent: float = periodic_floor_percent
+        self.lifetime_floor_percent: float = lifetime_floor_percent
+        self.rounding_percent: float = rounding_percent
+
+    def n_resets(self, term_months: int) -> int:
+        """Returns the number of rate resets over a term."""
+        if term_months <= self.initial_fixed_months:
+            return 0
+        return -(-(term_months - self.initial_fixed_months) // self.reset_months)
+
+    def segment_starts(self, term_months: int) -> np.ndarray:
+        """Returns the 0-based month each constant-rate segment starts in."""
+        resets: np.ndarray = self.initial_fixed_months + self.reset_months * np.arange(
+            self.n_resets(term_months)
+        )
+
+        return np.concatenate([[0], resets])
+
+    def rate_paths(self, initial_percent, index_percents) -> np.ndarray:
+        """Returns the rate of every segment for paths of index rates at each reset.
+
+        index_percents is a (..., resets) array; the result is (..., resets + 1)
+        with the initial rate first. Caps depend on the previous rate, so the
+        resets are stepped in order, each across every path at once.
+        """
+        index_percents = np.asarray(index_percents, dtype=np.float64)
+        n_resets: int = index_percents.shape[-1]
+        shape: tuple[int, ...] = np.broadcast_shapes(
+            np.shape(initial_percent), index_percents.shape[:-1]
+        )
+        initial: np.ndarray = np.broadcast_to(np.asarray(initial_percent, dtype=np.float64), shape)
+
+        fully_indexed: np.ndarray = np.broadcast_to(
+            index_percents + self.margin_percent, shape + (n_resets,)
+        )
+        if self.rounding_percent:
+            fully_indexed = np.round(fully_indexed / self.rounding_percent) * self.rounding_percent
+        lifetime_cap: np.ndarray = initial + self.lifetime_cap_percent
+
+        rates: np.ndarray = np.empty(shape + (n_resets + 1,))
+        rates[..., 0] = initial
+        for k in range(n_resets):
+            previous: np.ndarray = rates[..., k]
+            if k == 0:
+                up, down = self.initial_cap_percent, self.initial_cap_percent
+            else:
+                up, down = self.periodic_cap_percent, self.periodic_floor_percent
+            rate: np.ndarray = np.clip(fully_indexed[..., k], previous - down, previous + up)
+            rates[..., k + 1] = np.clip(rate, self.lifetime_floor_percent, lifetime_cap)
+
+        return rates
+
+
+class ARMSchedule:
+    """Per-segment rates, payments, interest and balances, in float dollars.
+
+    Arrays have the leading shape of the rate paths and one entry per segment
+    on the last axis; segment k starts in month segment_starts[k] (0-based).
+    """
+
+    def __init__(
+        self,
+        segment_starts: np.ndarray,
+        term_months: int,
+        rates: np.ndarray,
+        payments: np.ndarray,
+        interest: np.ndarray,
+        balances: np.ndarray,
+    ):
+        self.segment_starts: np.ndarray = segment_starts
+        self.term_months: int = term_months
+        self.rates: np.ndarray = rates
+        self.payments: np.ndarray = payments
+        self.interest: np.ndarray = interest
+        self.balances: np.ndarray = balances
+
+    @property
+    def segment_months(self) -> np.ndarray:
+        """The number of payments in each segment."""
+        return np.diff(np.append(self.segment_starts, self.term_months))
+
+    def total_interest(self) -> np.ndarray:
+        """Returns the interest paid over the whole term on each path."""
+        return self.interest.sum(axis=-1)
+
+    def max_payment(self) -> np.ndarray:
+        """Returns the largest monthly payment on each path."""
+        return self.payments.max(axis=-1)
+
+    def monthly_payments(self) -> np.ndarray:
+        """Expands the segment payments to one column per month of the term."""
+        return np.repeat(self.payments, self.segment_months, axis=-1)
+
+    def monthly_rates(self) -> np.ndarray:
+        """Expands the segment rates, in annual percent, to one column per month."""
+        return np.repeat(self.rates, self.segment_months, axis=-1)
+
+
+def amortize_arm(
+    principal, initial_percent, terms: ARMTerms, index_percents, term_months: int
+) -> ARMSchedule:
+    """Amortizes ARMs over rate paths given as (..., resets) index rate arrays.
+
+    principal and initial_percent broadcast against the leading axes, so the
+    paths can be loans x resets with one principal per loan, scenarios x
+    resets for a single loan, or loans x scenarios x resets with principal
+    shaped (loans, 1). Index values past the last reset are ignored.
+    """
+    index_percents = np.asarray(index_percents, dtype=np.float64)
+    n_resets: int = terms.n_resets(term_months)
+    if index_percents.ndim == 0 or index_percents.shape[-1] < n_resets:
+        raise ValueError(f"Rate paths need an index rate for each of the {n_resets} resets.")
+
+    starts: np.ndarray = terms.segment_starts(term_months)
+    lengths: np.ndarray = np.diff(np.append(starts, term_months))
+    rates: np.ndarray = terms.rate_paths(initial_percent, index_percents[..., :n_resets])
+    shape: tuple[int, ...] = np.broadcast_shapes(
+        np.shape(principal), np.shape(initial_percent), rates.shape[:-1]
+    )
+    rates = np.broadcast_to(rates, shape + rates.shape[-1:])
+
+    payments: np.ndarray = np.empty(rates.shape)
+    interest: np.ndarray = np.empty(rates.shape)
+    balances: np.ndarray = np.empty(rates.shape)
+    balance: np.ndarray = np.broadcast_to(np.asarray(principal, dtype=np.float64), shape)
+
+    # Recast at each reset: pay off the balance over the rest of the term.
+    for k, (start, months) in enumerate(zip(starts.tolist(), lengths.tolist())):
+        rate: np.ndarray = monthly_rate(rates[..., k])
+        payment: np.ndarray = balance * annuity_factor(rate, term_months - start)
+        payments[..., k] = payment
+        interest[..., k] = cumulative_interest(balance, rate, payment, months)
+        balance = remaining_balance(balance, rate, payment, months)
+        balances[..., k] = balance
+
+    return ARMSchedule(
+        segment_starts=starts,
+        term_months=term_months,
+        rates=rates,
+        payments=payments,
+        interest=interest,
+        balances=balances,
+    )
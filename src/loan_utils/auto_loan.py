@@ -1,47 +1,161 @@
-import matplotlib.pyplot as plt
+from __future__ import annotations
+
+import math
+from pathlib import Path
 
 from loan_utils.balance_tracker import BalanceTracker
+from loan_utils.charts import ChartSpec, Series, render_chart
 from loan_utils.dollar import Dollar
 from loan_utils.loan import Loan
+from loan_utils.monte_carlo import (
+    BootstrapReturns,
+    LognormalReturns,
+    MarginDistribution,
+    simulate_margins,
+)
+from loan_utils.portfolio import amortize_portfolio
+from loan_utils.profiling import phase
 
 
 class AutoLoan(Loan):
-    def auto_loan_details(self) -> None:
-        loan_amount: Dollar = Dollar(21893.01)
-        loan_interest_rate: float = 0.0699
-        term_length_months: int = 48
-        extra_insurance_monthly_payment: Dollar = Dollar(71.75)
-
-        monthly_interest_rate: float = loan_interest_rate / 12
-        monthly_payment: Dollar = self.calculate_monthly_payment(
-            loan_amount, loan_interest_rate, term_length_months
+    def __init__(
+        self,
+        annual_interest_percent: float,
+        down_payment_percent: float,
+        purchase_price: float,
+        term_years: int,
+        extra_insurance_monthly_payment: float = 0.0,
+        sp500_ror: float = 0.10,
+        inflation_rate: float = 0.03,
+    ):
+        super().__init__(
+            annual_interest_percent=annual_interest_percent,
+            down_payment_percent=down_payment_percent,
+            purchase_price=purchase_price,
+            term_years=term_years,
+        )
+        self.extra_insurance_monthly_payment: Dollar = Dollar(
+            extra_insurance_monthly_payment
+        )
+        self.sp500_ror: float = sp500_ror
+        self.inflation_rate: float = inflation_rate
+
+    def simulate_margin(
+        self,
+        n_paths: int = 10_000,
+        annual_volatility: float = 0.15,
+        returns_file: str | Path | None = None,
+        seed: int | None = None,
+        workers: int = 1,
+    ) -> MarginDistribution:
+        """Simulates the invest-vs-pay-down margin over many market return paths.
+
+        Returns are lognormal around sp500_ror with the given volatility, or
+        bootstrapped from a file of historical monthly returns when one is given.
+        """
+        returns: LognormalReturns | BootstrapReturns = (
+            BootstrapReturns.from_file(returns_file)
+            if returns_file is not None
+            else LognormalReturns(self.sp500_ror, annual_volatility)
+        )
+        schedule = amortize_portfolio(
+            float(self.loan_amount.amount),
+            self.annual_interest_percent,
+            self.term_months,
+        )
+
+        return simulate_margins(
+            loan_amount=float(self.loan_amount.amount),
+            principal_payments=schedule.principal[0],
+            interest_payments=schedule.interest[0],
+            extra_insurance_monthly_payment=float(
+                self.extra_insurance_monthly_payment.amount
+            ),
+            inflation_rate=self.inflation_rate,
+            returns=returns,
+            n_paths=n_paths,
+            seed=seed,
+            workers=workers,
         )
-        print(f"Monthly payment: {monthly_payment}")
 
-        loan_balance_tracker: BalanceTracker = BalanceTracker(term_length_months)
-        loan_interest_tracker: BalanceTracker = BalanceTracker(term_length_months)
-        savings_balance_tracker: BalanceTracker = BalanceTracker(term_length_months)
-        savings_interest_tracker: BalanceTracker = BalanceTracker(term_length_months)
+    def auto_loan_details(self, monthly_detail: bool = False) -> AutoLoanAnalysis:
+        """Compares paying for the car with the loan against paying cash.
+
+        The money not spent up front is invested at sp500_ror / 12 per month and
+        each month's loan principal is withdrawn from it. Totals come from
+        geometric-series closed forms; monthly_detail=True also runs the month
+        loop and records balance trackers for plotting.
+        """
+        loan_amount: float = float(self.loan_amount.amount)
+        loan_rate: float = self.monthly_interest_rate
+        savings_rate: float = self.sp500_ror / 12
+        inflation_growth: float = 1 + self.inflation_rate / 12
+        term: int = self.term_months
+
+        # Principal payments of a level-payment loan grow geometrically by
+        # (1 + r) a month, starting at payment - r * principal.
+        monthly_payment: float = (
+            loan_amount / term
+            if loan_rate == 0.0
+            else loan_amount * loan_rate / -math.expm1(-term * math.log1p(loan_rate))
+        )
+        first_principal: float = monthly_payment - loan_rate * loan_amount
+        total_principal: float = first_principal * _geometric_sum(1 + loan_rate, term)
+        present_value: float = first_principal * _geometric_sum(
+            (1 + loan_rate) / inflation_growth, term
+        )
+
+        # Savings start at the loan amount, grow by (1 + q) and pay each month's
+        # principal, so the final balance is the growth minus a convolution of
+        # the two geometric sequences.
+        final_savings: float = loan_amount * (1 + savings_rate) ** term - (
+            first_principal
+            * (1 + savings_rate) ** (term - 1)
+            * _geometric_sum((1 + loan_rate) / (1 + savings_rate), term)
+        )
+        total_savings_interest: float = final_savings - loan_amount + total_principal
+        total_loan_interest: float = monthly_payment * term - total_principal
+        total_extra_insurance: Dollar = Dollar.from_cents(
+            self.extra_insurance_monthly_payment.cents * term
+        )
 
-        loan_balance: Dollar = loan_amount
+        analysis: AutoLoanAnalysis = AutoLoanAnalysis(
+            monthly_payment=self.monthly_payment,
+            total_loan_interest=Dollar(total_loan_interest),
+            total_savings_interest=Dollar(total_savings_interest),
+            total_extra_insurance=total_extra_insurance,
+            present_value=Dollar(present_value),
+            depreciation_savings=Dollar(loan_amount - present_value),
+        )
+        if monthly_detail:
+            with phase("schedule"):
+                self._record_monthly_detail(analysis)
+
+        return analysis
+
+    def _record_monthly_detail(self, analysis: AutoLoanAnalysis):
+        """Runs the month-by-month loop and stores its trackers on the analysis."""
+        loan_balance_tracker: BalanceTracker = BalanceTracker(self.term_months)
+        loan_interest_tracker: BalanceTracker = BalanceTracker(self.term_months)
+        savings_balance_tracker: BalanceTracker = BalanceTracker(self.term_months)
+        savings_interest_tracker: BalanceTracker = BalanceTracker(self.term_months)
+
+        loan_balance: Dollar = self.loan_amount
         total_loan_interest: Dollar = Dollar(0)
-        savings_balance: Dollar = loan_amount
+        savings_balance: Dollar = self.loan_amount
         total_savings_interest: Dollar = Dollar(0)
-        present_value: Dollar = Dollar(0)
-        total_extra_insurance: float = Dollar(0)
-
-        for month in range(term_length_months):
-            loan_interest: Dollar = loan_balance * monthly_interest_rate
-            loan_balance = loan_balance - (monthly_payment - loan_interest)
-            savings_interest: Dollar = savings_balance * self.sp500_ror / 12
-            principle_payment = monthly_payment - loan_interest
+        total_extra_insurance: Dollar = Dollar(0)
+
+        for month in range(self.term_months):
+            loan_interest: Dollar = loan_balance.multiply_by(self.monthly_interest_rate)
+            principle_payment: Dollar = self.monthly_payment - loan_interest
+            loan_balance = loan_balance - principle_payment
+            savings_interest: Dollar = savings_balance.multiply_by(self.sp500_ror / 12)
             savings_balance = savings_balance + savings_interest - principle_payment
 
             total_loan_interest += loan_interest
             total_savings_interest += savings_interest
-            total_extra_insurance += extra_insurance_monthly_payment
-
-            present_value += principle_payment / (1 + self.inflation_rate / 12) ** month
+            total_extra_insurance += self.extra_insurance_monthly_payment
 
             loan_balance_tracker.update_balance(month, loan_balance)
             loan_interest_tracker.update_balance(
@@ -50,35 +164,91 @@ class AutoLoan(Loan):
             savings_balance_tracker.update_balance(month, savings_balance)
             savings_interest_tracker.update_balance(month, total_savings_interest)
 
-        depreciation_savings = loan_amount - present_value
-
-        margin: Dollar = (
+        analysis.loan_balance = loan_balance_tracker
+        analysis.loan_interest = loan_interest_tracker
+        analysis.savings_balance = savings_balance_tracker
+        analysis.savings_interest = savings_interest_tracker
+
+
+class AutoLoanAnalysis:
+    """The totals of AutoLoan.auto_loan_details, plus optional monthly trackers."""
+
+    def __init__(
+        self,
+        monthly_payment: Dollar,
+        total_loan_interest: Dollar,
+        total_savings_interest: Dollar,
+        total_extra_insurance: Dollar,
+        present_value: Dollar,
+        depreciation_savings: Dollar,
+    ):
+        self.monthly_payment: Dollar = monthly_payment
+        self.total_loan_interest: Dollar = total_loan_interest
+        self.total_savings_interest: Dollar = total_savings_interest
+        self.total_extra_insurance: Dollar = total_extra_insurance
+        self.present_value: Dollar = present_value
+        self.depreciation_savings: Dollar = depreciation_savings
+        self.margin: Dollar = (
             total_savings_interest
             + depreciation_savings
             - total_loan_interest
             - total_extra_insurance
         )
 
-        print(f"Total loan interest: {total_loan_interest}")
-        print(f"Total savings interest: {total_savings_interest}")
-        print(f"Total extra insurance: {total_extra_insurance}")
-        print(f"Present value: {present_value}")
-        print(f"Depreciation of savings: {depreciation_savings}")
-        print(f"Margin: {margin}")
+        self.loan_balance: BalanceTracker | None = None
+        self.loan_interest: BalanceTracker | None = None
+        self.savings_balance: BalanceTracker | None = None
+        self.savings_interest: BalanceTracker | None = None
+
+    def chart(self) -> ChartSpec:
+        """Returns the monthly trackers as a chart; needs monthly_detail=True."""
+        if self.loan_balance is None:
+            raise ValueError("Run auto_loan_details(monthly_detail=True) to chart it.")
+
+        return ChartSpec(
+            title="Auto loan vs. investing the cash",
+            series=(
+                Series("Loan Balance", self.loan_balance.extract_values().to_float()),
+                Series("Loan Interest", self.loan_interest.extract_values().to_float()),
+                Series("Savings Balance", self.savings_balance.extract_values().to_float()),
+                Series("Savings Interest", self.savings_interest.extract_values().to_float()),
+            ),
+        )
+
+    def __str__(self) -> str:
+        return "\n".join(
+            [
+                f"Monthly payment: {self.monthly_payment}",
+                f"Total loan interest: {self.total_loan_interest}",
+                f"Total savings interest: {self.total_savings_interest}",
+                f"Total extra insurance: {self.total_extra_insurance}",
+                f"Present value: {self.present_value}",
+                f"Depreciation of savings: {self.depreciation_savings}",
+                f"Margin: {self.margin}",
+            ]
+        )
+
+
+def _geometric_sum(ratio: float, count: int) -> float:
+    """Returns 1 + ratio + ... + ratio ** (count - 1)."""
+    if ratio == 1.0:
+        return float(count)
 
-        plt.figure()
-        plt.plot(loan_balance_tracker.extract_values(), label="Loan Balance")
-        plt.plot(loan_interest_tracker.extract_values(), label="Loan Interest")
-        plt.plot(savings_balance_tracker.extract_values(), label="Savings Balance")
-        plt.plot(savings_interest_tracker.extract_values(), label="Savings Interest")
-        plt.legend()
-        plt.show()
+    return math.expm1(count * math.log(ratio)) / (ratio - 1)
 
 
-def main():
-    blanco_taco: AutoLoan = AutoLoan()
+def main(chart_path: str = "auto_loan_details.png"):
+    blanco_taco: AutoLoan = AutoLoan(
+        annual_interest_percent=6.99,
+        down_payment_percent=0.0,
+        purchase_price=21893.01,
+        term_years=4,
+        extra_insurance_monthly_payment=71.75,
+    )
 
-    blanco_taco.auto_loan_details()
+    analysis: AutoLoanAnalysis = blanco_taco.auto_loan_details(monthly_detail=True)
+    print(analysis)
+    print(f"Chart: {render_chart(analysis.chart(), chart_path)}")
 
 
 if __name__ == "__main__":
@@ -1,25 +1,65 @@
+import numpy as np
+
 from loan_utils.dollar import Dollar
+from loan_utils.dollar_array import DollarArray
 
 
 class BalanceTracker:
-    def __init__(self, term_length_months: int):
-        """Initializes the tracker with a list of Dollar objects."""
-        self.balances: list[Dollar] = [Dollar(0.0) for _ in range(term_length_months)]
+    """Month-by-month balances stored as int64 cents in one growable buffer."""
+
+    def __init__(self, term_length_months: int = 0):
+        """Initializes an empty tracker with room for term_length_months balances."""
+        self._cents: np.ndarray = np.empty(max(term_length_months, 1), dtype=np.int64)
+        self._length: int = 0
+
+    def __len__(self) -> int:
+        """Returns the number of months recorded so far."""
+        return self._length
+
+    def append(self, amount: Dollar):
+        """Records the balance for the next month, growing the buffer if needed."""
+        Dollar._check_is_dollar(amount, "append")
+
+        if self._length == len(self._cents):
+            # Double the capacity so appends are amortized O(1).
+            grown: np.ndarray = np.empty(2 * len(self._cents), dtype=np.int64)
+            grown[: self._length] = self._cents
+            self._cents = grown
+
+        self._cents[self._length] = amount.cents
+        self._length += 1
+
+    def extract_values(self) -> DollarArray:
+        """Returns the recorded balances as a view of the buffer, for graphing.
+
+        The view is not copied; it stays valid until an append grows the buffer.
+        np.asarray() on it gives float dollars and .cents the int64 cents.
+        """
+        return DollarArray.from_cents(self._cents[: self._length])
+
+    def cumulative(self) -> DollarArray:
+        """Returns the running total of the recorded amounts."""
+        return self.extract_values().cumsum()
 
-    def extract_values(self) -> list[float]:
-        """Returns a list of numerical dollar values for graphing."""
-        return [d.amount for d in self.balances]
+    def diff(self) -> DollarArray:
+        """Returns each month's change from the month before (from zero for the first)."""
+        return DollarArray.from_cents(
+            np.diff(self._cents[: self._length], prepend=0)
+        )
 
     def get_balance(self, month: int) -> Dollar:
         """Returns the balance for a specific month."""
-        if 0 <= month < len(self.balances):
-            return self.balances[month]
+        if 0 <= month < self._length:
+            return Dollar.from_cents(int(self._cents[month]))
         else:
             raise IndexError("Month index out of range.")
 
     def update_balance(self, month: int, amount: Dollar):
-        """Updates the balance for a specific month."""
-        if 0 <= month < len(self.balances):
-            self.balances[month] = amount
+        """Updates the balance for a recorded month, or records the next one."""
+        if month == self._length:
+            self.append(amount)
+        elif 0 <= month < self._length:
+            Dollar._check_is_dollar(amount, "update_balance")
+            self._cents[month] = amount.cents
         else:
             raise IndexError("Month index out of range.")
@@ -0,0 +1,216 @@
+"""Streaming batch analysis of many loans read from CSV or JSONL."""
+
+import csv
+import io
+import json
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import TextIO
+
+from loan_utils.cents import format_cents
+from loan_utils.loan import Loan
+from loan_utils.portfolio import PortfolioSchedule, amortize_portfolio_cents
+from loan_utils.profiling import PROFILER, phase
+
+SUMMARY_COLUMNS: list[str] = [
+    "id",
+    "loan_amount",
+    "monthly_payment",
+    "payoff_month",
+    "total_interest",
+    "total_paid",
+]
+SCHEDULE_COLUMNS: list[str] = [
+    "id",
+    "payment_number",
+    "payment",
+    "principal",
+    "interest",
+    "balance",
+]
+
+
+class InvalidRecord:
+    """Stands in for an input line that could not be parsed.
+
+    It travels through the batch like any record, so the problem is reported
+    with the record's number instead of aborting the run.
+    """
+
+    def __init__(self, reason: str):
+        self.reason: str = reason
+
+
+def read_loans(source: TextIO, input_format: str) -> Iterator[dict | InvalidRecord]:
+    """Yields one loan definition per CSV row or JSONL line, without reading ahead.
+
+    Fields use the CLI flag names: price, annual_interest_percentage,
+    down_payment_percentage and term_years, plus an optional id. Malformed
+    JSONL lines are yielded as InvalidRecord.
+    """
+    if input_format == "csv":
+        yield from csv.DictReader(source)
+    elif input_format == "jsonl":
+        for line in source:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as error:
+                    yield InvalidRecord(str(error))
+    else:
+        raise ValueError(f"Unsupported input format: {input_format!r}")
+
+
+def analyze_chunk(records: list[tuple[int, dict]], schedules: bool) -> tuple[str, list[str]]:
+    """Returns the CSV text for a chunk of loans and any per-record errors.
+
+    Runs in a worker process; the whole chunk goes through the cents kernel at once.
+    """
+    loans: list[Loan] = []
+    ids: list[str] = []
+    errors: list[str] = []
+
+    with phase("batch_parse"):
+        for line_number, record in records:
+            if isinstance(record, InvalidRecord):
+                errors.append(f"record {line_number}: invalid JSON ({record.reason})")
+                continue
+            try:
+                loans.append(
+                    Loan(
+                        annual_interest_percent=float(record["annual_interest_percentage"]),
+                        down_payment_percent=float(record["down_payment_percentage"]),
+                        purchase_price=float(record["price"]),
+                        term_years=int(record["term_years"]),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as error:
+                errors.append(f"record {line_number}: {error!r}")
+                continue
+            ids.append(str(record.get("id", line_number)))
+    PROFILER.count("batch_loans", len(loans))
+    PROFILER.count("batch_errors", len(errors))
+
+    output: io.StringIO = io.StringIO()
+    if not loans:
+        return output.getvalue(), errors
+
+    with phase("schedule"):
+        schedule = amortize_portfolio_cents(
+            [loan.loan_amount.cents for loan in loans],
+            [loan.annual_interest_percent for loan in loans],
+            [loan.term_months for loan in loans],
+            [loan.monthly_payment.cents for loan in loans],
+        )
+    with phase("formatting"):
+        _write_rows(output, ids, loans, schedule, schedules)
+
+    return output.getvalue(), errors
+
+
+def _write_rows(
+    output: TextIO,
+    ids: list[str],
+    loans: list[Loan],
+    schedule: PortfolioSchedule,
+    schedules: bool,
+):
+    writer = csv.writer(output, lineterminator="\n")
+
+    if schedules:
+        for index, loan_id in enumerate(ids):
+            for month in range(int(schedule.payoff_months[index])):
+                writer.writerow(
+                    [
+                        loan_id,
+                        month + 1,
+                        format_cents(schedule.payment[index, month]),
+                        format_cents(schedule.principal[index, month]),
+                        format_cents(schedule.interest[index, month]),
+                        format_cents(schedule.balance[index, month]),
+                    ]
+                )
+    else:
+        total_interest = schedule.interest.sum(axis=1)
+        total_paid = schedule.payment.sum(axis=1)
+        for index, (loan_id, loan) in enumerate(zip(ids, loans)):
+            writer.writerow(
+                [
+                    loan_id,
+                    format_cents(loan.loan_amount.cents),
+                    format_cents(loan.monthly_payment.cents),
+                    int(schedule.payoff_months[index]),
+                    format_cents(total_interest[index]),
+                    format_cents(total_paid[index]),
+                ]
+            )
+
+
+def _profiled_chunk(
+    records: list[tuple[int, dict]], schedules: bool
+) -> tuple[str, list[str], dict]:
+    """Runs analyze_chunk in a worker with profiling on and returns its timings."""
+    PROFILER.reset()
+    PROFILER.enable()
+    text, errors = analyze_chunk(records, schedules)
+    PROFILER.disable()
+
+    return text, errors, PROFILER.snapshot()
+
+
+def run_batch(
+    records: Iterable[dict],
+    output: TextIO,
+    schedules: bool = False,
+    workers: int = 1,
+    chunk_size: int = 1000,
+    errors: TextIO = sys.stderr,
+) -> int:
+    """Analyzes loans chunk by chunk and writes the results in input order.
+
+    At most two chunks per worker are in flight, so memory stays constant no
+    matter how many records there are. Returns the number of records read.
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be at least 1.")
+
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(SCHEDULE_COLUMNS if schedules else SUMMARY_COLUMNS)
+
+    numbered: Iterator[tuple[int, dict]] = enumerate(records, start=1)
+    chunks: Iterator[list[tuple[int, dict]]] = iter(
+        lambda: list(islice(numbered, chunk_size)), []
+    )
+    count: int = 0
+
+    def write(text: str, chunk_errors: list[str], worker_profile: dict | None = None):
+        with phase("output"):
+            output.write(text)
+            for message in chunk_errors:
+                print(message, file=errors)
+        if worker_profile is not None:
+            PROFILER.merge(worker_profile)
+
+    if workers == 1:
+        for chunk in chunks:
+            count += len(chunk)
+            write(*analyze_chunk(chunk, schedules))
+        return count
+
+    # Worker processes have their own profiler; bring their timings back.
+    task = _profiled_chunk if PROFILER.enabled else analyze_chunk
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            count += len(chunk)
+            pending.append(pool.submit(task, chunk, schedules))
+            if len(pending) >= 2 * workers:
+                write(*pending.popleft().result())
+        while pending:
+            write(*pending.popleft().result())
+
+    return count
+
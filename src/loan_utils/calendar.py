@@ -1,17 +1,231 @@
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+MONTH_NAMES: tuple[str, ...] = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+MONTH_DAYS: tuple[int, ...] = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 class Calendar:
     def __init__(self, year: int):
         self.year: int = year
-        self.months: dict[str, int] = {
-            "January": 31,
-            "February": 28 if year % 4 != 0 else 29,
-            "March": 31,
-            "April": 30,
-            "May": 31,
-            "June": 30,
-            "July": 31,
-            "August": 31,
-            "September": 30,
-            "October": 31,
-            "November": 30,
-            "December": 31,
-        }
+        self.months: MappingProxyType[str, int] = _month_table(year)
+
+
+@lru_cache(maxsize=256)
+def _month_table(year: int) -> MappingProxyType[str, int]:
+    """Returns a read-only month name to day count table, shared per year."""
+    return MappingProxyType(
+        {name: days_in_month(year, month) for month, name in enumerate(MONTH_NAMES, start=1)}
+    )
+
+
+def is_leap_year(year: int) -> bool:
+    """Returns True if the year is a Gregorian leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def days_in_month(year: int, month: int) -> int:
+    """Returns the number of days in a month (1-12) of the given year."""
+    if month == 2 and is_leap_year(year):
+        return 29
+    return MONTH_DAYS[month - 1]
+
+
+def add_months(start: date, months: int) -> date:
+    """Returns the date a number of months after start, clamped to the month end."""
+    month_index: int = start.month - 1 + months
+    year: int = start.year + month_index // 12
+    month: int = month_index % 12 + 1
+
+    return date(year, month, min(start.day, days_in_month(year, month)))
+
+
+# --------------------
+# Payment calendar
+# --------------------
+# Frequency name -> (months, days) between payments; exactly one is non-zero.
+FREQUENCIES: dict[str, tuple[int, int]] = {
+    "monthly": (1, 0),
+    "quarterly": (3, 0),
+    "semiannual": (6, 0),
+    "annual": (12, 0),
+    "biweekly": (0, 14),
+    "weekly": (0, 7),
+}
+# Business-day conventions, passed to numpy.busday_offset.
+ROLLS: dict[str, str | None] = {
+    "none": None,
+    "following": "following",
+    "modified_following": "modifiedfollowing",
+    "preceding": "preceding",
+    "modified_preceding": "modifiedpreceding",
+}
+DAY_COUNTS: tuple[str, ...] = ("ACT/365", "ACT/360", "30/360")
+
+
+class PaymentCalendar:
+    """Payment-date conventions: frequency, business-day rolling and end of month.
+
+    With end_of_month=True a schedule that starts on the last day of a month
+    stays on the last day of every month; otherwise days past the end of a
+    shorter month are clamped, like add_months. Rolling moves dates that fall on
+    weekends or holidays to a business day.
+    """
+
+    def __init__(
+        self,
+        frequency: str = "monthly",
+        roll: str = "none",
+        end_of_month: bool = False,
+        holidays=(),
+    ):
+        if frequency not in FREQUENCIES:
+            raise ValueError(f"Unsupported payment frequency: {frequency!r}")
+        if roll not in ROLLS:
+            raise ValueError(f"Unsupported business-day roll: {roll!r}")
+
+        self.frequency: str = frequency
+        self.roll: str = roll
+        self.end_of_month: bool = end_of_month
+        self.holidays: tuple[np.datetime64, ...] = tuple(
+            sorted(np.datetime64(day, "D") for day in holidays)
+        )
+
+    def dates(self, start: date, term: int) -> np.ndarray:
+        """Returns the datetime64[D] dates of `term` payments, the first on start.
+
+        Results are cached per start, term and conventions and are read-only.
+        """
+        return _payment_dates(
+            np.datetime64(start, "D"),
+            term,
+            self.frequency,
+            self.roll,
+            self.end_of_month,
+            self.holidays,
+        )
+
+    def accrual_periods(self, start: date, term: int, accrual_start: date | None = None):
+        """Returns the start and end dates of each payment's accrual period.
+
+        The first period starts one payment interval before the first payment
+        unless accrual_start (e.g. the funding date) is given.
+        """
+        dates: np.ndarray = self.dates(start, term)
+        if accrual_start is None:
+            months, days = FREQUENCIES[self.frequency]
+            if months:
+                accrual_start = add_months(start, -months)
+            else:
+                accrual_start = date.fromordinal(start.toordinal() - days)
+
+        starts: np.ndarray = np.empty_like(dates)
+        starts[:1] = np.datetime64(accrual_start, "D")
+        starts[1:] = dates[:-1]
+
+        return starts, dates
+
+
+@lru_cache(maxsize=1024)
+def _payment_dates(
+    start: np.datetime64,
+    term: int,
+    frequency: str,
+    roll: str,
+    end_of_month: bool,
+    holidays: tuple[np.datetime64, ...],
+) -> np.ndarray:
+    if term < 0:
+        raise ValueError("The number of payments must not be negative.")
+
+    months, days = FREQUENCIES[frequency]
+    steps: np.ndarray = np.arange(term, dtype=np.int64)
+
+    if months:
+        first_month: np.datetime64 = start.astype("datetime64[M]")
+        month_starts: np.ndarray = first_month + steps * months
+        month_lengths: np.ndarray = (
+            (month_starts + 1).astype("datetime64[D]") - month_starts.astype("datetime64[D]")
+        ).astype(np.int64)
+        day: int = int((start - first_month.astype("datetime64[D]")).astype(np.int64)) + 1
+        start_is_month_end: bool = day == int(month_lengths[0]) if term else False
+        if end_of_month and start_is_month_end:
+            days_of_month: np.ndarray = month_lengths
+        else:
+            days_of_month = np.minimum(day, month_lengths)
+        dates: np.ndarray = month_starts.astype("datetime64[D]") + (days_of_month - 1)
+    else:
+        dates = start + steps * days
+
+    if ROLLS[roll] is not None and term:
+        dates = np.busday_offset(
+            dates, 0, roll=ROLLS[roll], holidays=np.array(holidays, dtype="datetime64[D]")
+        )
+
+    dates.flags.writeable = False
+    return dates
+
+
+def payment_dates(start: date, term: int, **conventions) -> np.ndarray:
+    """Returns payment dates as datetime64[D]; see PaymentCalendar for conventions."""
+    return PaymentCalendar(**conventions).dates(start, term)
+
+
+# --------------------
+# Day counts
+# --------------------
+def _date_parts(dates: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the year, month (1-12) and day arrays of datetime64[D] dates."""
+    months: np.ndarray = dates.astype("datetime64[M]")
+    year: np.ndarray = months.astype("datetime64[Y]").astype(np.int64) + 1970
+    month: np.ndarray = months.astype(np.int64) % 12 + 1
+    day: np.ndarray = (dates - months.astype("datetime64[D]")).astype(np.int64) + 1
+
+    return year, month, day
+
+
+def accrual_days(start_dates, end_dates, convention: str = "ACT/365") -> np.ndarray:
+    """Returns the int64 day count between each pair of dates under a convention.
+
+    30/360 is the US (bond basis) rule: a start on the 31st counts as the 30th,
+    and so does an end on the 31st when the start is the 30th or 31st.
+    """
+    if convention not in DAY_COUNTS:
+        raise ValueError(f"Unsupported day count convention: {convention!r}")
+
+    start_dates = np.asarray(start_dates, dtype="datetime64[D]")
+    end_dates = np.asarray(end_dates, dtype="datetime64[D]")
+    if convention != "30/360":
+        return (end_dates - start_dates).astype(np.int64)
+
+    year1, month1, day1 = _date_parts(start_dates)
+    year2, month2, day2 = _date_parts(end_dates)
+    day1 = np.minimum(day1, 30)
+    day2 = np.where((day2 == 31) & (day1 == 30), 30, day2)
+
+    return 360 * (year2 - year1) + 30 * (month2 - month1) + (day2 - day1)
+
+
+def year_fractions(start_dates, end_dates, convention: str = "ACT/365") -> np.ndarray:
+    """Returns each period's length in years under a day count convention."""
+    days: np.ndarray = accrual_days(start_dates, end_dates, convention)
+
+    return days / (365.0 if convention == "ACT/365" else 360.0)
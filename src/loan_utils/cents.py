@@ -0,0 +1,167 @@
+"""Exact integer-cents arithmetic with Dollar's ROUND_HALF_UP rounding."""
+
+import numpy as np
+
+from loan_utils.dollar import _divide_half_up, decimal_parts
+
+# Multipliers are split into two base-10**9 digits so every partial product
+# of a cents amount stays inside int64.
+_SPLIT_DIGITS: int = 9
+_SPLIT: int = 10**_SPLIT_DIGITS
+_MAX_DECIMALS: int = _SPLIT_DIGITS + 18
+_INT64_MAX: int = np.iinfo(np.int64).max
+
+
+def multiplier_arrays(values) -> tuple[np.ndarray, np.ndarray]:
+    """Returns int64 coefficient and decimal-count arrays for many multipliers.
+
+    Values are converted through str() like Dollar.multiply_by, so the float
+    0.1 means exactly Decimal("0.1").
+    """
+    values = np.asarray(values)
+    coefficients: np.ndarray = np.empty(values.shape, dtype=np.int64)
+    decimals: np.ndarray = np.empty(values.shape, dtype=np.int64)
+
+    # Loans share a handful of distinct rates, so parse each one only once.
+    unique, inverse = np.unique(values, return_inverse=True)
+    parts: list[tuple[int, int]] = [decimal_parts(value) for value in unique.tolist()]
+    coefficients.flat[:] = np.array([c for c, _ in parts], dtype=np.int64)[inverse.ravel()]
+    decimals.flat[:] = np.array([d for _, d in parts], dtype=np.int64)[inverse.ravel()]
+
+    return coefficients, decimals
+
+
+def multiply_round_half_up(
+    cents: np.ndarray, coefficients: np.ndarray, decimals: np.ndarray
+) -> np.ndarray:
+    """Returns cents * c * 10 ** -d rounded half away from zero, elementwise.
+
+    This is exactly Dollar._from_decimal(amount * multiplier) in integer cents.
+    """
+    cents = np.asarray(cents, dtype=np.int64)
+    coefficients, decimals = np.broadcast_arrays(
+        np.asarray(coefficients, dtype=np.int64), np.asarray(decimals, dtype=np.int64)
+    )
+    if np.any(decimals > _MAX_DECIMALS):
+        raise ValueError("Multiplier has too many decimal places for int64 cents.")
+
+    negative: np.ndarray = (cents < 0) != (coefficients < 0)
+    amount: np.ndarray = np.abs(cents)
+    coefficient: np.ndarray = np.abs(coefficients)
+
+    # Whole-number multipliers need no rounding; pad short fractions to the
+    # split width so the remaining scale is a power of ten of at least one.
+    whole: np.ndarray = decimals <= 0
+    pad: np.ndarray = np.clip(_SPLIT_DIGITS - decimals, 0, _SPLIT_DIGITS)
+    coefficient = np.where(whole, coefficient, coefficient * 10**pad)
+    scale_digits: np.ndarray = np.where(whole, 0, decimals + pad - _SPLIT_DIGITS)
+
+    high: np.ndarray = amount * (coefficient // _SPLIT)
+    low: np.ndarray = amount * (coefficient % _SPLIT)
+    upper: np.ndarray = high + low // _SPLIT
+    remainder: np.ndarray = low % _SPLIT
+
+    scale: np.ndarray = 10**scale_digits
+    quotient: np.ndarray = upper // scale
+    leftover: np.ndarray = upper % scale
+    round_up: np.ndarray = np.where(
+        scale == 1, 2 * remainder >= _SPLIT, 2 * leftover >= scale
+    )
+    result: np.ndarray = np.where(
+        whole, amount * coefficient * 10 ** np.maximum(-decimals, 0), quotient + round_up
+    )
+
+    return np.where(negative, -result, result)
+
+
+def multiply_cents(cents: np.ndarray, coefficient: int, decimals: int) -> np.ndarray:
+    """Returns cents * coefficient * 10 ** -decimals rounded half up for any size.
+
+    The split multiply keeps partial products in int64 for amounts up to about
+    $92 million; larger amounts, whole multipliers and multipliers with more
+    decimals than it supports go through scale_round_half_up instead.
+    """
+    cents = np.asarray(cents, dtype=np.int64)
+    if decimals <= 0:
+        return scale_round_half_up(cents, coefficient * 10**-decimals, 1)
+
+    if np.all(split_multiply_fits(cents, decimals)):
+        return multiply_round_half_up(cents, coefficient, decimals)
+
+    return scale_round_half_up(cents, coefficient, 10**decimals)
+
+
+def split_multiply_fits(cents: np.ndarray, decimals: np.ndarray) -> np.ndarray:
+    """Returns where multiply_round_half_up is exact for these amounts and decimals.
+
+    Its partial products overflow int64, silently, once an amount passes about
+    $92 million.
+    """
+    return (np.abs(cents) <= _INT64_MAX // _SPLIT) & (np.asarray(decimals) <= _MAX_DECIMALS)
+
+
+def divide_round_half_up(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Returns numerator / denominator rounded half away from zero, elementwise."""
+    numerator = np.asarray(numerator, dtype=np.int64)
+    denominator = np.asarray(denominator, dtype=np.int64)
+    if np.any(denominator == 0):
+        raise ZeroDivisionError("Division by zero.")
+
+    negative: np.ndarray = (numerator < 0) != (denominator < 0)
+    quotient, remainder = np.divmod(np.abs(numerator), np.abs(denominator))
+    result: np.ndarray = quotient + (2 * remainder >= np.abs(denominator))
+
+    return np.where(negative, -result, result)
+
+
+def scale_round_half_up(cents, multiplier, divisor) -> np.ndarray:
+    """Returns cents * multiplier / divisor rounded half away from zero, exactly.
+
+    Elements whose product fits in int64 are computed with NumPy; the rest, and
+    factors too large for int64, fall back to Python integers like Dollar.
+    """
+    cents = np.asarray(cents, dtype=np.int64)
+    shape: tuple[int, ...] = np.broadcast_shapes(
+        cents.shape, np.shape(multiplier), np.shape(divisor)
+    )
+    all_cents: np.ndarray = np.broadcast_to(cents, shape)
+    result: np.ndarray = np.empty(shape, dtype=np.int64)
+
+    if _fits_int64(multiplier) and _fits_int64(divisor):
+        multipliers: np.ndarray = np.broadcast_to(np.asarray(multiplier, dtype=np.int64), shape)
+        divisors: np.ndarray = np.broadcast_to(np.asarray(divisor, dtype=np.int64), shape)
+        fits: np.ndarray = np.abs(all_cents) <= _INT64_MAX // np.maximum(np.abs(multipliers), 1)
+        if np.all(fits):
+            return divide_round_half_up(all_cents * multipliers, divisors)
+        result[fits] = divide_round_half_up(all_cents[fits] * multipliers[fits], divisors[fits])
+    else:
+        fits = np.zeros(shape, dtype=bool)
+
+    overflow: np.ndarray = ~fits
+    exact: list[int] = [
+        _divide_half_up(amount * factor, denominator)
+        for amount, factor, denominator in zip(
+            all_cents[overflow].tolist(),
+            np.broadcast_to(np.asarray(multiplier, dtype=object), shape)[overflow].tolist(),
+            np.broadcast_to(np.asarray(divisor, dtype=object), shape)[overflow].tolist(),
+        )
+    ]
+    if any(abs(value) > _INT64_MAX for value in exact):
+        raise OverflowError("Result does not fit in int64 cents.")
+    result[overflow] = exact
+
+    return result
+
+
+def _fits_int64(value) -> bool:
+    if isinstance(value, np.ndarray):
+        return value.dtype != object
+    return abs(int(value)) <= _INT64_MAX
+
+
+def format_cents(cents: int) -> str:
+    """Formats integer cents as a plain decimal amount, e.g. 123456 -> 1234.56."""
+    cents = int(cents)
+    dollars, remainder = divmod(abs(cents), 100)
+
+    return f"{'-' if cents < 0 else ''}{dollars}.{remainder:02d}"
@@ -0,0 +1,144 @@
+"""Headless chart rendering with explicit Agg figures and no pyplot state.
+
+Charts are described by plain ChartSpec tuples, which are cheap to build and to
+pickle, and rendered to PNG or SVG files, one at a time or in batches across a
+process pool.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from loan_utils.profiling import phase
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Far more points than a chart's pixel width only costs drawing time.
+MAX_POINTS: int = 1000
+FIGURE_SIZE: tuple[float, float] = (8.0, 4.5)
+
+
+class Series(NamedTuple):
+    """One labelled line; point k is plotted at month k + 1."""
+
+    label: str
+    values: np.ndarray
+
+
+class ChartSpec(NamedTuple):
+    """Everything needed to draw one chart."""
+
+    title: str
+    series: tuple[Series, ...]
+    xlabel: str = "Month"
+    ylabel: str = "Dollars"
+
+
+def downsample(values, max_points: int = MAX_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """Returns 1-based x positions and values with at most about max_points points.
+
+    Long series are cut into buckets and each bucket keeps its minimum and
+    maximum, so peaks and the overall shape survive. The last point is kept.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n: int = len(values)
+    if n <= max_points:
+        return np.arange(1, n + 1), values
+
+    buckets: int = max(max_points // 2, 1)
+    edges: np.ndarray = np.linspace(0, n, buckets + 1).astype(np.int64)
+    starts: np.ndarray = edges[:-1]
+    minima: np.ndarray = starts + np.array(
+        [values[a:b].argmin() for a, b in zip(edges[:-1], edges[1:])]
+    )
+    maxima: np.ndarray = starts + np.array(
+        [values[a:b].argmax() for a, b in zip(edges[:-1], edges[1:])]
+    )
+    kept: np.ndarray = np.unique(np.concatenate([minima, maxima, [0, n - 1]]))
+
+    return kept + 1, values[kept]
+
+
+def build_figure(spec: ChartSpec, max_points: int = MAX_POINTS) -> Figure:
+    """Draws a chart on a new Figure attached to its own Agg canvas."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure: Figure = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(figure)
+    axes = figure.subplots()
+    for series in spec.series:
+        x, y = downsample(series.values, max_points)
+        axes.plot(x, y, label=series.label)
+    axes.set_title(spec.title)
+    axes.set_xlabel(spec.xlabel)
+    axes.set_ylabel(spec.ylabel)
+    if spec.series:
+        axes.legend()
+
+    return figure
+
+
+def render_chart(
+    spec: ChartSpec, path: str | Path, max_points: int = MAX_POINTS, dpi: int = 100
+) -> Path:
+    """Renders a chart to a file; the format comes from the suffix (.png or .svg)."""
+    path = Path(path)
+    if path.suffix.lower() not in (".png", ".svg"):
+        raise ValueError(f"Unsupported chart format: {path.suffix!r}")
+
+    with phase("plotting"):
+        build_figure(spec, max_points).savefig(path, dpi=dpi)
+
+    return path
+
+
+def _render_chunk(jobs: list[tuple[ChartSpec, Path]], max_points: int, dpi: int) -> list[Path]:
+    return [render_chart(spec, path, max_points, dpi) for spec, path in jobs]
+
+
+def render_charts(
+    jobs: Iterable[tuple[ChartSpec, str | Path]],
+    workers: int = 1,
+    chunk_size: int = 16,
+    max_points: int = MAX_POINTS,
+    dpi: int = 100,
+) -> list[Path]:
+    """Renders many (spec, path) jobs, in order, across a process pool.
+
+    Like run_batch, at most two chunks per worker are in flight, so jobs can be
+    generated lazily for thousands of charts.
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be at least 1.")
+
+    job_iterator: Iterator[tuple[ChartSpec, str | Path]] = iter(jobs)
+    chunks: Iterator[list[tuple[ChartSpec, Path]]] = iter(
+        lambda: [(spec, Path(path)) for spec, path in islice(job_iterator, chunk_size)], []
+    )
+    rendered: list[Path] = []
+
+    if workers == 1:
+        for chunk in chunks:
+            rendered.extend(_render_chunk(chunk, max_points, dpi))
+        return rendered
+
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(_render_chunk, chunk, max_points, dpi))
+            if len(pending) >= 2 * workers:
+                rendered.extend(pending.popleft().result())
+        while pending:
+            rendered.extend(pending.popleft().result())
+
+    return rendered
+
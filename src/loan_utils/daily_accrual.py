@@ -0,0 +1,218 @@
+"""Simple-interest loans that accrue daily between actual payment dates.
+
+Interest for a payment is balance x annual rate x days / year basis, with the
+days counted between consecutive payment dates under ACT/365, ACT/360 or 30/360
+and rounded half up to the cent. Each payment goes to interest first; any
+shortfall is carried as unpaid interest (never capitalized) and the rest
+reduces principal. Paying late therefore costs interest and paying early saves
+it.
+
+The engine steps once per payment, across every loan at once, so its cost is
+independent of the number of days.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from loan_utils.calendar import accrual_days
+from loan_utils.cents import divide_round_half_up, multiplier_arrays
+
+# Denominator of the year fraction for each day count convention.
+YEAR_BASIS: dict[str, int] = {"ACT/365": 365, "ACT/360": 360, "30/360": 360}
+
+_INT64_MAX: int = np.iinfo(np.int64).max
+_INT64_SAFE: float = 2.0**62
+
+
+class DailyAccrualSchedule:
+    """Loans x payments matrices of a daily-accrual schedule, in int64 cents.
+
+    Column k is the loan's k-th payment. Columns after payoff, and payments with
+    no date, are zero in every matrix except `balance` and `unpaid_interest`,
+    which carry the last values forward.
+    """
+
+    def __init__(
+        self,
+        payment_dates: np.ndarray,
+        days: np.ndarray,
+        payment: np.ndarray,
+        interest: np.ndarray,
+        principal: np.ndarray,
+        unpaid_interest: np.ndarray,
+        balance: np.ndarray,
+        payoff_payments: np.ndarray,
+    ):
+        self.payment_dates: np.ndarray = payment_dates
+        self.days: np.ndarray = days
+        self.payment: np.ndarray = payment
+        self.interest: np.ndarray = interest
+        self.principal: np.ndarray = principal
+        self.unpaid_interest: np.ndarray = unpaid_interest
+        self.balance: np.ndarray = balance
+        self.payoff_payments: np.ndarray = payoff_payments
+
+    @property
+    def n_loans(self) -> int:
+        return self.balance.shape[0]
+
+    @property
+    def n_payments(self) -> int:
+        return self.balance.shape[1]
+
+    def total_interest(self) -> np.ndarray:
+        """Returns the interest accrued over each loan's schedule, in cents."""
+        return self.interest.sum(axis=1)
+
+
+def accrue_schedule(
+    principal_cents,
+    annual_interest_percent,
+    funding_dates,
+    payment_dates,
+    payment_cents,
+    convention: str = "ACT/365",
+    pay_off_final: bool = True,
+) -> DailyAccrualSchedule:
+    """Applies payments on actual dates to many daily-accrual loans at once.
+
+    payment_dates is a loans x payments datetime64 matrix; NaT marks a missing
+    payment and every later column must be NaT too. payment_cents is the amount
+    of each payment (a matrix, or one level payment per loan). Payments never
+    exceed what is owed; with pay_off_final the last dated payment of each loan
+    settles the whole balance and interest.
+    """
+    if convention not in YEAR_BASIS:
+        raise ValueError(f"Unsupported day count convention: {convention!r}")
+
+    principal: np.ndarray = np.atleast_1d(np.asarray(principal_cents, dtype=np.int64))
+    n_loans: int = len(principal)
+    percents: np.ndarray = np.broadcast_to(
+        np.asarray(annual_interest_percent, dtype=np.float64), (n_loans,)
+    )
+    dates: np.ndarray = np.asarray(payment_dates, dtype="datetime64[D]").reshape(n_loans, -1)
+    n_payments: int = dates.shape[1]
+    amounts: np.ndarray = np.asarray(payment_cents, dtype=np.int64)
+    amounts = np.broadcast_to(amounts[:, None] if amounts.ndim == 1 else amounts, dates.shape)
+    funding: np.ndarray = np.broadcast_to(
+        np.asarray(funding_dates, dtype="datetime64[D]"), (n_loans,)
+    )
+
+    dated: np.ndarray = ~np.isnat(dates)
+    if np.any(dated[:, 1:] & ~dated[:, :-1]):
+        raise ValueError("Missing payments (NaT) may only come after the last payment.")
+    if np.any(principal < 0) or np.any(amounts < 0):
+        raise ValueError("Principal and payments must not be negative.")
+
+    # Day counts for every period at once; undated periods count zero days.
+    starts: np.ndarray = np.concatenate([funding[:, None], dates[:, :-1]], axis=1)
+    days: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    days[dated] = accrual_days(starts[dated], dates[dated], convention)
+    if np.any(days < 0):
+        raise ValueError("Payment dates must not go backwards.")
+
+    # interest = balance * coefficient * days / (10 ** decimals * 100 * basis)
+    coefficients, decimals = multiplier_arrays(percents)
+    coefficients = coefficients * 10 ** np.maximum(-decimals, 0)
+    exact_denominators: np.ndarray = np.array(
+        [10 ** max(d, 0) * 100 * YEAR_BASIS[convention] for d in decimals.tolist()],
+        dtype=object,
+    )
+    # Zero marks denominators too wide for int64; those loans always go exact.
+    denominators: np.ndarray = np.array(
+        [d if d <= _INT64_MAX else 0 for d in exact_denominators.tolist()], dtype=np.int64
+    )
+    last_dated: np.ndarray = dated.sum(axis=1) - 1
+
+    payment: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    interest: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    principal_paid: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    unpaid: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    balances: np.ndarray = np.zeros(dates.shape, dtype=np.int64)
+    payoff_payments: np.ndarray = np.zeros(n_loans, dtype=np.int64)
+
+    balance: np.ndarray = principal.copy()
+    owed_interest: np.ndarray = np.zeros(n_loans, dtype=np.int64)
+    open_loans: np.ndarray = np.arange(n_loans)[principal > 0]
+
+    for k in range(n_payments):
+        open_loans = open_loans[dated[open_loans, k]]
+        if len(open_loans) == 0:
+            balances[:, k:] = balance[:, None]
+            unpaid[:, k:] = owed_interest[:, None]
+            break
+
+        accrued: np.ndarray = _accrued_interest(
+            balance[open_loans],
+            coefficients[open_loans],
+            days[open_loans, k],
+            denominators[open_loans],
+            exact_denominators[open_loans],
+        )
+        due: np.ndarray = owed_interest[open_loans] + accrued
+        owed: np.ndarray = balance[open_loans] + due
+        amount: np.ndarray = np.minimum(amounts[open_loans, k], owed)
+        if pay_off_final:
+            amount = np.where(last_dated[open_loans] == k, owed, amount)
+
+        to_interest: np.ndarray = np.minimum(amount, due)
+        to_principal: np.ndarray = amount - to_interest
+
+        payment[open_loans, k] = amount
+        interest[open_loans, k] = accrued
+        principal_paid[open_loans, k] = to_principal
+        balance[open_loans] -= to_principal
+        owed_interest[open_loans] = due - to_interest
+        balances[:, k] = balance
+        unpaid[:, k] = owed_interest
+        payoff_payments[open_loans] = k + 1
+
+        open_loans = open_loans[(balance[open_loans] > 0) | (owed_interest[open_loans] > 0)]
+
+    return DailyAccrualSchedule(
+        payment_dates=dates,
+        days=days,
+        payment=payment,
+        interest=interest,
+        principal=principal_paid,
+        unpaid_interest=unpaid,
+        balance=balances,
+        payoff_payments=payoff_payments,
+    )
+
+
+def _accrued_interest(
+    balance: np.ndarray,
+    coefficients: np.ndarray,
+    days: np.ndarray,
+    denominators: np.ndarray,
+    exact_denominators: np.ndarray,
+) -> np.ndarray:
+    """Returns balance * coefficient * days / denominator rounded half up, exactly.
+
+    Rates with many significant digits can overflow int64. Only those loans are
+    computed with Python integers, using `exact_denominators`; every other loan
+    stays on the int64 path. A zero in `denominators` marks one too wide for it.
+    """
+    # The float estimate only has to be accurate enough to stay clear of 2**63.
+    estimate: np.ndarray = balance.astype(np.float64) * coefficients * days
+    fits: np.ndarray = (estimate < _INT64_SAFE) & (denominators > 0)
+    if np.all(fits):
+        return divide_round_half_up(balance * coefficients * days, denominators)
+
+    interest: np.ndarray = np.empty(len(balance), dtype=np.int64)
+    interest[fits] = divide_round_half_up(
+        balance[fits] * coefficients[fits] * days[fits], denominators[fits]
+    )
+
+    wide: np.ndarray = ~fits
+    numerator: np.ndarray = (
+        balance[wide].astype(object) * coefficients[wide].astype(object) * days[wide]
+    )
+    divisor: np.ndarray = exact_denominators[wide]
+    quotient: np.ndarray = numerator // divisor
+    remainder: np.ndarray = numerator % divisor
+    interest[wide] = (quotient + (2 * remainder >= divisor)).astype(np.int64)
+
+    return interest
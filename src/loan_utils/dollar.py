@@ -1,20 +1,49 @@
 from __future__ import annotations
 
 from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import lru_cache
 
 
 class Dollar:
-    """A class to represent dollar amounts with precise arithmetic and formatting."""
+    """A class to represent dollar amounts with precise arithmetic and formatting.
+
+    Amounts are stored as an integer number of cents; every operation that can
+    produce fractions of a cent rounds half away from zero (ROUND_HALF_UP).
+    """
+
+    __slots__ = ("_cents",)
 
     def __init__(self, amount: int | float | str | Dollar):
         if isinstance(amount, Dollar):
             # Copy constructor
-            self.amount = amount.amount
+            self._cents: int = amount._cents
+        elif type(amount) is int:
+            self._cents = amount * 100
         else:
-            self.amount = self._to_decimal(amount)
+            self._cents = int(self._to_decimal(amount).scaleb(2))
+
+    @property
+    def amount(self) -> Decimal:
+        """The amount as a Decimal quantized to cents."""
+        return Decimal(f"{self._cents}e-2")
+
+    @property
+    def cents(self) -> int:
+        """The amount as an integer number of cents."""
+        return self._cents
+
+    @classmethod
+    def from_cents(cls, cents: int) -> Dollar:
+        """Creates a Dollar from an integer number of cents."""
+        obj = cls.__new__(cls)
+        obj._cents = int(cents)
+
+        return obj
 
     def __str__(self) -> str:
-        return f"${self.amount:,.2f}" if self.amount >= 0 else f"-${-self.amount:,.2f}"
+        dollars, cents = divmod(abs(self._cents), 100)
+
+        return f"{'-' if self._cents < 0 else ''}${dollars:,}.{cents:02d}"
 
     def __repr__(self) -> str:
         return f"Dollar({str(self.amount)})"
@@ -23,83 +52,94 @@ class Dollar:
     # Arithmetic Operators
     # --------------------
     def __add__(self, other):
-        self._check_is_dollar(other, "+")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "+")
 
-        return Dollar._from_decimal(self.amount + other.amount)
+        return _new_dollar(self._cents + other._cents)
 
     def __iadd__(self, other):
-        self._check_is_dollar(other, "+=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "+=")
 
-        return Dollar._from_decimal(self.amount + other.amount)
+        return _new_dollar(self._cents + other._cents)
 
     def __sub__(self, other):
-        self._check_is_dollar(other, "-")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "-")
 
-        return Dollar._from_decimal(self.amount - other.amount)
+        return _new_dollar(self._cents - other._cents)
 
     def __isub__(self, other):
-        self._check_is_dollar(other, "-=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "-=")
 
-        return Dollar._from_decimal(self.amount - other.amount)
+        return _new_dollar(self._cents - other._cents)
 
     def __mul__(self, other):
-        self._check_is_dollar(other, "*")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "*")
 
-        return Dollar._from_decimal(self.amount * other.amount)
+        return _new_dollar(_divide_half_up(self._cents * other._cents, 100))
 
     def __imul__(self, other):
-        self._check_is_dollar(other, "*=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "*=")
 
-        return Dollar._from_decimal(self.amount * other.amount)
+        return _new_dollar(_divide_half_up(self._cents * other._cents, 100))
 
     def __truediv__(self, other):
-        self._check_is_dollar(other, "/")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "/")
 
-        return Dollar._from_decimal(self.amount / other.amount)
+        return _new_dollar(_divide_half_up(self._cents * 100, other._cents))
 
     def __itruediv__(self, other):
-        self._check_is_dollar(other, "/=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "/=")
 
-        return Dollar._from_decimal(self.amount / other.amount)
+        return _new_dollar(_divide_half_up(self._cents * 100, other._cents))
 
     # --------------------
     # Comparison Operators
     # --------------------
     def __eq__(self, other):
-        self._check_is_dollar(other, "==")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "==")
 
-        return self.amount == other.amount
+        return self._cents == other._cents
 
     def __lt__(self, other):
-        self._check_is_dollar(other, "<")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "<")
 
-        return self.amount < other.amount
+        return self._cents < other._cents
 
     def __le__(self, other):
-        self._check_is_dollar(other, "<=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, "<=")
 
-        return self.amount <= other.amount
+        return self._cents <= other._cents
 
     def __gt__(self, other):
-        self._check_is_dollar(other, ">")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, ">")
 
-        return self.amount > other.amount
+        return self._cents > other._cents
 
     def __ge__(self, other):
-        self._check_is_dollar(other, ">=")
+        if other.__class__ is not Dollar:
+            self._check_is_dollar(other, ">=")
 
-        return self.amount >= other.amount
+        return self._cents >= other._cents
 
     # --------------------
     # Unary Operators
     # --------------------
     def __abs__(self):
-        self.amount = abs(self.amount)
-        return self
+        return _new_dollar(abs(self._cents))
 
     def __neg__(self):
-        self.amount = -self.amount
-        return self
+        return _new_dollar(-self._cents)
 
     # --------------------
     # Internal helpers
@@ -107,10 +147,9 @@ class Dollar:
     @classmethod
     def _from_decimal(cls, amount: Decimal) -> Dollar:
         """Internal constructor for trusted Decimal values"""
-        obj = cls.__new__(cls)
-        obj.amount = amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-        return obj
+        return cls.from_cents(
+            int(amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP).scaleb(2))
+        )
 
     @staticmethod
     def _check_is_dollar(other, operation: str):
@@ -138,8 +177,56 @@ class Dollar:
     # --------------------
     def divide_by(self, divisor: int | float | Decimal) -> Dollar:
         """Divide this dollar amount by a divisor."""
-        return Dollar._from_decimal(self.amount / Decimal(str(divisor)))
+        coefficient, decimals = decimal_parts(divisor)
+        if decimals >= 0:
+            return _new_dollar(
+                _divide_half_up(self._cents * 10**decimals, coefficient)
+            )
+
+        return _new_dollar(_divide_half_up(self._cents, coefficient * 10**-decimals))
 
     def multiply_by(self, multiplier: int | float | Decimal) -> Dollar:
         """Multiply this dollar amount by a multiplier."""
-        return Dollar._from_decimal(self.amount * Decimal(str(multiplier)))
+        coefficient, decimals = decimal_parts(multiplier)
+        if decimals <= 0:
+            return _new_dollar(self._cents * coefficient * 10**-decimals)
+
+        return _new_dollar(_divide_half_up(self._cents * coefficient, 10**decimals))
+
+
+def _new_dollar(cents: int) -> Dollar:
+    """Creates a Dollar from trusted integer cents without validation."""
+    obj = Dollar.__new__(Dollar)
+    obj._cents = cents
+
+    return obj
+
+
+def _divide_half_up(numerator: int, denominator: int) -> int:
+    """Returns numerator / denominator rounded half away from zero."""
+    if numerator >= 0 and denominator > 0:
+        quotient, remainder = divmod(numerator, denominator)
+
+        return quotient + 1 if 2 * remainder >= denominator else quotient
+
+    quotient, remainder = divmod(abs(numerator), abs(denominator))
+    if 2 * remainder >= abs(denominator):
+        quotient += 1
+
+    return -quotient if (numerator < 0) != (denominator < 0) else quotient
+
+
+@lru_cache(maxsize=1024, typed=True)
+def decimal_parts(value: int | float | str | Decimal) -> tuple[int, int]:
+    """Returns (coefficient, decimals) such that Decimal(str(value)) == c * 10 ** -d.
+
+    Loops multiply by the same rate every month, so parsed values are cached.
+    """
+    number: Decimal = Decimal(str(value))
+    if not number.is_finite():
+        raise ValueError(f"Cannot use a non-finite multiplier: {value!r}")
+
+    sign, digits, exponent = number.as_tuple()
+    coefficient: int = int("".join(map(str, digits)))
+
+    return (-coefficient if sign else coefficient), -exponent
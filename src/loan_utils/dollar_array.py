@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from loan_utils.cents import multiply_cents, scale_round_half_up
+from loan_utils.dollar import Dollar, decimal_parts
+
+
+class DollarArray:
+    """An array of dollar amounts stored as int64 cents in one NumPy buffer.
+
+    Arithmetic follows Dollar's rules: only Dollar or DollarArray operands are
+    accepted, and operations that produce fractions of a cent round half up.
+    """
+
+    __slots__ = ("_cents",)
+
+    # Stop NumPy from applying ufuncs to the float view, so `ndarray + DollarArray`
+    # raises instead of silently mixing plain numbers with dollars.
+    __array_ufunc__ = None
+
+    def __init__(self, amounts: Iterable[int | float | str | Dollar] | DollarArray):
+        if isinstance(amounts, DollarArray):
+            # Copy constructor
+            self._cents: np.ndarray = amounts._cents.copy()
+        else:
+            self._cents = np.array(
+                [Dollar(amount).cents for amount in amounts], dtype=np.int64
+            )
+
+    @classmethod
+    def from_cents(cls, cents) -> DollarArray:
+        """Wraps an array of integer cents, sharing memory when it is already int64."""
+        obj = cls.__new__(cls)
+        obj._cents = np.asarray(cents, dtype=np.int64)
+
+        return obj
+
+    @classmethod
+    def zeros(cls, shape: int | tuple[int, ...]) -> DollarArray:
+        """Creates an array of $0.00 amounts."""
+        return cls.from_cents(np.zeros(shape, dtype=np.int64))
+
+    @property
+    def cents(self) -> np.ndarray:
+        """The underlying int64 cents buffer, without copying."""
+        return self._cents
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._cents.shape
+
+    @property
+    def ndim(self) -> int:
+        return self._cents.ndim
+
+    def to_float(self) -> np.ndarray:
+        """Returns the amounts as float64 dollars, e.g. for plotting."""
+        return self._cents / 100
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        values: np.ndarray = self.to_float()
+
+        return values if dtype is None else values.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self._cents)
+
+    def __iter__(self):
+        for item in range(len(self._cents)):
+            yield self[item]
+
+    def __getitem__(self, key) -> Dollar | DollarArray:
+        selected = self._cents[key]
+        if isinstance(selected, np.ndarray):
+            return DollarArray.from_cents(selected)
+
+        return Dollar.from_cents(int(selected))
+
+    def __setitem__(self, key, value: Dollar | DollarArray):
+        self._cents[key] = self._cents_of(value, "[]=")
+
+    def __str__(self) -> str:
+        return str(self.format().tolist()).replace("'", "")
+
+    def __repr__(self) -> str:
+        amounts: list[str] = [
+            str(Dollar.from_cents(cents).amount) for cents in self._cents.ravel().tolist()
+        ]
+        nested: str = str(np.array(amounts, dtype=object).reshape(self.shape).tolist())
+        nested = nested.replace("'", "")
+
+        return f"DollarArray({nested})"
+
+    def format(self) -> np.ndarray:
+        """Returns the amounts formatted like str(Dollar), in an array of the same shape."""
+        formatted: list[str] = [
+            str(Dollar.from_cents(cents)) for cents in self._cents.ravel().tolist()
+        ]
+
+        return np.array(formatted, dtype=object).reshape(self.shape)
+
+    # --------------------
+    # Arithmetic Operators
+    # --------------------
+    def __add__(self, other):
+        return DollarArray.from_cents(self._cents + self._cents_of(other, "+"))
+
+    def __sub__(self, other):
+        return DollarArray.from_cents(self._cents - self._cents_of(other, "-"))
+
+    def __mul__(self, other):
+        return DollarArray.from_cents(
+            scale_round_half_up(self._cents, self._cents_of(other, "*"), 100)
+        )
+
+    def __truediv__(self, other):
+        return DollarArray.from_cents(
+            scale_round_half_up(self._cents, 100, self._cents_of(other, "/"))
+        )
+
+    # --------------------
+    # Comparison Operators
+    # --------------------
+    def __eq__(self, other) -> np.ndarray:
+        return self._cents == self._cents_of(other, "==")
+
+    def __ne__(self, other) -> np.ndarray:
+        return self._cents != self._cents_of(other, "!=")
+
+    def __lt__(self, other) -> np.ndarray:
+        return self._cents < self._cents_of(other, "<")
+
+    def __le__(self, other) -> np.ndarray:
+        return self._cents <= self._cents_of(other, "<=")
+
+    def __gt__(self, other) -> np.ndarray:
+        return self._cents > self._cents_of(other, ">")
+
+    def __ge__(self, other) -> np.ndarray:
+        return self._cents >= self._cents_of(other, ">=")
+
+    # --------------------
+    # Unary Operators
+    # --------------------
+    def __abs__(self):
+        return DollarArray.from_cents(np.abs(self._cents))
+
+    def __neg__(self):
+        return DollarArray.from_cents(-self._cents)
+
+    # --------------------
+    # Reductions
+    # --------------------
+    def sum(self, axis: int | None = None) -> Dollar | DollarArray:
+        """Returns the total, as a Dollar when reducing to a single amount."""
+        total = self._cents.sum(axis=axis)
+        if isinstance(total, np.ndarray):
+            return DollarArray.from_cents(total)
+
+        return Dollar.from_cents(int(total))
+
+    def cumsum(self, axis: int = -1) -> DollarArray:
+        """Returns the running totals along an axis."""
+        return DollarArray.from_cents(np.cumsum(self._cents, axis=axis))
+
+    def diff(self, axis: int = -1) -> DollarArray:
+        """Returns the change between consecutive amounts along an axis."""
+        return DollarArray.from_cents(np.diff(self._cents, axis=axis))
+
+    # --------------------
+    # Internal helpers
+    # --------------------
+    @staticmethod
+    def _cents_of(other, operation: str) -> np.ndarray | int:
+        if isinstance(other, DollarArray):
+            return other._cents
+        if isinstance(other, Dollar):
+            return other.cents
+
+        raise TypeError(
+            f"Unsupported operand type for {operation}: 'DollarArray' and '{type(other).__name__}'"
+        )
+
+    # --------------------
+    # Explicit methods for multiplication and division
+    # --------------------
+    def divide_by(self, divisor: int | float) -> DollarArray:
+        """Divide every amount by a divisor."""
+        coefficient, decimals = decimal_parts(divisor)
+        if decimals >= 0:
+            return DollarArray.from_cents(
+                scale_round_half_up(self._cents, 10**decimals, coefficient)
+            )
+
+        return DollarArray.from_cents(
+            scale_round_half_up(self._cents, 1, coefficient * 10**-decimals)
+        )
+
+    def multiply_by(self, multiplier: int | float) -> DollarArray:
+        """Multiply every amount by a multiplier."""
+        coefficient, decimals = decimal_parts(multiplier)
+
+        return DollarArray.from_cents(multiply_cents(self._cents, coefficient, decimals))
@@ -0,0 +1,385 @@
+"""Event-driven amortization that jumps between sparse loan events in closed form."""
+
+from __future__ import annotations
+
+import copy
+import math
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from typing import NamedTuple
+
+from loan_utils.annuity import (
+    annuity_factor,
+    monthly_rate,
+    payoff_months,
+    remaining_balance,
+)
+
+# Events take effect at the start of payment month `month` (1-based), before
+# that month's interest accrues. Several events in one month apply in order.
+
+
+class LumpSum(NamedTuple):
+    """Prepays `amount` of principal at the start of a month."""
+
+    month: int
+    amount: float
+
+
+class PaymentHoliday(NamedTuple):
+    """Skips `months` payments from a month on; the interest is capitalized."""
+
+    month: int
+    months: int = 1
+
+
+class RateChange(NamedTuple):
+    """Changes the annual rate from a month on, recasting the payment by default."""
+
+    month: int
+    annual_interest_percent: float
+    recast: bool = True
+
+
+class Recast(NamedTuple):
+    """Re-amortizes the balance over the rest of the original term."""
+
+    month: int
+
+
+class PaymentChange(NamedTuple):
+    """Sets a new level payment from a month on, e.g. to add extra principal."""
+
+    month: int
+    payment: float
+
+
+Event = LumpSum | PaymentHoliday | RateChange | Recast | PaymentChange
+
+
+class Checkpoint(NamedTuple):
+    """The loan state at the start of a month, before that month's events."""
+
+    month: int
+    balance: float
+    monthly_rate: float
+    payment: float
+    holiday_end: int
+    interest_before: float
+
+
+class Segment(NamedTuple):
+    """A run of months with a constant rate and payment, summarized in closed form."""
+
+    checkpoint: Checkpoint
+    start_month: int
+    months: int
+    prepayment: float
+    opening_balance: float
+    monthly_rate: float
+    payment: float
+    closing_balance: float
+    interest: float
+    pays_off: bool
+
+    @property
+    def end_month(self) -> int:
+        """The last payment month of the segment."""
+        return self.start_month + max(self.months, 1) - 1
+
+
+class EventRow(NamedTuple):
+    """One month of an expanded event schedule, in float dollars."""
+
+    payment_number: int
+    payment: float
+    principal: float
+    interest: float
+    prepayment: float
+    balance: float
+
+
+class ScheduleDiff:
+    """How a modified event schedule differs from the one it was derived from."""
+
+    def __init__(
+        self,
+        first_changed_month: int | None,
+        payoff_month: int,
+        payoff_months_delta: int,
+        total_interest: float,
+        interest_delta: float,
+    ):
+        self.first_changed_month: int | None = first_changed_month
+        self.payoff_month: int = payoff_month
+        self.payoff_months_delta: int = payoff_months_delta
+        self.total_interest: float = total_interest
+        self.interest_delta: float = interest_delta
+
+    def __str__(self) -> str:
+        return (
+            f"Payoff month: {self.payoff_month} ({self.payoff_months_delta:+d})\n"
+            f"Total interest: {self.total_interest:,.2f} ({self.interest_delta:+,.2f})"
+        )
+
+
+class EventSchedule:
+    """A fixed-rate loan amortized through a sparse, sorted list of events.
+
+    The schedule is stored as one closed-form Segment per stretch between events,
+    so building it costs O(events) however long the term is. Monthly rows are
+    produced lazily by iter_rows().
+    """
+
+    def __init__(
+        self,
+        principal: float,
+        annual_interest_percent: float,
+        term_months: int,
+        events: Sequence[Event] = (),
+        payment: float | None = None,
+    ):
+        if principal < 0:
+            raise ValueError("Principal must not be negative.")
+        if term_months <= 0:
+            raise ValueError("Term months must be greater than 0.")
+
+        self.principal: float = float(principal)
+        self.annual_interest_percent: float = annual_interest_percent
+        self.term_months: int = term_months
+        self.events: tuple[Event, ...] = tuple(events)
+        self._check_events(self.events)
+
+        rate: float = float(monthly_rate(annual_interest_percent))
+        if payment is None:
+            payment = self.principal * float(annuity_factor(rate, term_months))
+
+        self._start: Checkpoint = Checkpoint(
+            month=1,
+            balance=self.principal,
+            monthly_rate=rate,
+            payment=float(payment),
+            holiday_end=1,
+            interest_before=0.0,
+        )
+        self._set_segments(self._run(self._start))
+
+    # --------------------
+    # Summary
+    # --------------------
+    @property
+    def payoff_month(self) -> int:
+        """The month of the final payment."""
+        return self.segments[-1].end_month if self.segments else 0
+
+    @property
+    def total_interest(self) -> float:
+        """The interest paid over the life of the loan."""
+        if not self.segments:
+            return 0.0
+
+        return self.segments[-1].checkpoint.interest_before + self.segments[-1].interest
+
+    def balance_after(self, month: int) -> float:
+        """Returns the balance after a payment month, in O(log events)."""
+        if month <= 0 or not self.segments:
+            return self.principal
+        if month >= self.payoff_month:
+            return 0.0
+
+        segment: Segment = self.segments[bisect_right(self._segment_starts, month) - 1]
+
+        return float(
+            remaining_balance(
+                segment.opening_balance,
+                segment.monthly_rate,
+                segment.payment,
+                month - segment.start_month + 1,
+            )
+        )
+
+    # --------------------
+    # What-if edits
+    # --------------------
+    def with_events(self, events: Sequence[Event]) -> EventSchedule:
+        """Returns a copy with a new event list, recomputing only the changed suffix.
+
+        Segments that end before the first month whose events differ are shared
+        with this schedule. The rest is rebuilt from the checkpoint of the last
+        segment starting before that month, so its length is re-solved too.
+        """
+        events = tuple(events)
+        self._check_events(events)
+
+        schedule: EventSchedule = copy.copy(self)
+        schedule.events = events
+        changed: int | None = self._first_changed_month(events)
+        if changed is None:
+            return schedule
+
+        keep: int = max(bisect_left(self._segment_starts, changed) - 1, 0)
+        if keep < len(self.segments):
+            resume: Checkpoint = self.segments[keep].checkpoint
+        else:
+            resume = self._start
+        schedule._set_segments(self.segments[:keep] + schedule._run(resume))
+
+        return schedule
+
+    def add_events(self, *events: Event) -> EventSchedule:
+        """Returns a copy with more events merged in by month."""
+        return self.with_events(
+            sorted(self.events + events, key=lambda event: event.month)
+        )
+
+    def diff(self, other: EventSchedule) -> ScheduleDiff:
+        """Compares another (typically modified) schedule against this one."""
+        return ScheduleDiff(
+            first_changed_month=self._first_changed_month(other.events),
+            payoff_month=other.payoff_month,
+            payoff_months_delta=other.payoff_month - self.payoff_month,
+            total_interest=other.total_interest,
+            interest_delta=other.total_interest - self.total_interest,
+        )
+
+    # --------------------
+    # Lazy expansion
+    # --------------------
+    def iter_rows(self) -> Iterator[EventRow]:
+        """Yields the full monthly schedule, one row at a time."""
+        for segment in self.segments:
+            if segment.months == 0:
+                yield EventRow(segment.start_month, 0.0, 0.0, 0.0, segment.prepayment, 0.0)
+                continue
+
+            balance: float = segment.opening_balance
+            for offset in range(segment.months):
+                interest: float = balance * segment.monthly_rate
+                if segment.pays_off and offset == segment.months - 1:
+                    principal: float = balance
+                else:
+                    principal = segment.payment - interest
+                balance -= principal
+
+                yield EventRow(
+                    payment_number=segment.start_month + offset,
+                    payment=principal + interest,
+                    principal=principal,
+                    interest=interest,
+                    prepayment=segment.prepayment if offset == 0 else 0.0,
+                    balance=max(balance, 0.0),
+                )
+
+    # --------------------
+    # Internal helpers
+    # --------------------
+    @staticmethod
+    def _check_events(events: Sequence[Event]):
+        months: list[int] = [event.month for event in events]
+        if any(month < 1 for month in months):
+            raise ValueError("Event months must be at least 1.")
+        if months != sorted(months):
+            raise ValueError("Events must be sorted by month.")
+
+    def _set_segments(self, segments: list[Segment]):
+        self.segments: list[Segment] = segments
+        self._segment_starts: list[int] = [s.start_month for s in segments]
+
+    def _first_changed_month(self, events: tuple[Event, ...]) -> int | None:
+        """Returns the earliest month whose events differ from this schedule's."""
+        for old, new in zip(self.events, events):
+            if old != new:
+                return min(old.month, new.month)
+        if len(self.events) == len(events):
+            return None
+
+        longer: tuple[Event, ...] = self.events if len(self.events) > len(events) else events
+        return longer[min(len(self.events), len(events))].month
+
+    def _run(self, checkpoint: Checkpoint) -> list[Segment]:
+        """Builds the segments from a checkpoint through payoff."""
+        month, balance, rate, payment, holiday_end, interest_before = checkpoint
+        events: tuple[Event, ...] = self.events
+        index: int = bisect_right([event.month for event in events], month - 1)
+        segments: list[Segment] = []
+
+        while True:
+            checkpoint = Checkpoint(
+                month, balance, rate, payment, holiday_end, interest_before
+            )
+            prepayment: float = 0.0
+            while index < len(events) and events[index].month == month:
+                event: Event = events[index]
+                if isinstance(event, LumpSum):
+                    paid: float = min(event.amount, balance)
+                    prepayment += paid
+                    balance -= paid
+                elif isinstance(event, PaymentHoliday):
+                    holiday_end = max(holiday_end, month + event.months)
+                elif isinstance(event, PaymentChange):
+                    payment = event.payment
+                else:
+                    if isinstance(event, RateChange):
+                        rate = float(monthly_rate(event.annual_interest_percent))
+                        if not event.recast:
+                            index += 1
+                            continue
+                    remaining: int = max(self.term_months - month + 1, 1)
+                    payment = balance * float(annuity_factor(rate, remaining))
+                index += 1
+
+            if balance <= 0.0:
+                if prepayment > 0.0:
+                    segments.append(
+                        Segment(
+                            checkpoint, month, 0, prepayment, 0.0, rate, 0.0, 0.0, 0.0, True
+                        )
+                    )
+                return segments
+
+            next_event: float = events[index].month if index < len(events) else math.inf
+            segment_payment: float = 0.0 if month < holiday_end else payment
+            stop: float = min(next_event, holiday_end) if month < holiday_end else next_event
+            length: float = stop - month
+
+            months_to_payoff: float = math.inf
+            if segment_payment > 0.0:
+                solved: float = float(payoff_months(balance, rate, segment_payment))
+                if not math.isinf(solved):
+                    months_to_payoff = math.ceil(solved - 1e-9)
+            pays_off: bool = not math.isinf(months_to_payoff) and months_to_payoff <= length
+            if pays_off:
+                length = months_to_payoff
+            elif math.isinf(length):
+                raise ValueError(
+                    f"The payment of {segment_payment:.2f} from month {month} never pays off the loan."
+                )
+
+            length = int(length)
+            closing: float = float(
+                remaining_balance(balance, rate, segment_payment, length)
+            )
+            interest: float = segment_payment * length - (balance - closing)
+            if pays_off:
+                closing = 0.0
+
+            segments.append(
+                Segment(
+                    checkpoint=checkpoint,
+                    start_month=month,
+                    months=length,
+                    prepayment=prepayment,
+                    opening_balance=balance,
+                    monthly_rate=rate,
+                    payment=segment_payment,
+                    closing_balance=closing,
+                    interest=interest,
+                    pays_off=pays_off,
+                )
+            )
+            if pays_off:
+                return segments
+
+            month += length
+            balance = closing
+            interest_before += interest
@@ -1,10 +1,66 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from datetime import date
 from decimal import Decimal
+from typing import TYPE_CHECKING, NamedTuple
 
-import pandas as pd
+import numpy as np
 
-from loan_utils.dollar import Dollar
+from loan_utils.annuity import (
+    annuity_factor,
+    monthly_payment_factor,
+    payoff_months,
+    remaining_balance,
+    total_interest_paid,
+)
+from loan_utils.calendar import PaymentCalendar, add_months
+from loan_utils.daily_accrual import DailyAccrualSchedule, accrue_schedule
+from loan_utils.dollar import Dollar, _divide_half_up, decimal_parts
+from loan_utils.dollar_array import DollarArray
+from loan_utils.events import Event, EventSchedule
+from loan_utils.profiling import count, phase
 from loan_utils.rate import Rate
 
+if TYPE_CHECKING:
+    # pandas is only imported when a DataFrame is requested; it dominates
+    # startup time for callers that never build one.
+    import pandas as pd
+
+    from loan_utils.portfolio import PortfolioSchedule
+    from loan_utils.schedule_cache import ScheduleCache
+
+
+class ScheduleRow(NamedTuple):
+    """One payment of an amortization schedule."""
+
+    payment_number: int
+    payment_date: date
+    payment: Dollar
+    principal: Dollar
+    interest: Dollar
+    total_interest: Dollar
+    balance: Dollar
+    ltv_percent: float
+
+
+class ExtraPaymentPayoff:
+    """Payoff month and interest for each of several extra monthly payments."""
+
+    def __init__(
+        self,
+        extra_payments: DollarArray,
+        payoff_months: np.ndarray,
+        total_interest: DollarArray,
+        interest_saved: DollarArray,
+        months_saved: np.ndarray,
+    ):
+        self.extra_payments: DollarArray = extra_payments
+        self.payoff_months: np.ndarray = payoff_months
+        self.total_interest: DollarArray = total_interest
+        self.interest_saved: DollarArray = interest_saved
+        self.months_saved: np.ndarray = months_saved
+
 
 class Loan:
     """A class to represent a generic loan."""
@@ -23,75 +79,414 @@ class Loan:
         if term_years <= 0:
             raise ValueError("Term years must be greater than 0.")
 
-        self.down_payment: Dollar = Dollar(purchase_price).multiply_by(
+        self.purchase_price: Dollar = Dollar(purchase_price)
+        self.down_payment: Dollar = self.purchase_price.multiply_by(
             down_payment_percent / 100.0
         )
-        self.loan_amount: Dollar = Dollar(purchase_price) - self.down_payment
+        self.loan_amount: Dollar = self.purchase_price - self.down_payment
+        self.annual_interest_percent: float = annual_interest_percent
         self.monthly_interest_rate: float = Rate(annual_interest_percent).per_period(12)
         self.term_months: int = term_years * 12
         self.monthly_payment: Dollar = self.calculate_monthly_payment()
+        self._exact_totals: tuple[tuple, np.ndarray, np.ndarray] | None = None
 
-    def amortization_schedule(self) -> None:
-        schedule = pd.DataFrame(
-            columns=[
-                "Payment #",
-                "Payment Date",
-                "Payment Amount",
-                "Principal Portion",
-                "Interest Portion",
-                "Total Interest",
-                "Ending Balance",
-                "Resulting LTV%",
-            ]
-        )
+    def iter_schedule(
+        self,
+        first_payment_date: date | None = None,
+        calendar: PaymentCalendar | None = None,
+    ) -> Iterator[ScheduleRow]:
+        """Yields the amortization schedule one payment at a time.
+
+        Rows are computed on demand and the iterator ends at payoff, so callers
+        can stop early or slice it with itertools.islice. The first payment
+        defaults to the first day of next month; dates follow the calendar's
+        business-day and end-of-month rules.
+        """
+        # Convert one date per row so stopping early skips the rest of the term.
+        payment_dates: np.ndarray = self.payment_dates(first_payment_date, calendar)
 
         balance: Dollar = self.loan_amount
+        payment: Dollar = self.monthly_payment
         total_interest: Dollar = Dollar(0)
 
         for month in range(1, self.term_months + 1):
             interest: Dollar = balance.multiply_by(self.monthly_interest_rate)
-            principal: Dollar = self.monthly_payment - interest
+            principal: Dollar = payment - interest
             balance -= principal
             total_interest += interest
 
             if balance.amount < 0:
                 principal += balance
-                self.monthly_payment = principal + interest
+                payment = principal + interest
                 balance = Dollar(0)
 
-            schedule = pd.concat(
-                [
-                    schedule,
-                    pd.DataFrame(
-                        {
-                            "Payment #": [month],
-                            "Payment Date": [month],
-                            "Payment Amount": [str(self.monthly_payment)],
-                            "Principal Portion": [str(principal)],
-                            "Interest Portion": [str(interest)],
-                            "Total Interest": [str(total_interest)],
-                            "Ending Balance": [str(balance)],
-                            "Resulting LTV%": [
-                                f"{(balance.amount / self.home_value.amount) * 100:.3f}%"
-                            ],
-                        }
-                    ),
-                ],
-                ignore_index=True,
+            yield ScheduleRow(
+                payment_number=month,
+                payment_date=payment_dates[month - 1].item(),
+                payment=payment,
+                principal=principal,
+                interest=interest,
+                total_interest=total_interest,
+                balance=balance,
+                ltv_percent=float(balance.amount / self.purchase_price.amount * 100),
             )
 
             if balance.amount <= 0:
                 break
 
-        print(schedule)
+    def payment_dates(
+        self,
+        first_payment_date: date | None = None,
+        calendar: PaymentCalendar | None = None,
+    ) -> np.ndarray:
+        """Returns the datetime64[D] date of every scheduled monthly payment.
+
+        The calendar must be monthly: the schedule pays the level monthly
+        payment, so other frequencies would put it on the wrong dates.
+        """
+        return _monthly_calendar(calendar).dates(
+            _first_payment_date(first_payment_date), self.term_months
+        )
+
+    def amortization_schedule(
+        self,
+        first_payment_date: date | None = None,
+        calendar: PaymentCalendar | None = None,
+    ) -> pd.DataFrame:
+        """Returns the amortization schedule as a DataFrame with one row per payment.
+
+        Amounts are Decimal values, dates are datetime64 and LTV is a float percent.
+        """
+        with phase("import_pandas"):
+            import pandas as pd
+
+        # Resolve the default once so the rows and the date column agree even
+        # if the month changes while the schedule is built.
+        first_payment_date = _first_payment_date(first_payment_date)
+
+        # Preallocate every column once; the frame is built after the loop.
+        payment_numbers: list[int] = [0] * self.term_months
+        payment_amounts: list[Decimal] = [Decimal(0)] * self.term_months
+        principal_portions: list[Decimal] = [Decimal(0)] * self.term_months
+        interest_portions: list[Decimal] = [Decimal(0)] * self.term_months
+        total_interests: list[Decimal] = [Decimal(0)] * self.term_months
+        ending_balances: list[Decimal] = [Decimal(0)] * self.term_months
+        resulting_ltvs: list[float] = [0.0] * self.term_months
+        rows: int = 0
+
+        with phase("schedule"):
+            for row in self.iter_schedule(first_payment_date, calendar):
+                payment_numbers[rows] = row.payment_number
+                payment_amounts[rows] = row.payment.amount
+                principal_portions[rows] = row.principal.amount
+                interest_portions[rows] = row.interest.amount
+                total_interests[rows] = row.total_interest.amount
+                ending_balances[rows] = row.balance.amount
+                resulting_ltvs[rows] = row.ltv_percent
+                rows += 1
+        count("schedule_rows", rows)
+
+        with phase("dataframe"):
+            return pd.DataFrame(
+                {
+                    "Payment #": pd.Series(payment_numbers[:rows], dtype="int64"),
+                    "Payment Date": pd.Series(
+                        self.payment_dates(first_payment_date, calendar)[:rows],
+                        dtype="datetime64[ns]",
+                    ),
+                    "Payment Amount": pd.Series(payment_amounts[:rows], dtype=object),
+                    "Principal Portion": pd.Series(principal_portions[:rows], dtype=object),
+                    "Interest Portion": pd.Series(interest_portions[:rows], dtype=object),
+                    "Total Interest": pd.Series(total_interests[:rows], dtype=object),
+                    "Ending Balance": pd.Series(ending_balances[:rows], dtype=object),
+                    "Resulting LTV%": pd.Series(resulting_ltvs[:rows], dtype="float64"),
+                }
+            )
+
+    # --------------------
+    # Point queries
+    # --------------------
+    def remaining_balance(self, months, exact: bool = False) -> Dollar | DollarArray:
+        """Returns the balance after a number of payments, or an array of them.
+
+        The default uses the closed-form annuity balance rounded to cents. With
+        exact=True the answer matches amortization_schedule to the cent; the
+        schedule is computed once and every later query is a lookup.
+        """
+        balance, _ = self._totals_after(months, exact)
+
+        return self._as_dollars(balance)
+
+    def cumulative_interest(self, months, exact: bool = False) -> Dollar | DollarArray:
+        """Returns the interest paid through a number of payments, or an array of them."""
+        _, interest = self._totals_after(months, exact)
+
+        return self._as_dollars(interest)
+
+    def cumulative_principal(self, months, exact: bool = False) -> Dollar | DollarArray:
+        """Returns the principal repaid through a number of payments, or an array of them."""
+        balance, _ = self._totals_after(months, exact)
+
+        return self._as_dollars(self.loan_amount.cents - balance)
+
+    def _totals_after(self, months, exact: bool) -> tuple[np.ndarray, np.ndarray]:
+        """Returns (balance, cumulative interest) in cents after each month count."""
+        months = np.clip(np.asarray(months), 0, self.term_months)
+        if not np.issubdtype(months.dtype, np.integer):
+            raise TypeError("Months must be integers.")
+
+        if exact:
+            balances, interests = self._exact_cumulative_cents()
+
+            return balances[months], interests[months]
+
+        principal: float = float(self.loan_amount.amount)
+        payment: float = float(self.monthly_payment.amount)
+        balance: np.ndarray = remaining_balance(
+            principal, self.monthly_interest_rate, payment, months
+        )
+        # Interest is every payment made minus the reduction in balance. The
+        # unclamped balance is used so the short final payment is accounted for.
+        interest: np.ndarray = payment * months - (principal - balance)
+
+        return _round_cents(np.maximum(balance, 0.0)), _round_cents(interest)
+
+    def exact_schedule(self, cache: ScheduleCache | None = None) -> PortfolioSchedule:
+        """Returns the schedule as one row of int64 cents matrices.
+
+        With a ScheduleCache, identical loans computed by earlier runs or other
+        processes are read back instead of recomputed.
+        """
+        if cache is not None:
+            return cache.schedule(
+                self.loan_amount.cents,
+                self.annual_interest_percent,
+                self.term_months,
+                self.monthly_payment.cents,
+            )
+
+        from loan_utils.portfolio import amortize_portfolio_cents
+
+        return amortize_portfolio_cents(
+            self.loan_amount.cents,
+            self.annual_interest_percent,
+            self.term_months,
+            self.monthly_payment.cents,
+        )
+
+    def _exact_cumulative_cents(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the schedule's balance and cumulative interest, indexed by month."""
+        key: tuple = (
+            self.loan_amount.cents,
+            self.annual_interest_percent,
+            self.term_months,
+            self.monthly_payment.cents,
+        )
+        if self._exact_totals is None or self._exact_totals[0] != key:
+            # A plain integer loop with iter_schedule's rules; for one loan it is
+            # much cheaper than a NumPy step per month in the portfolio kernel.
+            coefficient, decimals = decimal_parts(self.monthly_interest_rate)
+            balance: int = self.loan_amount.cents
+            payment: int = self.monthly_payment.cents
+            total_interest: int = 0
+            balances: list[int] = [balance]
+            interests: list[int] = [0]
+
+            for _ in range(self.term_months):
+                if decimals <= 0:
+                    interest: int = balance * coefficient * 10**-decimals
+                else:
+                    interest = _divide_half_up(balance * coefficient, 10**decimals)
+                balance = max(balance - (payment - interest), 0)
+                total_interest += interest
+                balances.append(balance)
+                interests.append(total_interest)
+                if balance == 0:
+                    break
+
+            padding: int = self.term_months + 1 - len(balances)
+            self._exact_totals = (
+                key,
+                np.array(balances + [balance] * padding, dtype=np.int64),
+                np.array(interests + [total_interest] * padding, dtype=np.int64),
+            )
+
+        return self._exact_totals[1], self._exact_totals[2]
+
+    # --------------------
+    # Events
+    # --------------------
+    def event_schedule(self, events: Sequence[Event] = ()) -> EventSchedule:
+        """Returns the schedule after lump sums, holidays, recasts, rate or payment changes.
+
+        Segments between events are computed in closed form with the unrounded
+        level payment; rows are only expanded on request.
+        """
+        return EventSchedule(
+            principal=float(self.loan_amount.amount),
+            annual_interest_percent=self.annual_interest_percent,
+            term_months=self.term_months,
+            events=events,
+        )
+
+    # --------------------
+    # Daily accrual
+    # --------------------
+    def daily_accrual_schedule(
+        self,
+        first_payment_date: date | None = None,
+        paid_dates=None,
+        paid_amounts=None,
+        funding_date: date | None = None,
+        convention: str = "ACT/365",
+        calendar: PaymentCalendar | None = None,
+        pay_off_final: bool | None = None,
+    ) -> DailyAccrualSchedule:
+        """Returns the schedule with interest accrued daily between payment dates.
+
+        paid_dates and paid_amounts replace the scheduled dates and the level
+        monthly payment, e.g. to model late, early or partial payments. The loan
+        is funded one payment interval before the first scheduled payment unless
+        funding_date is given. The last payment settles the loan only for the
+        full scheduled dates; a payment history leaves the rest of the balance
+        open unless pay_off_final is set.
+        """
+        if first_payment_date is None:
+            first_payment_date = add_months(date.today().replace(day=1), 1)
+        calendar = _monthly_calendar(calendar)
+
+        starts, scheduled = calendar.accrual_periods(
+            first_payment_date, self.term_months, funding_date
+        )
+        dates = scheduled if paid_dates is None else paid_dates
+        if pay_off_final is None:
+            pay_off_final = paid_dates is None
+        amounts = self.monthly_payment.cents if paid_amounts is None else paid_amounts
+
+        with phase("daily_accrual"):
+            return accrue_schedule(
+                [self.loan_amount.cents],
+                self.annual_interest_percent,
+                starts[0],
+                np.asarray(dates, dtype="datetime64[D]")[None, :],
+                np.broadcast_to(np.asarray(amounts, dtype=np.int64), (len(dates),))[None, :],
+                convention,
+                pay_off_final,
+            )
+
+    # --------------------
+    # Extra payments
+    # --------------------
+    def payoff_with_extra_payment(self, extra_payments) -> ExtraPaymentPayoff:
+        """Solves payoff month and interest saved for extra monthly principal payments.
+
+        extra_payments is a DollarArray or an array of dollar amounts. Each level
+        is solved in closed form (NPER), so a grid of levels costs one array
+        expression rather than one simulation per level.
+        """
+        if not isinstance(extra_payments, DollarArray):
+            extra_payments = DollarArray.from_cents(
+                _round_cents(np.atleast_1d(np.asarray(extra_payments, dtype=np.float64)))
+            )
+        if np.any(extra_payments.cents < 0):
+            raise ValueError("Extra payments must not be negative.")
+        if self.loan_amount.cents == 0:
+            # Nothing is borrowed, so there is nothing to pay off or save.
+            levels: int = len(extra_payments)
+            return ExtraPaymentPayoff(
+                extra_payments=extra_payments,
+                payoff_months=np.zeros(levels, dtype=np.int64),
+                total_interest=DollarArray.from_cents(np.zeros(levels, dtype=np.int64)),
+                interest_saved=DollarArray.from_cents(np.zeros(levels, dtype=np.int64)),
+                months_saved=np.zeros(levels, dtype=np.int64),
+            )
+
+        principal: float = float(self.loan_amount.amount)
+        payment: float = float(self.monthly_payment.amount)
+        payments: np.ndarray = payment + extra_payments.to_float()
+
+        months: np.ndarray = np.ceil(
+            payoff_months(principal, self.monthly_interest_rate, payments) - 1e-9
+        ).astype(np.int64)
+        months = np.minimum(months, self.term_months)
+        baseline_months: int = min(
+            int(np.ceil(payoff_months(principal, self.monthly_interest_rate, payment) - 1e-9)),
+            self.term_months,
+        )
+        total_interest: np.ndarray = _round_cents(
+            total_interest_paid(principal, self.monthly_interest_rate, payments)
+        )
+        baseline_interest: int = int(
+            _round_cents(total_interest_paid(principal, self.monthly_interest_rate, payment))
+        )
+
+        return ExtraPaymentPayoff(
+            extra_payments=extra_payments,
+            payoff_months=months,
+            total_interest=DollarArray.from_cents(total_interest),
+            interest_saved=DollarArray.from_cents(baseline_interest - total_interest),
+            months_saved=baseline_months - months,
+        )
+
+    def extra_payment_for_payoff(self, months) -> Dollar | DollarArray:
+        """Returns the extra monthly payment needed to pay off within a number of months.
+
+        Amounts are rounded up to the cent so the payoff is not missed by a cent;
+        months at or beyond the current payoff need no extra payment.
+        """
+        months = np.asarray(months)
+        if not np.issubdtype(months.dtype, np.integer) or np.any(months <= 0):
+            raise ValueError("Months must be positive integers.")
+
+        required: np.ndarray = float(self.loan_amount.amount) * annuity_factor(
+            self.monthly_interest_rate, months
+        )
+        extra: np.ndarray = np.maximum(required - float(self.monthly_payment.amount), 0.0)
+
+        return self._as_dollars(np.ceil(np.round(extra * 100, 6)).astype(np.int64))
+
+    @staticmethod
+    def _as_dollars(cents: np.ndarray) -> Dollar | DollarArray:
+        if np.ndim(cents) == 0:
+            return Dollar.from_cents(int(cents))
+
+        return DollarArray.from_cents(cents)
 
     def calculate_monthly_payment(self) -> Dollar:
-        if self.monthly_interest_rate == 0.0:
-            return self.loan_amount.divide_by(self.term_months)
+        with phase("payment"):
+            if self.monthly_interest_rate == 0.0:
+                return self.loan_amount.divide_by(self.term_months)
 
-        interest_rate: Decimal = Decimal(str(self.monthly_interest_rate))
+            return self.loan_amount.multiply_by(
+                monthly_payment_factor(self.monthly_interest_rate, self.term_months)
+            )
+
+
+_MONTHLY: PaymentCalendar = PaymentCalendar()
+
+
+def _first_payment_date(first_payment_date: date | None) -> date:
+    """Returns the given date, or the first day of next month when it is None."""
+    if first_payment_date is None:
+        return add_months(date.today().replace(day=1), 1)
+
+    return first_payment_date
 
-        return self.loan_amount.multiply_by(
-            interest_rate
-            / (Decimal(1) - (Decimal(1) + interest_rate) ** -self.term_months)
+
+def _monthly_calendar(calendar: PaymentCalendar | None) -> PaymentCalendar:
+    """Returns the calendar, or the default one, checking that it is monthly."""
+    if calendar is None:
+        return _MONTHLY
+    if calendar.frequency != "monthly":
+        raise ValueError(
+            f"Loan schedules use monthly payments; got a {calendar.frequency} calendar."
         )
+
+    return calendar
+
+
+def _round_cents(dollars: np.ndarray) -> np.ndarray:
+    """Converts float dollars to int64 cents, rounding half away from zero."""
+    cents: np.ndarray = np.abs(dollars) * 100
+
+    return (np.sign(dollars) * np.floor(cents + 0.5)).astype(np.int64)
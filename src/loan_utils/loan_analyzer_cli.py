@@ -1,8 +1,13 @@
 #! /usr/bin/python3
 
 import argparse
+import os
+import sys
+from collections import deque
 
+from loan_utils.loan import Loan, ScheduleRow
 from loan_utils.mortgage import Mortgage
+from loan_utils.profiling import PROFILER, phase
 
 
 def main():
@@ -23,10 +28,122 @@ def main():
     )
     parser.add_argument("--price", type=float, help="Price of the house or car.")
     parser.add_argument("--term_years", type=int, help="Term length in years.")
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print totals instead of the full amortization schedule.",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a per-phase timing breakdown to stderr when done.",
+    )
+    parser.add_argument(
+        "--profile_output",
+        type=str,
+        help="Run under cProfile and write pstats data to this file.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Analyze many loans read from a CSV or JSONL file."
+    )
+    batch_parser.add_argument(
+        "input", type=str, help="CSV or JSONL file of loans, or - for stdin."
+    )
+    batch_parser.add_argument(
+        "--input_format",
+        type=str,
+        choices=["csv", "jsonl"],
+        help="Input format. Defaults to the file extension, or csv for stdin.",
+    )
+    batch_parser.add_argument(
+        "--output", type=str, default="-", help="Output CSV file, or - for stdout."
+    )
+    batch_parser.add_argument(
+        "--schedules",
+        action="store_true",
+        help="Write full schedules instead of one summary row per loan.",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes.",
+    )
+    batch_parser.add_argument(
+        "--chunk_size", type=int, default=1000, help="Loans per worker task."
+    )
+
+    cache_stats_parser = subparsers.add_parser(
+        "cache-stats", help="Show the persistent schedule cache's size and hit rate."
+    )
+    cache_stats_parser.add_argument(
+        "--cache_path",
+        type=str,
+        help="Cache database. Defaults to $LOAN_ANALYZER_CACHE or the user cache directory.",
+    )
+    cache_stats_parser.add_argument(
+        "--clear", action="store_true", help="Remove every entry after printing."
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Answer payment, summary and schedule requests over HTTP."
+    )
+    serve_parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to bind.")
+    serve_parser.add_argument("--port", type=int, default=8080, help="TCP port.")
+    serve_parser.add_argument(
+        "--unix_socket", type=str, help="Listen on this Unix socket path instead of TCP."
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for schedule batches; 0 uses a thread.",
+    )
+    serve_parser.add_argument(
+        "--batch_window_ms",
+        type=float,
+        default=2.0,
+        help="How long to collect concurrent requests into one batch.",
+    )
+    serve_parser.add_argument(
+        "--cache_mb",
+        type=float,
+        help="Memory budget of the warm cache in MiB (default 64); 0 disables it.",
+    )
 
     args = parser.parse_args()
 
-    if args.loan_type == "mortgage":
+    if args.profile:
+        PROFILER.enable()
+    profile = None
+    if args.profile_output:
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+
+    try:
+        run_command(args)
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(args.profile_output)
+        if args.profile:
+            PROFILER.disable()
+            print(PROFILER.report(), file=sys.stderr)
+
+
+def run_command(args: argparse.Namespace):
+    if args.command == "batch":
+        run_batch_command(args)
+    elif args.command == "cache-stats":
+        run_cache_stats_command(args)
+    elif args.command == "serve":
+        run_serve_command(args)
+    elif args.loan_type == "mortgage":
         mortgage_15_year: Mortgage = Mortgage(
             purchase_price=args.price,
             annual_interest_percent=args.annual_interest_percentage,
@@ -35,7 +152,78 @@ def main():
             closing_costs=args.closing_costs,
         )
 
-        mortgage_15_year.amortization_schedule()
+        if args.summary:
+            print_summary(mortgage_15_year)
+        else:
+            schedule = mortgage_15_year.amortization_schedule()
+            with phase("formatting"):
+                text: str = str(schedule)
+            print(text)
+
+
+def print_summary(loan: Loan):
+    with phase("schedule"):
+        final_payment: ScheduleRow = deque(loan.iter_schedule(), maxlen=1)[0]
+
+    print(f"Loan amount: {loan.loan_amount}")
+    print(f"Monthly payment: {loan.monthly_payment}")
+    print(f"Payoff month: {final_payment.payment_number}")
+    print(f"Total interest: {final_payment.total_interest}")
+
+
+def run_batch_command(args: argparse.Namespace):
+    from loan_utils.batch import read_loans, run_batch
+
+    input_format: str = args.input_format or (
+        "jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv"
+    )
+    source = sys.stdin if args.input == "-" else open(args.input, newline="")
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+
+    try:
+        run_batch(
+            read_loans(source, input_format),
+            output,
+            schedules=args.schedules,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+def run_cache_stats_command(args: argparse.Namespace):
+    from loan_utils.schedule_cache import ScheduleCache
+
+    with ScheduleCache(args.cache_path) as cache:
+        print(cache.stats())
+        if args.clear:
+            cache.clear()
+
+
+def run_serve_command(args: argparse.Namespace):
+    import asyncio
+
+    from loan_utils.service import DEFAULT_CACHE_BYTES, serve
+
+    try:
+        asyncio.run(
+            serve(
+                host=args.host,
+                port=args.port,
+                unix_socket=args.unix_socket,
+                workers=args.workers,
+                batch_window=args.batch_window_ms / 1000,
+                cache_bytes=(
+                    DEFAULT_CACHE_BYTES if args.cache_mb is None else int(args.cache_mb * 2**20)
+                ),
+            )
+        )
+    except KeyboardInterrupt:
+        pass
 
 
 if __name__ == "__main__":
@@ -1,8 +1,16 @@
-import matplotlib.pyplot as plt
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from loan_utils.arm import ARMSchedule, ARMTerms, amortize_arm
 from loan_utils.balance_tracker import BalanceTracker
+from loan_utils.charts import ChartSpec, Series, build_figure
 from loan_utils.dollar import Dollar
 from loan_utils.loan import Loan
+from loan_utils.profiling import phase
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
 
 
 class Mortgage(Loan):
@@ -25,34 +33,57 @@ class Mortgage(Loan):
 
         print(self.monthly_payment)
 
-    def mortgage_details(self) -> None:
+    def mortgage_details(self, extra_payment: float = 0.0) -> Figure:
+        """Plots the balance and total interest paid with an extra monthly payment.
+
+        Returns a headless Agg Figure; save it with figure.savefig(path).
+        """
+        spec: ChartSpec = self.mortgage_chart(extra_payment)
+
+        with phase("plotting"):
+            return build_figure(spec)
+
+    def arm_schedule(self, terms: ARMTerms, index_percents) -> ARMSchedule:
+        """Amortizes the mortgage as an ARM over paths of index rates at each reset.
+
+        The annual interest rate is the initial fixed rate. index_percents is a
+        scenarios x resets array (or a single path); the payment is recast at
+        every reset.
+        """
+        with phase("arm"):
+            return amortize_arm(
+                float(self.loan_amount.amount),
+                self.annual_interest_percent,
+                terms,
+                index_percents,
+                self.term_months,
+            )
+
+    def mortgage_chart(self, extra_payment: float = 0.0) -> ChartSpec:
+        """Returns the mortgage_details chart as a spec for charts.render_charts."""
         loan_balance_tracker: BalanceTracker = BalanceTracker(self.term_months)
-        cumulative_loan_interest_tracker: BalanceTracker = BalanceTracker(
-            self.term_months
-        )
+        loan_interest_tracker: BalanceTracker = BalanceTracker(self.term_months)
 
-        extra_payment: Dollar = Dollar(0)
+        extra_principal: Dollar = Dollar(extra_payment)
         loan_balance: Dollar = self.loan_amount
         month_count: int = 0
-        total_loan_interest: Dollar = Dollar(0)
 
-        while loan_balance.amount > 0 and month_count < self.term_months:
-            loan_interest: Dollar = loan_balance.multiply_by(self.monthly_interest_rate)
+        with phase("schedule"):
+            while loan_balance.amount > 0 and month_count < self.term_months:
+                loan_interest: Dollar = loan_balance.multiply_by(self.monthly_interest_rate)
 
-            principle_payment = self.monthly_payment - loan_interest
-            loan_balance = loan_balance - principle_payment - extra_payment
-            total_loan_interest += loan_interest
+                principle_payment = self.monthly_payment - loan_interest
+                loan_balance = loan_balance - principle_payment - extra_principal
 
-            loan_balance_tracker.update_balance(month_count, loan_balance)
-            cumulative_loan_interest_tracker.update_balance(
-                month_count, total_loan_interest
-            )
+                loan_balance_tracker.append(loan_balance)
+                loan_interest_tracker.append(loan_interest)
+
+                month_count += 1
 
-            month_count += 1
-        plt.figure()
-        plt.plot(loan_balance_tracker.extract_values(), label="Loan balance")
-        plt.plot(
-            cumulative_loan_interest_tracker.extract_values(),
-            label="Total interest paid",
+        return ChartSpec(
+            title="Mortgage balance and interest",
+            series=(
+                Series("Loan balance", loan_balance_tracker.extract_values().to_float()),
+                Series("Total interest paid", loan_interest_tracker.cumulative().to_float()),
+            ),
         )
-        plt.legend()
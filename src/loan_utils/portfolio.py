@@ -0,0 +1,234 @@
+"""Vectorized amortization of whole loan portfolios."""
+
+import numpy as np
+
+from loan_utils.annuity import (
+    annuity_factor,
+    monthly_payment_factor,
+    monthly_rate,
+    remaining_balance,
+)
+from loan_utils.cents import multiplier_arrays, multiply_round_half_up, split_multiply_fits
+from loan_utils.dollar import Dollar, _divide_half_up
+
+
+class PortfolioSchedule:
+    """Loans x months matrices of payment, interest, principal and ending balance.
+
+    Column k holds payment number k + 1. Months after a loan's final payment are
+    zero in every matrix and False in `active`.
+    """
+
+    def __init__(
+        self,
+        payment: np.ndarray,
+        interest: np.ndarray,
+        principal: np.ndarray,
+        balance: np.ndarray,
+        payoff_months: np.ndarray,
+    ):
+        self.payment: np.ndarray = payment
+        self.interest: np.ndarray = interest
+        self.principal: np.ndarray = principal
+        self.balance: np.ndarray = balance
+        self.payoff_months: np.ndarray = payoff_months
+
+    @property
+    def n_loans(self) -> int:
+        return self.balance.shape[0]
+
+    @property
+    def n_months(self) -> int:
+        return self.balance.shape[1]
+
+    @property
+    def active(self) -> np.ndarray:
+        """Returns a loans x months mask of the months in which a payment is made."""
+        return np.arange(self.n_months) < self.payoff_months[:, None]
+
+    def masked(self, name: str) -> np.ma.MaskedArray:
+        """Returns one matrix as a masked array hiding the months after payoff."""
+        return np.ma.MaskedArray(getattr(self, name), mask=~self.active)
+
+    def total_interest(self) -> np.ndarray:
+        """Returns the interest paid over the life of each loan."""
+        return self.interest.sum(axis=1)
+
+
+def _as_loan_arrays(
+    principal, annual_interest_percent, term_months
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    principal, annual_interest_percent, term_months = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(principal, dtype=np.float64)),
+        np.atleast_1d(np.asarray(annual_interest_percent, dtype=np.float64)),
+        np.atleast_1d(term_months),
+    )
+    if principal.ndim != 1:
+        raise ValueError("Loan parameters must be scalars or 1-D arrays.")
+    if np.any(principal < 0):
+        raise ValueError("Principal must not be negative.")
+    if not np.issubdtype(term_months.dtype, np.integer) or np.any(term_months <= 0):
+        raise ValueError("Term months must be positive integers.")
+
+    return principal, annual_interest_percent, term_months.astype(np.int64)
+
+
+def amortize_portfolio(
+    principal, annual_interest_percent, term_months
+) -> PortfolioSchedule:
+    """Amortizes many fixed-rate loans at once in floating point dollars.
+
+    Terms may differ between loans; every matrix is as wide as the longest term.
+    The final payment is clamped to the remaining balance, as in
+    Loan.amortization_schedule.
+    """
+    principal, annual_interest_percent, term_months = _as_loan_arrays(
+        principal, annual_interest_percent, term_months
+    )
+    rate: np.ndarray = monthly_rate(annual_interest_percent)[:, None]
+    payment: np.ndarray = (principal * annuity_factor(rate[:, 0], term_months))[
+        :, None
+    ]
+    n_months: int = int(term_months.max()) if len(term_months) else 0
+
+    # Opening balance of every month from the closed form, then one array
+    # expression for each column.
+    months: np.ndarray = np.arange(n_months)
+    opening: np.ndarray = np.maximum(
+        remaining_balance(principal[:, None], rate, payment, months), 0.0
+    )
+
+    interest: np.ndarray = opening * rate
+    principal_portion: np.ndarray = np.minimum(payment - interest, opening)
+    last: np.ndarray = months == term_months[:, None] - 1
+    principal_portion = np.where(last, opening, principal_portion)
+
+    active: np.ndarray = months < term_months[:, None]
+    interest = np.where(active, interest, 0.0)
+    principal_portion = np.where(active, principal_portion, 0.0)
+    balance: np.ndarray = np.where(active, opening - principal_portion, 0.0)
+
+    return PortfolioSchedule(
+        payment=interest + principal_portion,
+        interest=interest,
+        principal=principal_portion,
+        balance=balance,
+        payoff_months=term_months,
+    )
+
+
+def amortize_portfolio_cents(
+    principal_cents, annual_interest_percent, term_months, monthly_payment_cents=None
+) -> PortfolioSchedule:
+    """Amortizes many fixed-rate loans in int64 cents, matching Loan to the cent.
+
+    Payments are rounded like Loan.calculate_monthly_payment unless given, and
+    every month's interest is rounded half up like Dollar.multiply_by, so the
+    matrices are identical to Loan.amortization_schedule. Amounts in the
+    returned schedule are integer cents.
+    """
+    principal, annual_interest_percent, term_months = _as_loan_arrays(
+        principal_cents, annual_interest_percent, term_months
+    )
+    principal = principal.astype(np.int64)
+    rate: np.ndarray = monthly_rate(annual_interest_percent)
+    coefficients, decimals = multiplier_arrays(rate)
+    if monthly_payment_cents is None:
+        payment: np.ndarray = _monthly_payments_cents(principal, rate, term_months)
+    else:
+        payment = np.broadcast_to(
+            np.asarray(monthly_payment_cents, dtype=np.int64), principal.shape
+        )
+
+    n_loans: int = len(principal)
+    n_months: int = int(term_months.max()) if n_loans else 0
+    payment_matrix: np.ndarray = np.zeros((n_loans, n_months), dtype=np.int64)
+    interest_matrix: np.ndarray = np.zeros((n_loans, n_months), dtype=np.int64)
+    principal_matrix: np.ndarray = np.zeros((n_loans, n_months), dtype=np.int64)
+    balance_matrix: np.ndarray = np.zeros((n_loans, n_months), dtype=np.int64)
+    payoff_months: np.ndarray = np.zeros(n_loans, dtype=np.int64)
+
+    # One array step per month over the loans that are still open, mirroring
+    # the body of Loan.amortization_schedule.
+    balance: np.ndarray = principal.copy()
+    open_loans: np.ndarray = np.arange(n_loans)
+    for month in range(n_months):
+        open_loans = open_loans[term_months[open_loans] > month]
+        if len(open_loans) == 0:
+            break
+
+        opening: np.ndarray = balance[open_loans]
+        interest: np.ndarray = _monthly_interest(
+            opening, coefficients[open_loans], decimals[open_loans]
+        )
+        principal_portion: np.ndarray = payment[open_loans] - interest
+        closing: np.ndarray = opening - principal_portion
+
+        overpaid: np.ndarray = closing < 0
+        principal_portion = np.where(overpaid, principal_portion + closing, principal_portion)
+        closing = np.where(overpaid, 0, closing)
+
+        payment_matrix[open_loans, month] = principal_portion + interest
+        interest_matrix[open_loans, month] = interest
+        principal_matrix[open_loans, month] = principal_portion
+        balance_matrix[open_loans, month] = closing
+        payoff_months[open_loans] = month + 1
+        balance[open_loans] = closing
+
+        open_loans = open_loans[closing > 0]
+
+    return PortfolioSchedule(
+        payment=payment_matrix,
+        interest=interest_matrix,
+        principal=principal_matrix,
+        balance=balance_matrix,
+        payoff_months=payoff_months,
+    )
+
+
+def _monthly_interest(
+    balance: np.ndarray, coefficients: np.ndarray, decimals: np.ndarray
+) -> np.ndarray:
+    """Returns balance * rate in cents rounded half up, exactly, for any balance.
+
+    Balances above about $92 million overflow the int64 split multiply. Only
+    those loans are computed with Python integers; every other loan stays on
+    the int64 path.
+    """
+    fits: np.ndarray = split_multiply_fits(balance, decimals)
+    if np.all(fits):
+        return multiply_round_half_up(balance, coefficients, decimals)
+
+    interest: np.ndarray = np.empty(len(balance), dtype=np.int64)
+    interest[fits] = multiply_round_half_up(balance[fits], coefficients[fits], decimals[fits])
+
+    wide: np.ndarray = ~fits
+    interest[wide] = [
+        _divide_half_up(amount * coefficient * 10 ** max(-d, 0), 10 ** max(d, 0))
+        for amount, coefficient, d in zip(
+            balance[wide].tolist(), coefficients[wide].tolist(), decimals[wide].tolist()
+        )
+    ]
+
+    return interest
+
+
+def _monthly_payments_cents(
+    principal: np.ndarray, rate: np.ndarray, term_months: np.ndarray
+) -> np.ndarray:
+    """Returns each loan's level payment in cents, rounded exactly like Loan."""
+    payments: np.ndarray = np.empty(len(principal), dtype=np.int64)
+
+    for index, (amount, monthly_interest_rate, term) in enumerate(
+        zip(principal.tolist(), rate.tolist(), term_months.tolist())
+    ):
+        loan_amount: Dollar = Dollar.from_cents(amount)
+        if monthly_interest_rate == 0.0:
+            payment: Dollar = loan_amount.divide_by(term)
+        else:
+            payment = loan_amount.multiply_by(
+                monthly_payment_factor(monthly_interest_rate, term)
+            )
+        payments[index] = payment.cents
+
+    return payments
@@ -0,0 +1,158 @@
+"""Opt-in phase timers and counters for finding where a run spends its time.
+
+Instrumented code wraps each phase in `with phase("name"):` and bumps counters
+with `count("name", n)`. Both check one flag and return immediately while the
+profiler is disabled, which is the default.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+
+class PhaseStats:
+    """Calls and accumulated wall time of one phase."""
+
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0):
+        self.calls: int = calls
+        self.seconds: float = seconds
+
+
+class _NullPhase:
+    """The shared context manager handed out while profiling is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return None
+
+
+class _Phase:
+    __slots__ = ("_stats", "_start")
+
+    def __init__(self, stats: PhaseStats):
+        self._stats: PhaseStats = stats
+
+    def __enter__(self):
+        self._start: float = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stats.calls += 1
+        self._stats.seconds += perf_counter() - self._start
+
+
+_NULL_PHASE: _NullPhase = _NullPhase()
+
+
+class Profiler:
+    """Accumulates phase timings and counters while enabled.
+
+    Phases may nest, so the shares of nested phases add up to more than 100%.
+    """
+
+    def __init__(self):
+        self.enabled: bool = False
+        self.phases: dict[str, PhaseStats] = {}
+        self.counters: dict[str, int] = {}
+        self._enabled_at: float = 0.0
+        self._elapsed: float = 0.0
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            self._enabled_at = perf_counter()
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            self._elapsed += perf_counter() - self._enabled_at
+
+    def reset(self):
+        self.phases.clear()
+        self.counters.clear()
+        self._elapsed = 0.0
+        self._enabled_at = perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds spent enabled since the last reset."""
+        running: float = perf_counter() - self._enabled_at if self.enabled else 0.0
+        return self._elapsed + running
+
+    def phase(self, name: str) -> _Phase | _NullPhase:
+        if not self.enabled:
+            return _NULL_PHASE
+
+        stats: PhaseStats | None = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+
+        return _Phase(stats)
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # --------------------
+    # Merging across processes
+    # --------------------
+    def snapshot(self) -> dict:
+        """Returns the phases and counters as plain data that can be pickled."""
+        return {
+            "phases": {name: (s.calls, s.seconds) for name, s in self.phases.items()},
+            "counters": dict(self.counters),
+        }
+
+    def merge(self, snapshot: dict):
+        """Adds a snapshot, e.g. from a worker process, to these totals."""
+        for name, (calls, seconds) in snapshot["phases"].items():
+            stats: PhaseStats = self.phases.setdefault(name, PhaseStats())
+            stats.calls += calls
+            stats.seconds += seconds
+        for name, amount in snapshot["counters"].items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # --------------------
+    # Reporting
+    # --------------------
+    def report(self) -> str:
+        """Returns a table of phases by total time, then the counters."""
+        elapsed: float = self.elapsed
+        lines: list[str] = [
+            f"{'phase':<24}{'calls':>10}{'total ms':>12}{'per call us':>14}{'share':>8}"
+        ]
+        for name, stats in sorted(self.phases.items(), key=lambda item: -item[1].seconds):
+            share: float = stats.seconds / elapsed if elapsed else 0.0
+            lines.append(
+                f"{name:<24}{stats.calls:>10}{stats.seconds * 1e3:>12.3f}"
+                f"{stats.seconds / stats.calls * 1e6:>14.1f}{share:>8.1%}"
+            )
+        lines.append(f"{'wall time':<24}{'':>10}{elapsed * 1e3:>12.3f}")
+
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'counter':<24}{'value':>10}")
+            lines.extend(
+                f"{name:<24}{value:>10}" for name, value in sorted(self.counters.items())
+            )
+
+        return "\n".join(lines)
+
+
+PROFILER: Profiler = Profiler()
+
+
+def phase(name: str) -> _Phase | _NullPhase:
+    """Returns a context manager timing a phase of the process-wide profiler."""
+    return PROFILER.phase(name)
+
+
+def count(name: str, amount: int = 1):
+    """Adds to a counter of the process-wide profiler."""
+    PROFILER.count(name, amount)
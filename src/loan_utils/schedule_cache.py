@@ -0,0 +1,341 @@
+"""Persistent on-disk cache of exact loan schedules, shared between processes."""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import time
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+
+import numpy as np
+
+from loan_utils.portfolio import PortfolioSchedule, amortize_portfolio_cents
+
+CACHE_PATH_ENV: str = "LOAN_ANALYZER_CACHE"
+DEFAULT_MAX_BYTES: int = 256 * 1024 * 1024
+SCHEDULE_COLUMNS: tuple[str, ...] = ("payment", "interest", "principal", "balance")
+# Part of every key, independent of the package version. Bump it whenever the
+# kernel or the stored format changes, so entries written before stop matching;
+# revision 2 fixed interest on balances above about $92 million.
+SCHEDULE_REVISION: int = 2
+
+# A busy writer in another process holds the database lock for milliseconds;
+# wait rather than fail.
+_BUSY_TIMEOUT_SECONDS: float = 30.0
+# Lookups only record access times and counters, so those are buffered and
+# written in one transaction per this many lookups.
+_FLUSH_EVERY: int = 64
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS schedules (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS schedules_last_access ON schedules (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+@lru_cache(maxsize=1)
+def library_version() -> str:
+    """Returns the installed loan-analyzer version, which is part of every key.
+
+    The package metadata is read once per process.
+    """
+    try:
+        return metadata.version("loan-analyzer")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def default_cache_path() -> Path:
+    """Returns $LOAN_ANALYZER_CACHE, or schedules.sqlite3 in the user cache directory."""
+    if os.environ.get(CACHE_PATH_ENV):
+        return Path(os.environ[CACHE_PATH_ENV])
+
+    cache_home: Path = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return cache_home / "loan-analyzer" / "schedules.sqlite3"
+
+
+def schedule_key(
+    loan_amount_cents: int,
+    annual_interest_percent: float,
+    term_months: int,
+    monthly_payment_cents: int,
+) -> str:
+    """Returns the sha256 of the canonical JSON of a schedule's inputs.
+
+    The down payment and price only matter through the loan amount, so loans with
+    different prices but the same amount share an entry.
+    """
+    parameters: dict = {
+        "annual_interest_percent": repr(float(annual_interest_percent)),
+        "loan_amount_cents": int(loan_amount_cents),
+        "monthly_payment_cents": int(monthly_payment_cents),
+        "revision": SCHEDULE_REVISION,
+        "term_months": int(term_months),
+        "version": library_version(),
+    }
+    canonical: str = json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CacheStats:
+    """Entry count, size and lifetime hit counters of a schedule cache."""
+
+    def __init__(
+        self,
+        path: Path,
+        entries: int,
+        size_bytes: int,
+        max_bytes: int,
+        hits: int,
+        misses: int,
+        evictions: int,
+    ):
+        self.path: Path = path
+        self.entries: int = entries
+        self.size_bytes: int = size_bytes
+        self.max_bytes: int = max_bytes
+        self.hits: int = hits
+        self.misses: int = misses
+        self.evictions: int = evictions
+
+    @property
+    def hit_rate(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"Cache: {self.path}\n"
+            f"Entries: {self.entries}\n"
+            f"Size: {self.size_bytes:,} of {self.max_bytes:,} bytes\n"
+            f"Hits: {self.hits}\n"
+            f"Misses: {self.misses}\n"
+            f"Hit rate: {self.hit_rate:.1%}\n"
+            f"Evictions: {self.evictions}"
+        )
+
+
+class ScheduleCache:
+    """An SQLite-backed LRU cache of cents schedules from amortize_portfolio_cents.
+
+    The database runs in WAL mode so readers in other processes are never blocked
+    by a writer, and every write is one IMMEDIATE transaction. Entries are evicted
+    least recently used first once their total size exceeds `max_bytes`.
+    Lookups only read; their access times and counters are buffered and written
+    in batches, on put, stats or close, or by calling flush().
+    Connections cannot be shared across a fork; open one cache per process.
+    """
+
+    def __init__(self, path: str | Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("The cache size limit must be greater than 0.")
+
+        self.path: Path = Path(path) if path is not None else default_cache_path()
+        self.max_bytes: int = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._accessed: dict[str, float] = {}
+        self._counts: dict[str, int] = {}
+
+        # Autocommit mode; transactions are opened explicitly below.
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=_BUSY_TIMEOUT_SECONDS, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> ScheduleCache:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    # --------------------
+    # Lookups
+    # --------------------
+    def get(self, key: str) -> PortfolioSchedule | None:
+        """Returns the cached single-loan schedule for a key, or None."""
+        row = self._connection.execute(
+            "SELECT value FROM schedules WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            self._count("misses")
+        else:
+            self._accessed[key] = time.time()
+            self._count("hits")
+        if sum(self._counts.values()) >= _FLUSH_EVERY:
+            self.flush()
+
+        return None if row is None else _decode(row[0])
+
+    def put(self, key: str, schedule: PortfolioSchedule):
+        """Stores a single-loan schedule, evicting old entries past the size limit."""
+        value: bytes = _encode(schedule)
+
+        with self._transaction():
+            self._write_accesses()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO schedules (key, value, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()),
+            )
+            self._evict()
+
+    def flush(self):
+        """Writes the buffered access times and hit and miss counts."""
+        if not self._counts:
+            return
+        with self._transaction():
+            self._write_accesses()
+
+    def schedule(
+        self,
+        loan_amount_cents: int,
+        annual_interest_percent: float,
+        term_months: int,
+        monthly_payment_cents: int,
+    ) -> PortfolioSchedule:
+        """Returns a loan's cents schedule from the cache, computing it on a miss."""
+        key: str = schedule_key(
+            loan_amount_cents, annual_interest_percent, term_months, monthly_payment_cents
+        )
+        schedule: PortfolioSchedule | None = self.get(key)
+        if schedule is None:
+            schedule = amortize_portfolio_cents(
+                loan_amount_cents, annual_interest_percent, term_months, monthly_payment_cents
+            )
+            self.put(key, schedule)
+
+        return schedule
+
+    # --------------------
+    # Maintenance
+    # --------------------
+    def stats(self) -> CacheStats:
+        self.flush()
+        entries, size_bytes = self._connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM schedules"
+        ).fetchone()
+        counters: dict[str, int] = dict(
+            self._connection.execute("SELECT name, value FROM counters").fetchall()
+        )
+
+        return CacheStats(
+            path=self.path,
+            entries=entries,
+            size_bytes=size_bytes,
+            max_bytes=self.max_bytes,
+            hits=counters.get("hits", 0),
+            misses=counters.get("misses", 0),
+            evictions=counters.get("evictions", 0),
+        )
+
+    def clear(self):
+        """Removes every entry and resets the counters."""
+        self._accessed.clear()
+        self._counts.clear()
+        with self._transaction():
+            self._connection.execute("DELETE FROM schedules")
+            self._connection.execute("DELETE FROM counters")
+
+    # --------------------
+    # Internal helpers
+    # --------------------
+    def _transaction(self) -> _Transaction:
+        return _Transaction(self._connection)
+
+    def _count(self, name: str):
+        self._counts[name] = self._counts.get(name, 0) + 1
+
+    def _write_accesses(self):
+        """Writes buffered lookups inside the caller's transaction."""
+        self._connection.executemany(
+            "UPDATE schedules SET last_access = MAX(last_access, ?) WHERE key = ?",
+            [(accessed, key) for key, accessed in self._accessed.items()],
+        )
+        for name, amount in self._counts.items():
+            self._increment(name, amount)
+        self._accessed.clear()
+        self._counts.clear()
+
+    def _increment(self, name: str, amount: int = 1):
+        self._connection.execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def _evict(self):
+        """Deletes least recently used entries until the cache fits its limit."""
+        (size_bytes,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM schedules"
+        ).fetchone()
+        if size_bytes <= self.max_bytes:
+            return
+
+        evicted: list[tuple[str]] = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM schedules ORDER BY last_access"
+        ).fetchall():
+            if size_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            size_bytes -= size
+
+        self._connection.executemany("DELETE FROM schedules WHERE key = ?", evicted)
+        self._increment("evictions", len(evicted))
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back if the body raises."""
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection: sqlite3.Connection = connection
+
+    def __enter__(self):
+        self._connection.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._connection.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+def _encode(schedule: PortfolioSchedule) -> bytes:
+    """Serializes a single-loan schedule as npz bytes of its cents columns."""
+    if schedule.n_loans != 1:
+        raise ValueError("Only single-loan schedules can be cached.")
+
+    buffer: io.BytesIO = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        payoff_months=schedule.payoff_months,
+        **{name: getattr(schedule, name) for name in SCHEDULE_COLUMNS},
+    )
+
+    return buffer.getvalue()
+
+
+def _decode(value: bytes) -> PortfolioSchedule:
+    with np.load(io.BytesIO(value)) as arrays:
+        return PortfolioSchedule(
+            payoff_months=arrays["payoff_months"],
+            **{name: arrays[name] for name in SCHEDULE_COLUMNS},
+        )
@@ -0,0 +1,235 @@
+"""Memory-mapped binary files of portfolio schedules in int64 cents.
+
+Layout (little endian, every section 64-byte aligned):
+
+    header   magic, format version, column count, n_loans, n_months, flags
+    index    payoff month of every loan, int64[n_loans]
+    columns  interest, principal and balance, each int64[n_loans, n_months]
+    months   optionally the same columns again, each int64[n_months, n_loans]
+
+The column blocks are loan-major, so one loan's schedule is contiguous. A
+month's cross-section there is a strided view that touches a page per loan,
+so stores also keep month-major copies by default, making month reads
+contiguous at twice the file size. Months after payoff are zero.
+"""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from loan_utils.portfolio import PortfolioSchedule
+
+MAGIC: bytes = b"LOANSCHD"
+FORMAT_VERSION: int = 1
+STORE_COLUMNS: tuple[str, ...] = ("interest", "principal", "balance")
+
+_HEADER: struct.Struct = struct.Struct("<8sHHqqq")
+_MONTH_MAJOR: int = 1
+_ALIGNMENT: int = 64
+_DTYPE: np.dtype = np.dtype("<i8")
+
+
+class MonthSection(NamedTuple):
+    """One payment month across every loan in a store, as read-only views."""
+
+    month: int
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _layout(
+    n_loans: int, n_months: int, month_major: bool = False
+) -> tuple[int, list[int], list[int], int]:
+    """Returns the index offset, each block's offsets by layout and the file size."""
+    index_offset: int = _aligned(_HEADER.size)
+    offset: int = _aligned(index_offset + n_loans * _DTYPE.itemsize)
+    column_bytes: int = _aligned(n_loans * n_months * _DTYPE.itemsize)
+    n_blocks: int = len(STORE_COLUMNS) * (2 if month_major else 1)
+    offsets: list[int] = [offset + i * column_bytes for i in range(n_blocks)]
+
+    return (
+        index_offset,
+        offsets[: len(STORE_COLUMNS)],
+        offsets[len(STORE_COLUMNS) :],
+        offset + n_blocks * column_bytes,
+    )
+
+
+def _map(path: Path, mode: str, offset: int, shape: tuple[int, ...]) -> np.ndarray:
+    """Maps an int64 section of the file; empty sections cannot be mapped."""
+    if 0 in shape:
+        return np.zeros(shape, dtype=_DTYPE)
+
+    return np.memmap(path, dtype=_DTYPE, mode=mode, offset=offset, shape=shape)
+
+
+class ScheduleWriter:
+    """Writes a store of a known shape chunk by chunk, in loan order.
+
+    The file is allocated up front and each PortfolioSchedule passed to write()
+    fills the next rows, so a million loans never have to be in memory at once.
+    With month_major=False the month-major copies are skipped, halving the file
+    but making month() reads strided.
+    """
+
+    def __init__(
+        self, path: str | Path, n_loans: int, n_months: int, month_major: bool = True
+    ):
+        if n_loans < 0 or n_months < 0:
+            raise ValueError("Store dimensions must not be negative.")
+
+        self.path: Path = Path(path)
+        self.n_loans: int = n_loans
+        self.n_months: int = n_months
+        self.loans_written: int = 0
+
+        index_offset, column_offsets, month_offsets, size = _layout(
+            n_loans, n_months, month_major
+        )
+        flags: int = _MONTH_MAJOR if month_major else 0
+        with open(self.path, "wb") as file:
+            file.write(
+                _HEADER.pack(
+                    MAGIC, FORMAT_VERSION, len(STORE_COLUMNS), n_loans, n_months, flags
+                )
+            )
+            file.truncate(size)
+
+        self._index: np.ndarray = _map(self.path, "r+", index_offset, (n_loans,))
+        self._columns: list[np.ndarray] = [
+            _map(self.path, "r+", offset, (n_loans, n_months)) for offset in column_offsets
+        ]
+        self._months: list[np.ndarray] = [
+            _map(self.path, "r+", offset, (n_months, n_loans)) for offset in month_offsets
+        ]
+
+    def __enter__(self) -> ScheduleWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(check=exc_type is None)
+
+    def write(self, schedule: PortfolioSchedule):
+        """Appends the loans of a cents schedule, e.g. from amortize_portfolio_cents."""
+        start: int = self.loans_written
+        stop: int = start + schedule.n_loans
+        if stop > self.n_loans:
+            raise ValueError(f"The store only holds {self.n_loans} loans.")
+        if schedule.n_months > self.n_months:
+            raise ValueError(f"The store only holds {self.n_months} months.")
+
+        self._index[start:stop] = schedule.payoff_months
+        for name, column in zip(STORE_COLUMNS, self._columns):
+            column[start:stop, : schedule.n_months] = getattr(schedule, name)
+        for name, months in zip(STORE_COLUMNS, self._months):
+            months[: schedule.n_months, start:stop] = getattr(schedule, name).T
+        self.loans_written = stop
+
+    def close(self, check: bool = True):
+        """Flushes the file; with check, raises if fewer loans were written than declared."""
+        for array in [self._index, *self._columns, *self._months]:
+            if isinstance(array, np.memmap):
+                array.flush()
+
+        if check and self.loans_written != self.n_loans:
+            raise ValueError(
+                f"Wrote {self.loans_written} of the {self.n_loans} loans declared."
+            )
+
+
+def write_schedules(path: str | Path, schedule: PortfolioSchedule, month_major: bool = True):
+    """Writes one cents PortfolioSchedule to a store."""
+    with ScheduleWriter(path, schedule.n_loans, schedule.n_months, month_major) as writer:
+        writer.write(schedule)
+
+
+class ScheduleStore:
+    """A read-only, memory-mapped view of a store written by ScheduleWriter.
+
+    Nothing is read until it is indexed; loan() and month() return views into the
+    mapping, so several processes can share one file through the page cache.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path: Path = Path(path)
+
+        with open(self.path, "rb") as file:
+            header: bytes = file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"{self.path} is too short to be a schedule store.")
+
+        magic, version, n_columns, n_loans, n_months, flags = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a schedule store.")
+        if version != FORMAT_VERSION or n_columns != len(STORE_COLUMNS):
+            raise ValueError(f"Unsupported schedule store version {version}.")
+
+        self.month_major: bool = bool(flags & _MONTH_MAJOR)
+        index_offset, column_offsets, month_offsets, size = _layout(
+            n_loans, n_months, self.month_major
+        )
+        if self.path.stat().st_size < size:
+            raise ValueError(f"{self.path} is truncated.")
+
+        self.n_loans: int = n_loans
+        self.n_months: int = n_months
+        self.payoff_months: np.ndarray = _map(self.path, "r", index_offset, (n_loans,))
+        self._columns: dict[str, np.ndarray] = {
+            name: _map(self.path, "r", offset, (n_loans, n_months))
+            for name, offset in zip(STORE_COLUMNS, column_offsets)
+        }
+        self._months: dict[str, np.ndarray] = {
+            name: _map(self.path, "r", offset, (n_months, n_loans))
+            for name, offset in zip(STORE_COLUMNS, month_offsets)
+        }
+
+    def __len__(self) -> int:
+        return self.n_loans
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns a whole loans x months column as a read-only memory map."""
+        return self._columns[name]
+
+    def loan(self, index: int) -> PortfolioSchedule:
+        """Returns one loan's schedule; the stored columns are views, not copies."""
+        if not -self.n_loans <= index < self.n_loans:
+            raise IndexError(f"Loan index {index} is out of range.")
+        index %= self.n_loans
+
+        rows: slice = slice(index, index + 1)
+        interest: np.ndarray = self._columns["interest"][rows]
+        principal: np.ndarray = self._columns["principal"][rows]
+
+        return PortfolioSchedule(
+            payment=interest + principal,
+            interest=interest,
+            principal=principal,
+            balance=self._columns["balance"][rows],
+            payoff_months=self.payoff_months[rows],
+        )
+
+    def month(self, month: int) -> MonthSection:
+        """Returns every loan's amounts for a 1-based payment month.
+
+        The views are contiguous when the store has month-major copies and
+        strided across the loan-major columns otherwise.
+        """
+        if not 1 <= month <= self.n_months:
+            raise IndexError(f"Month {month} is out of range.")
+
+        if self.month_major:
+            return MonthSection(
+                month, *(self._months[name][month - 1] for name in STORE_COLUMNS)
+            )
+        return MonthSection(
+            month, *(self._columns[name][:, month - 1] for name in STORE_COLUMNS)
+        )
@@ -0,0 +1,472 @@
+"""Long-running asyncio loan pricing service over HTTP or a Unix socket.
+
+Endpoints take the CLI's parameter names (price, annual_interest_percentage,
+down_payment_percentage, term_years) as a query string or a JSON body:
+
+    /payment   loan amount and monthly payment, computed on the event loop
+    /summary   payoff month, total interest and total paid
+    /schedule  the full schedule as columns of decimal amounts
+    /stats     request counts, latency percentiles, throughput and batching
+
+Summaries and schedules go through a warm LRU cache bounded in bytes; schedules
+are kept as int64 cents and only formatted when a response is built. Identical
+requests that are already in flight share one computation, and concurrent
+misses are collected for a few milliseconds and amortized together by the
+cents kernel in a process pool, keeping the event loop free.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from loan_utils.cents import format_cents
+from loan_utils.loan import Loan
+from loan_utils.portfolio import amortize_portfolio_cents
+
+# (loan amount cents, annual interest percent, term months, payment cents)
+LoanKey = tuple[int, float, int, int]
+
+LATENCY_WINDOW: int = 10_000
+MAX_BODY_BYTES: int = 64 * 1024
+DEFAULT_CACHE_BYTES: int = 64 * 1024 * 1024
+SCHEDULE_COLUMNS: tuple[str, ...] = ("payment", "principal", "interest", "balance")
+
+# Approximate bytes of a cache entry besides schedule array data: the key, the
+# OrderedDict link and, for summaries, the dict and its strings (about 700 bytes
+# by sys.getsizeof).
+_ENTRY_BYTES: int = 1024
+_WARM_UP_KEY: LoanKey = (100000, 5.0, 12, 8561)
+
+
+class RequestError(ValueError):
+    """A request that cannot be answered; reported to the client as a 400."""
+
+
+class ServiceStats:
+    """Request, latency, cache and batching counters since the service started."""
+
+    def __init__(self):
+        self.started: float = time.perf_counter()
+        self.requests: dict[str, int] = {}
+        self.errors: int = 0
+        self.cache_hits: int = 0
+        self.coalesced: int = 0
+        self.computed: int = 0
+        self.batches: int = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, endpoint: str, seconds: float):
+        self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+        self.latencies.append(seconds)
+
+    def to_json(self) -> dict:
+        uptime: float = time.perf_counter() - self.started
+        total: int = sum(self.requests.values())
+        latencies: list[float] = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(int(fraction * len(latencies)), len(latencies) - 1)] * 1e3
+
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "requests": dict(self.requests),
+            "requests_total": total,
+            "errors": self.errors,
+            "throughput_per_second": round(total / uptime, 3) if uptime else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(0.50), 3),
+                "p95": round(percentile(0.95), 3),
+                "p99": round(percentile(0.99), 3),
+                "max": round(latencies[-1] * 1e3, 3) if latencies else 0.0,
+            },
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "computed": self.computed,
+            "batches": self.batches,
+            "mean_batch_size": round(self.computed / self.batches, 3) if self.batches else 0.0,
+        }
+
+
+def parse_loan(params: dict) -> Loan:
+    """Builds a Loan from request parameters named like the CLI flags."""
+    try:
+        return Loan(
+            annual_interest_percent=float(params["annual_interest_percentage"]),
+            down_payment_percent=float(params.get("down_payment_percentage", 0.0)),
+            purchase_price=float(params["price"]),
+            term_years=int(params["term_years"]),
+        )
+    except KeyError as error:
+        raise RequestError(f"Missing parameter: {error.args[0]}") from None
+    except (TypeError, ValueError) as error:
+        raise RequestError(str(error)) from None
+
+
+def loan_key(loan: Loan) -> LoanKey:
+    return (
+        loan.loan_amount.cents,
+        loan.annual_interest_percent,
+        loan.term_months,
+        loan.monthly_payment.cents,
+    )
+
+
+def amortize_keys(keys: list[LoanKey]) -> list[dict]:
+    """Amortizes a micro-batch in one kernel call and returns each loan's payload.
+
+    Runs in a worker process. The summary is formatted here; the schedule is a
+    (columns, months) int64 array in SCHEDULE_COLUMNS order, formatted by
+    schedule_body only when a response needs it.
+    """
+    principal, percents, terms, payments = zip(*keys)
+    schedule = amortize_portfolio_cents(principal, percents, terms, payments)
+    payloads: list[dict] = []
+
+    for index, key in enumerate(keys):
+        months: int = int(schedule.payoff_months[index])
+        payloads.append(
+            {
+                "summary": {
+                    "loan_amount": format_cents(key[0]),
+                    "monthly_payment": format_cents(key[3]),
+                    "payoff_month": months,
+                    "total_interest": format_cents(schedule.interest[index].sum()),
+                    "total_paid": format_cents(schedule.payment[index].sum()),
+                },
+                "schedule": np.stack(
+                    [getattr(schedule, name)[index, :months] for name in SCHEDULE_COLUMNS]
+                ),
+            }
+        )
+
+    return payloads
+
+
+def schedule_body(schedule: np.ndarray) -> dict:
+    """Formats a (columns, months) cents array as the /schedule response."""
+    body: dict = {"payment_number": list(range(1, schedule.shape[1] + 1))}
+    for name, column in zip(SCHEDULE_COLUMNS, schedule.tolist()):
+        body[name] = [format_cents(value) for value in column]
+
+    return body
+
+
+class LoanService:
+    """Answers payment, summary and schedule queries with caching and batching.
+
+    With workers=0 batches run in the event loop's default thread pool instead
+    of a process pool, which is convenient for tests and tiny deployments.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        batch_window: float = 0.002,
+        max_batch: int = 256,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        if workers < 0 or max_batch < 1 or cache_bytes < 0:
+            raise ValueError("Workers, batch size and cache size must not be negative.")
+
+        self.workers: int = workers
+        self.batch_window: float = batch_window
+        self.max_batch: int = max_batch
+        self.cache_bytes: int = cache_bytes
+        self.stats: ServiceStats = ServiceStats()
+
+        # Summaries and schedules are separate entries keyed by (endpoint, loan),
+        # so summary traffic never holds schedules.
+        self._cache: OrderedDict[tuple[str, LoanKey], dict | np.ndarray] = OrderedDict()
+        self._cached_bytes: int = 0
+        self._in_flight: dict[LoanKey, asyncio.Future] = {}
+        self._queue: asyncio.Queue[LoanKey] | None = None
+        self._batcher: asyncio.Task | None = None
+        self._executor: Executor | None = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        if self.workers:
+            self._executor = self._new_executor()
+            # Start every worker and load the library now, not on the first request.
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, amortize_keys, [_WARM_UP_KEY])
+                    for _ in range(self.workers)
+                )
+            )
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # Forking a process that is running an event loop and helper threads
+        # can deadlock the child on an inherited lock; start workers fresh.
+        return ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    async def close(self):
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    async def __aenter__(self) -> LoanService:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    # --------------------
+    # Endpoints
+    # --------------------
+    async def handle(self, endpoint: str, params: dict) -> tuple[int, dict]:
+        """Returns an HTTP status and JSON body, recording latency per endpoint.
+
+        Failed, timed-out and cancelled requests are recorded too, so /stats
+        shows what clients actually saw. /stats itself is not recorded.
+        """
+        if endpoint == "stats":
+            return 200, self.stats.to_json()
+
+        start: float = time.perf_counter()
+        succeeded: bool = False
+        try:
+            if endpoint == "payment":
+                loan: Loan = parse_loan(params)
+                body: dict = {
+                    "loan_amount": format_cents(loan.loan_amount.cents),
+                    "monthly_payment": format_cents(loan.monthly_payment.cents),
+                }
+            elif endpoint == "summary":
+                body = await self._result(endpoint, loan_key(parse_loan(params)))
+            elif endpoint == "schedule":
+                body = schedule_body(await self._result(endpoint, loan_key(parse_loan(params))))
+            else:
+                requested, endpoint = endpoint, "unknown"
+                return 404, {"error": f"Unknown endpoint: /{requested}"}
+            succeeded = True
+            return 200, body
+        except RequestError as error:
+            return 400, {"error": str(error)}
+        finally:
+            if not succeeded:
+                self.stats.errors += 1
+            self.stats.record(endpoint, time.perf_counter() - start)
+
+    # --------------------
+    # Cache, coalescing and batching
+    # --------------------
+    async def _result(self, endpoint: str, key: LoanKey) -> dict | np.ndarray:
+        cached: dict | np.ndarray | None = self._cache.get((endpoint, key))
+        if cached is not None:
+            self._cache.move_to_end((endpoint, key))
+            self.stats.cache_hits += 1
+            return cached
+
+        future: asyncio.Future | None = self._in_flight.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+        else:
+            future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait(key)
+
+        # Shield so one cancelled client does not cancel the shared result.
+        result: dict | np.ndarray = (await asyncio.shield(future))[endpoint]
+        self._remember((endpoint, key), result)
+
+        return result
+
+    async def _run_batches(self):
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            keys: list[LoanKey] = [await self._queue.get()]
+            deadline: float = loop.time() + self.batch_window
+            while len(keys) < self.max_batch:
+                timeout: float = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    keys.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            self.stats.batches += 1
+            self.stats.computed += len(keys)
+            try:
+                payloads: list[dict] = await loop.run_in_executor(
+                    self._executor, amortize_keys, keys
+                )
+            except Exception as error:
+                for key in keys:
+                    self._in_flight.pop(key).set_exception(error)
+                if isinstance(error, BrokenProcessPool):
+                    # A worker died; replace the pool so later batches succeed.
+                    self._executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = self._new_executor()
+                continue
+
+            for key, payload in zip(keys, payloads):
+                self._in_flight.pop(key).set_result(payload)
+
+    def _remember(self, entry: tuple[str, LoanKey], result: dict | np.ndarray):
+        if entry in self._cache:
+            self._cache.move_to_end(entry)
+            return
+
+        self._cache[entry] = result
+        self._cached_bytes += _entry_bytes(result)
+        while self._cached_bytes > self.cache_bytes:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_bytes -= _entry_bytes(evicted)
+
+
+def _entry_bytes(result: dict | np.ndarray) -> int:
+    if isinstance(result, np.ndarray):
+        return _ENTRY_BYTES + result.nbytes
+    return _ENTRY_BYTES
+
+
+# --------------------
+# HTTP transport
+# --------------------
+_REASONS: dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes] | None:
+    """Reads one HTTP/1.1 request, returning None when the client hangs up."""
+    request_line: bytes = await reader.readline()
+    if not request_line.strip():
+        return None
+
+    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+    headers: dict[str, str] = {}
+    while True:
+        line: bytes = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length: int = int(headers.get("content-length", 0))
+    if length > MAX_BODY_BYTES:
+        raise RequestError("Request body is too large.")
+    body: bytes = await reader.readexactly(length) if length else b""
+
+    return method, target, headers, body
+
+
+def _request_params(target: str, body: bytes) -> tuple[str, dict]:
+    url = urlsplit(target)
+    params: dict = dict(parse_qsl(url.query))
+    if body:
+        try:
+            params.update(json.loads(body))
+        except (json.JSONDecodeError, TypeError, ValueError):
+            raise RequestError("The request body must be a JSON object.") from None
+
+    return url.path.strip("/"), params
+
+
+def _response(status: int, body: dict, keep_alive: bool) -> bytes:
+    content: bytes = json.dumps(body, separators=(",", ":")).encode()
+    head: str = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(content)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+
+    return head.encode("latin-1") + content
+
+
+def connection_handler(service: LoanService):
+    """Returns an asyncio stream callback serving keep-alive HTTP requests."""
+
+    async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive: bool = headers.get("connection", "").lower() != "close"
+                    if method not in ("GET", "POST"):
+                        status, payload = 405, {"error": f"Unsupported method: {method}"}
+                    else:
+                        endpoint, params = _request_params(target, body)
+                        status, payload = await service.handle(endpoint, params)
+                except RequestError as error:
+                    status, payload, keep_alive = 400, {"error": str(error)}, False
+                except (ValueError, asyncio.IncompleteReadError):
+                    break
+                except Exception as error:
+                    status, payload, keep_alive = 500, {"error": repr(error)}, False
+
+                writer.write(_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def start_server(
+    service: LoanService,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket: str | None = None,
+) -> asyncio.Server:
+    """Starts listening on TCP, or on a Unix socket path when one is given."""
+    handler = connection_handler(service)
+    if unix_socket is not None:
+        return await asyncio.start_unix_server(handler, path=unix_socket)
+
+    return await asyncio.start_server(handler, host=host, port=port)
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket: str | None = None,
+    workers: int = 1,
+    batch_window: float = 0.002,
+    cache_bytes: int = DEFAULT_CACHE_BYTES,
+):
+    """Runs the service until cancelled, e.g. with Ctrl-C."""
+    async with LoanService(
+        workers=workers, batch_window=batch_window, cache_bytes=cache_bytes
+    ) as service:
+        server: asyncio.Server = await start_server(service, host, port, unix_socket)
+        address: str = unix_socket or f"http://{host}:{server.sockets[0].getsockname()[1]}"
+        async with server:
+            print(f"Serving on {address}")
+            await server.serve_forever()
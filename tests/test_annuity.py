@@ -0,0 +1,78 @@
+import threading
+
+import numpy as np
+import pytest
+from loan_utils.annuity import (
+    annuity_factor,
+    annuity_factor_cache_info,
+    clear_annuity_factor_cache,
+    monthly_payment_factor,
+    prewarm_annuity_factors,
+)
+from loan_utils.loan import Loan
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_annuity_factor_cache()
+    yield
+    clear_annuity_factor_cache()
+
+
+def test_monthly_payment_factor_is_memoized():
+    for _ in range(3):
+        Loan(
+            annual_interest_percent=6.5,
+            down_payment_percent=20.0,
+            purchase_price=400000,
+            term_years=30,
+        )
+
+    info = annuity_factor_cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+    assert info.currsize == 1
+
+
+def test_prewarm_annuity_factors():
+    count = prewarm_annuity_factors([0.0, 5.5, 6.5], [180, 360])
+
+    assert count == 4
+    assert annuity_factor_cache_info().currsize == 4
+
+    Loan(
+        annual_interest_percent=5.5,
+        down_payment_percent=0.0,
+        purchase_price=100000,
+        term_years=15,
+    )
+    assert annuity_factor_cache_info().hits == 1
+
+
+def test_monthly_payment_factor_threads():
+    rates = [0.001 * step for step in range(1, 51)]
+    results: dict[int, list] = {}
+
+    def work(thread: int):
+        results[thread] = [monthly_payment_factor(rate, 360) for rate in rates]
+
+    threads = [threading.Thread(target=work, args=(thread,)) for thread in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result == results[0] for result in results.values())
+    assert annuity_factor_cache_info().currsize == len(rates)
+
+
+def test_annuity_factor_matches_decimal_factor():
+    rates = np.array([0.0, 0.0025, 0.005416666666666667])
+
+    factors = annuity_factor(rates, 360)
+
+    assert factors[0] == pytest.approx(1 / 360)
+    assert factors[1] == pytest.approx(float(monthly_payment_factor(0.0025, 360)))
+    assert factors[2] == pytest.approx(
+        float(monthly_payment_factor(0.005416666666666667, 360))
+    )
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from loan_utils.arm import ARMTerms, amortize_arm
+from loan_utils.mortgage import Mortgage
+
+TERMS = ARMTerms(margin_percent=2.75, initial_fixed_months=60, reset_months=12)
+
+
+def simulate(principal, initial_percent, terms, index_percents, term_months):
+    """Reference month-by-month loop applying the ARM rules one reset at a time."""
+    rate_percent, balance = initial_percent, principal
+    rates, payments, interest = [], [], []
+    resets = iter(index_percents)
+    for month in range(term_months):
+        reset = month >= terms.initial_fixed_months and (
+            (month - terms.initial_fixed_months) % terms.reset_months == 0
+        )
+        if reset:
+            first = month == terms.initial_fixed_months
+            target = round((next(resets) + terms.margin_percent) / 0.125) * 0.125
+            up = terms.initial_cap_percent if first else terms.periodic_cap_percent
+            down = terms.initial_cap_percent if first else terms.periodic_floor_percent
+            rate_percent = min(max(target, rate_percent - down), rate_percent + up)
+            rate_percent = min(
+                max(rate_percent, terms.lifetime_floor_percent),
+                initial_percent + terms.lifetime_cap_percent,
+            )
+        if month == 0 or reset:
+            rate = rate_percent / 1200
+            payment = balance * rate / (1 - (1 + rate) ** -(term_months - month))
+        rates.append(rate_percent)
+        payments.append(payment)
+        interest.append(balance * rate)
+        balance -= payment - balance * rate
+    return np.array(rates), np.array(payments), sum(interest), balance
+
+
+def test_n_resets_and_segment_starts():
+    assert TERMS.n_resets(360) == 25
+    assert TERMS.n_resets(60) == 0
+    assert ARMTerms(2.0, 84, 6).n_resets(365) == 47
+    assert TERMS.segment_starts(84).tolist() == [0, 60, 72]
+
+
+def test_rate_paths_apply_caps_and_floors():
+    terms = ARMTerms(
+        2.5, initial_cap_percent=5.0, periodic_cap_percent=1.0, lifetime_cap_percent=6.0
+    )
+    rates = terms.rate_paths(4.0, [[9.0, 9.0, 9.0, 9.0], [-5.0, -5.0, 0.0, 0.0]])
+
+    # Up: 5 at the first reset, then 1 per reset, then the lifetime cap of 10.
+    assert rates[0].tolist() == [4.0, 9.0, 10.0, 10.0, 10.0]
+    # Down: to the margin floor, then back up by the periodic cap.
+    assert rates[1].tolist() == [4.0, 2.5, 2.5, 2.5, 2.5]
+
+    asymmetric = ARMTerms(2.0, periodic_floor_percent=0.5, lifetime_floor_percent=1.0)
+    assert asymmetric.rate_paths(6.0, [4.0, -9.0, -9.0]).tolist() == [6.0, 6.0, 5.5, 5.0]
+
+
+def test_rate_paths_round_to_an_eighth():
+    assert TERMS.rate_paths(5.0, [2.31]).tolist() == [5.0, 5.0]
+    assert TERMS.rate_paths(5.0, [2.32]).tolist() == [5.0, 5.125]
+    assert ARMTerms(2.75, rounding_percent=0).rate_paths(5.0, [2.32])[1] == pytest.approx(5.07)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_amortize_arm_matches_month_by_month_loop(seed):
+    rng = np.random.default_rng(seed)
+    index = 3.0 + np.cumsum(rng.normal(0, 0.75, 25))
+    schedule = amortize_arm(350_000.0, 4.25, TERMS, index, 360)
+    rates, payments, interest, balance = simulate(350_000.0, 4.25, TERMS, index, 360)
+
+    np.testing.assert_allclose(schedule.monthly_rates(), rates)
+    np.testing.assert_allclose(schedule.monthly_payments(), payments, rtol=1e-10)
+    assert schedule.total_interest() == pytest.approx(interest, rel=1e-10)
+    assert schedule.balances[-1] == pytest.approx(balance, abs=1e-6)
+    assert schedule.balances[-1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_amortize_arm_broadcasts_loans_and_scenarios():
+    rng = np.random.default_rng(3)
+    principal = np.array([[100_000.0], [250_000.0], [600_000.0]])
+    initial = np.array([[3.5], [5.0], [6.25]])
+    paths = 4.0 + np.cumsum(rng.normal(0, 0.5, (200, 30)), axis=1)
+    schedule = amortize_arm(principal, initial, TERMS, paths, 360)
+
+    assert schedule.payments.shape == (3, 200, 26)
+    for i in range(3):
+        single = amortize_arm(principal[i, 0], initial[i, 0], TERMS, paths, 360)
+        np.testing.assert_allclose(schedule.payments[i], single.payments)
+        np.testing.assert_allclose(schedule.total_interest()[i], single.total_interest())
+
+    loans = amortize_arm(principal[:, 0], initial[:, 0], TERMS, paths[:3], 360)
+    np.testing.assert_allclose(loans.payments, schedule.payments[np.arange(3), np.arange(3)])
+
+
+def test_amortize_arm_rejects_short_rate_paths():
+    with pytest.raises(ValueError):
+        amortize_arm(100_000.0, 5.0, TERMS, np.zeros((10, 24)), 360)
+    with pytest.raises(ValueError):
+        ARMTerms(2.0, initial_fixed_months=0)
+    with pytest.raises(ValueError):
+        ARMTerms(2.0, periodic_cap_percent=-1.0)
+
+
+def test_mortgage_arm_schedule_with_flat_rate_matches_fixed_loan():
+    mortgage = Mortgage(5.5, 0, 20, 400_000, 30)
+    terms = ARMTerms(2.75, lifetime_floor_percent=0.0)
+    schedule = mortgage.arm_schedule(terms, np.full((4, 25), 2.75))
+
+    np.testing.assert_allclose(
+        schedule.payments, float(mortgage.monthly_payment.amount), atol=0.005
+    )
+    assert schedule.max_payment().shape == (4,)
+    assert mortgage.arm_schedule(terms, np.full(25, 8.0)).max_payment() > schedule.max_payment()[0]
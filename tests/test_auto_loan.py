@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+from loan_utils.auto_loan import AutoLoan
+from loan_utils.monte_carlo import BootstrapReturns, LognormalReturns
+
+
+@pytest.fixture
+def auto_loan() -> AutoLoan:
+    return AutoLoan(
+        annual_interest_percent=6.99,
+        down_payment_percent=0.0,
+        purchase_price=21893.01,
+        term_years=4,
+        extra_insurance_monthly_payment=71.75,
+        sp500_ror=0.10,
+        inflation_rate=0.03,
+    )
+
+
+def expected_margin(auto_loan: AutoLoan, monthly_return: float) -> float:
+    """The margin from a plain month-by-month loop with a constant return."""
+    rate = auto_loan.monthly_interest_rate
+    loan_amount = float(auto_loan.loan_amount.amount)
+    payment = loan_amount * rate / (1 - (1 + rate) ** -auto_loan.term_months)
+    loan_balance = savings_balance = loan_amount
+    total_loan_interest = total_savings_interest = present_value = 0.0
+
+    for month in range(auto_loan.term_months):
+        loan_interest = loan_balance * rate
+        principal = payment - loan_interest
+        loan_balance -= principal
+        savings_interest = savings_balance * monthly_return
+        savings_balance += savings_interest - principal
+        total_loan_interest += loan_interest
+        total_savings_interest += savings_interest
+        present_value += principal / (1 + auto_loan.inflation_rate / 12) ** month
+
+    return (
+        total_savings_interest
+        + loan_amount
+        - present_value
+        - total_loan_interest
+        - 71.75 * auto_loan.term_months
+    )
+
+
+def test_simulate_margin_is_reproducible(auto_loan):
+    first = auto_loan.simulate_margin(n_paths=25_000, seed=42)
+    second = auto_loan.simulate_margin(n_paths=25_000, seed=42, workers=2)
+    other = auto_loan.simulate_margin(n_paths=25_000, seed=43)
+
+    assert first.margins.shape == (25_000,)
+    np.testing.assert_array_equal(first.margins, second.margins)
+    assert not np.array_equal(first.margins, other.margins)
+
+
+def test_simulate_margin_without_volatility(auto_loan):
+    distribution = auto_loan.simulate_margin(n_paths=10, annual_volatility=0.0, seed=1)
+    monthly_return = 0.10 / 12
+
+    np.testing.assert_allclose(
+        distribution.margins, expected_margin(auto_loan, monthly_return)
+    )
+    assert distribution.std == pytest.approx(0.0, abs=1e-6)
+
+
+def test_simulate_margin_bootstrap(auto_loan, tmp_path):
+    returns_file = tmp_path / "returns.txt"
+    returns_file.write_text("# monthly S&P 500 returns\n0.01\n0.01\n")
+
+    distribution = auto_loan.simulate_margin(n_paths=100, returns_file=returns_file)
+
+    np.testing.assert_allclose(distribution.margins, expected_margin(auto_loan, 0.01))
+    assert distribution.probability_positive() in (0.0, 1.0)
+
+
+def test_margin_distribution_statistics(auto_loan):
+    distribution = auto_loan.simulate_margin(n_paths=20_000, seed=7)
+    low, median, high = distribution.percentile([5, 50, 95])
+
+    assert low < median < high
+    assert 0.0 < distribution.probability_positive() < 1.0
+
+
+@pytest.mark.parametrize(
+    "make_returns",
+    [
+        lambda: LognormalReturns(0.1, -0.1),  # negative volatility
+        lambda: BootstrapReturns([]),  # no history
+    ],
+)
+def test_invalid_return_models(make_returns):
+    with pytest.raises(ValueError):
+        make_returns()
+
+
+def test_auto_loan_details_closed_form_matches_loop(auto_loan):
+    analysis = auto_loan.auto_loan_details()
+
+    assert float(analysis.margin.amount) == pytest.approx(
+        expected_margin(auto_loan, 0.10 / 12), abs=0.02
+    )
+    assert analysis.total_extra_insurance.amount == 71.75 * 48
+    assert analysis.loan_balance is None
+
+
+def test_auto_loan_details_matches_simulation_without_volatility(auto_loan):
+    analysis = auto_loan.auto_loan_details()
+    distribution = auto_loan.simulate_margin(n_paths=1, annual_volatility=0.0)
+
+    assert float(analysis.margin.amount) == pytest.approx(distribution.mean, abs=0.02)
+
+
+@pytest.mark.parametrize(
+    "annual_interest_percent, sp500_ror",
+    [
+        (0.0, 0.10),  # interest-free loan
+        (6.0, 0.06),  # savings rate equals loan rate
+        (6.0, 0.0),  # cash earns nothing
+    ],
+)
+def test_auto_loan_details_edge_rates(annual_interest_percent, sp500_ror):
+    auto_loan: AutoLoan = AutoLoan(
+        annual_interest_percent=annual_interest_percent,
+        down_payment_percent=0.0,
+        purchase_price=30000,
+        term_years=5,
+        sp500_ror=sp500_ror,
+    )
+
+    analysis = auto_loan.auto_loan_details(monthly_detail=True)
+    detail_interest = analysis.savings_interest.get_balance(59)
+
+    assert abs(analysis.total_savings_interest.amount - detail_interest.amount) < 1
+    if annual_interest_percent == 0.0:
+        assert analysis.total_loan_interest.amount == 0
+
+
+def test_auto_loan_details_monthly_detail(auto_loan):
+    analysis = auto_loan.auto_loan_details(monthly_detail=True)
+
+    assert len(analysis.savings_balance.extract_values()) == 48
+    assert abs(analysis.loan_balance.get_balance(47).amount) < 1
+    assert "Margin: " in str(analysis)
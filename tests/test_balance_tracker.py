@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from loan_utils.balance_tracker import BalanceTracker
+from loan_utils.dollar import Dollar
+
+
+def test_balance_tracker_starts_empty():
+    tracker: BalanceTracker = BalanceTracker(360)
+
+    assert len(tracker) == 0
+    assert len(tracker.extract_values()) == 0
+    with pytest.raises(IndexError):
+        tracker.get_balance(0)
+
+
+def test_balance_tracker_grows_past_initial_capacity():
+    tracker: BalanceTracker = BalanceTracker()
+
+    for month in range(100):
+        tracker.append(Dollar(month))
+
+    assert len(tracker) == 100
+    assert tracker.get_balance(99) == Dollar(99)
+    assert tracker.extract_values().cents.tolist() == [100 * m for m in range(100)]
+
+
+def test_balance_tracker_extract_values_is_a_view():
+    tracker: BalanceTracker = BalanceTracker(12)
+    tracker.append(Dollar("1.50"))
+    tracker.append(Dollar("2.25"))
+
+    values = tracker.extract_values()
+    tracker.update_balance(0, Dollar(3))
+
+    assert values[0] == Dollar(3)
+    np.testing.assert_array_equal(np.asarray(values), [3.0, 2.25])
+
+
+def test_balance_tracker_cumulative_and_diff():
+    tracker: BalanceTracker = BalanceTracker(4)
+    for amount in ["10.00", "20.50", "-5.25"]:
+        tracker.append(Dollar(amount))
+
+    assert tracker.cumulative().cents.tolist() == [1000, 3050, 2525]
+    assert tracker.diff().cents.tolist() == [1000, 1050, -2575]
+
+
+def test_balance_tracker_update_balance():
+    tracker: BalanceTracker = BalanceTracker(2)
+    tracker.update_balance(0, Dollar(1))
+    tracker.update_balance(1, Dollar(2))
+    tracker.update_balance(1, Dollar(5))
+
+    assert tracker.extract_values().cents.tolist() == [100, 500]
+    with pytest.raises(IndexError):
+        tracker.update_balance(3, Dollar(1))
+
+
+@pytest.mark.parametrize("amount", [1, 1.5, "1", None])
+def test_balance_tracker_rejects_non_dollars(amount):
+    tracker: BalanceTracker = BalanceTracker(2)
+
+    with pytest.raises(TypeError):
+        tracker.append(amount)
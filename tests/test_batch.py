@@ -0,0 +1,103 @@
+import csv
+import io
+
+import pytest
+from loan_utils.batch import read_loans, run_batch
+from loan_utils.loan import Loan
+
+LOANS_CSV: str = """id,price,annual_interest_percentage,down_payment_percentage,term_years
+a,400000,6.5,20,30
+b,21893.01,6.99,0,4
+c,abc,6.5,20,30
+d,250000,0,10,15
+"""
+
+LOANS_JSONL: str = """{"id": "a", "price": 400000, "annual_interest_percentage": 6.5, "down_payment_percentage": 20, "term_years": 30}
+
+{"price": 21893.01, "annual_interest_percentage": 6.99, "down_payment_percentage": 0, "term_years": 4}
+"""
+
+
+def run(text: str, input_format: str = "csv", **kwargs) -> tuple[list[dict], str]:
+    output: io.StringIO = io.StringIO()
+    errors: io.StringIO = io.StringIO()
+    run_batch(read_loans(io.StringIO(text), input_format), output, errors=errors, **kwargs)
+
+    return list(csv.DictReader(io.StringIO(output.getvalue()))), errors.getvalue()
+
+
+def test_run_batch_summaries():
+    rows, errors = run(LOANS_CSV)
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20,
+        purchase_price=400000,
+        term_years=30,
+    )
+    schedule = loan.amortization_schedule()
+
+    assert [row["id"] for row in rows] == ["a", "b", "d"]
+    assert rows[0]["monthly_payment"] == str(loan.monthly_payment.amount)
+    assert rows[0]["payoff_month"] == str(len(schedule))
+    assert rows[0]["total_interest"] == str(schedule["Total Interest"].iloc[-1])
+    assert "record 3" in errors
+
+
+def test_run_batch_schedules():
+    rows, _ = run(LOANS_CSV, schedules=True, chunk_size=1)
+
+    assert len([row for row in rows if row["id"] == "b"]) == 48
+    assert rows[359]["balance"] == "0.00"
+
+
+def test_run_batch_large_loan_matches_loan_schedule():
+    text: str = LOANS_CSV + "big,250000000,6.5,0,30\n"
+    loan: Loan = Loan(6.5, 0, 250_000_000, 30)
+    expected = list(loan.iter_schedule())
+
+    rows, _ = run(text)
+    assert rows[-1]["id"] == "big"
+    assert rows[-1]["total_interest"] == str(expected[-1].total_interest.amount)
+    assert rows[-1]["payoff_month"] == str(len(expected))
+
+    rows, _ = run(text, schedules=True)
+    big = [row for row in rows if row["id"] == "big"]
+    assert [row["interest"] for row in big] == [str(row.interest.amount) for row in expected]
+    assert [row["balance"] for row in big] == [str(row.balance.amount) for row in expected]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_run_batch_workers_keep_input_order(chunk_size):
+    text: str = LOANS_CSV + "".join(
+        f"x{index},{100000 + index},5.5,10,15\n" for index in range(25)
+    )
+
+    serial, _ = run(text, chunk_size=chunk_size)
+    parallel, _ = run(text, chunk_size=chunk_size, workers=2)
+
+    assert parallel == serial
+    assert len(serial) == 28
+
+
+def test_run_batch_jsonl():
+    rows, errors = run(LOANS_JSONL, input_format="jsonl")
+
+    assert [row["id"] for row in rows] == ["a", "2"]
+    assert errors == ""
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch_jsonl_reports_invalid_lines(workers):
+    lines = LOANS_JSONL.splitlines()
+    text = "\n".join([lines[0], '{"id": "broken", "price": 4', lines[2], "not json"]) + "\n"
+
+    rows, errors = run(text, input_format="jsonl", workers=workers, chunk_size=1)
+
+    assert [row["id"] for row in rows] == ["a", "3"]
+    assert errors.splitlines()[0].startswith("record 2: invalid JSON")
+    assert errors.splitlines()[1].startswith("record 4: invalid JSON")
+
+
+def test_run_batch_invalid_arguments():
+    with pytest.raises(ValueError):
+        run(LOANS_CSV, workers=0)
@@ -0,0 +1,178 @@
+import calendar as stdlib_calendar
+from datetime import date
+
+import numpy as np
+import pytest
+from loan_utils.calendar import (
+    Calendar,
+    PaymentCalendar,
+    accrual_days,
+    add_months,
+    days_in_month,
+    is_leap_year,
+    payment_dates,
+    year_fractions,
+)
+from loan_utils.loan import Loan
+
+
+@pytest.mark.parametrize("year", [1900, 2000, 2023, 2024, 2100, 2400])
+def test_calendar_leap_years(year):
+    assert is_leap_year(year) == stdlib_calendar.isleap(year)
+    assert Calendar(year).months["February"] == stdlib_calendar.monthrange(year, 2)[1]
+    assert sum(Calendar(year).months.values()) == (366 if is_leap_year(year) else 365)
+
+
+def test_calendar_month_table_is_shared_and_read_only():
+    assert Calendar(2024).months is Calendar(2024).months
+    with pytest.raises(TypeError):
+        Calendar(2024).months["February"] = 30
+
+
+@pytest.mark.parametrize("start", [date(2024, 1, 1), date(2024, 1, 31), date(2023, 8, 30)])
+def test_payment_dates_match_add_months(start):
+    dates = payment_dates(start, 400)
+
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert dates.tolist() == [add_months(start, month) for month in range(400)]
+
+
+def test_payment_dates_end_of_month():
+    dates = payment_dates(date(2024, 1, 31), 4, end_of_month=True).tolist()
+    clamped = payment_dates(date(2024, 2, 29), 3).tolist()
+
+    assert dates == [
+        date(2024, 1, 31),
+        date(2024, 2, 29),
+        date(2024, 3, 31),
+        date(2024, 4, 30),
+    ]
+    assert payment_dates(date(2024, 2, 29), 2, end_of_month=True)[1] == np.datetime64("2024-03-31")
+    assert clamped == [date(2024, 2, 29), date(2024, 3, 29), date(2024, 4, 29)]
+
+
+@pytest.mark.parametrize(
+    "roll, expected",
+    [
+        ("none", date(2024, 6, 1)),  # a Saturday
+        ("following", date(2024, 6, 3)),
+        ("preceding", date(2024, 5, 31)),
+    ],
+)
+def test_payment_dates_business_day_roll(roll, expected):
+    assert payment_dates(date(2024, 5, 1), 2, roll=roll).tolist()[1] == expected
+
+
+def test_payment_dates_modified_following_and_holidays():
+    # 2024-08-31 is a Saturday; following would leave the month.
+    dates = payment_dates(date(2024, 7, 31), 2, roll="modified_following").tolist()
+    holiday = payment_dates(
+        date(2024, 12, 25), 1, roll="following", holidays=[date(2024, 12, 25)]
+    ).tolist()
+
+    assert dates == [date(2024, 7, 31), date(2024, 8, 30)]
+    assert holiday == [date(2024, 12, 26)]
+
+
+@pytest.mark.parametrize(
+    "frequency, second",
+    [
+        ("quarterly", date(2024, 4, 15)),
+        ("biweekly", date(2024, 1, 29)),
+        ("annual", date(2025, 1, 15)),
+    ],
+)
+def test_payment_dates_frequencies(frequency, second):
+    assert payment_dates(date(2024, 1, 15), 2, frequency=frequency).tolist()[1] == second
+
+
+def test_payment_dates_cached_read_only():
+    calendar = PaymentCalendar(roll="following")
+    dates = calendar.dates(date(2024, 1, 1), 360)
+
+    assert calendar.dates(date(2024, 1, 1), 360) is dates
+    assert PaymentCalendar(roll="following").dates(date(2024, 1, 1), 360) is dates
+    with pytest.raises(ValueError):
+        dates[0] = np.datetime64("2000-01-01")
+
+
+def test_payment_calendar_rejects_unknown_conventions():
+    with pytest.raises(ValueError):
+        PaymentCalendar(frequency="daily")
+    with pytest.raises(ValueError):
+        PaymentCalendar(roll="nearest")
+    with pytest.raises(ValueError):
+        accrual_days([date(2024, 1, 1)], [date(2024, 2, 1)], "ACT/ACT")
+
+
+@pytest.mark.parametrize(
+    "start, end, act, thirty",
+    [
+        (date(2024, 1, 31), date(2024, 2, 29), 29, 29),
+        (date(2024, 1, 30), date(2024, 3, 31), 61, 60),
+        (date(2024, 1, 15), date(2024, 3, 31), 76, 76),
+        (date(2023, 12, 31), date(2024, 12, 31), 366, 360),
+        (date(2024, 2, 29), date(2024, 3, 31), 31, 32),
+    ],
+)
+def test_accrual_days(start, end, act, thirty):
+    assert accrual_days([start], [end], "ACT/365").tolist() == [act]
+    assert accrual_days([start], [end], "30/360").tolist() == [thirty]
+    assert year_fractions([start], [end], "ACT/360")[0] == pytest.approx(act / 360)
+    assert year_fractions([start], [end], "ACT/365")[0] == pytest.approx(act / 365)
+
+
+def test_accrual_periods():
+    calendar = PaymentCalendar()
+    starts, ends = calendar.accrual_periods(date(2024, 2, 1), 12)
+
+    assert starts[0] == np.datetime64("2024-01-01")
+    np.testing.assert_array_equal(starts[1:], ends[:-1])
+    assert accrual_days(starts, ends).sum() == 366
+    assert np.all(accrual_days(starts, ends, "30/360") == 30)
+
+
+def test_loan_schedule_uses_payment_calendar():
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20,
+        purchase_price=400000,
+        term_years=30,
+    )
+    calendar = PaymentCalendar(roll="following")
+
+    schedule = loan.amortization_schedule(date(2024, 6, 1), calendar)
+    rows = list(loan.iter_schedule(date(2024, 6, 1), calendar))
+
+    assert schedule["Payment Date"].iloc[0] == np.datetime64("2024-06-03")
+    assert rows[1].payment_date == date(2024, 7, 1)
+    assert [row.payment_date for row in rows] == (
+        loan.payment_dates(date(2024, 6, 1), calendar).tolist()
+    )
+    assert all(day.weekday() < 5 for day in schedule["Payment Date"].dt.date)
+
+
+@pytest.mark.parametrize("frequency", ["biweekly", "weekly", "quarterly"])
+def test_loan_schedules_reject_non_monthly_calendars(frequency):
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20,
+        purchase_price=400000,
+        term_years=30,
+    )
+    calendar = PaymentCalendar(frequency=frequency)
+
+    with pytest.raises(ValueError, match=frequency):
+        loan.payment_dates(date(2024, 6, 1), calendar)
+    with pytest.raises(ValueError):
+        next(loan.iter_schedule(date(2024, 6, 1), calendar))
+    with pytest.raises(ValueError):
+        loan.amortization_schedule(date(2024, 6, 1), calendar)
+    with pytest.raises(ValueError):
+        loan.daily_accrual_schedule(date(2024, 6, 1), calendar=calendar)
+
+
+def test_days_in_month_table():
+    assert [days_in_month(2100, month) for month in range(1, 13)] == [
+        stdlib_calendar.monthrange(2100, month)[1] for month in range(1, 13)
+    ]
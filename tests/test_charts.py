@@ -0,0 +1,97 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from loan_utils.auto_loan import AutoLoan
+from loan_utils.charts import ChartSpec, Series, build_figure, downsample, render_charts
+
+PNG_MAGIC: bytes = b"\x89PNG"
+
+
+def make_spec(index: int = 0, months: int = 360) -> ChartSpec:
+    balance: np.ndarray = np.linspace(300000, 0, months) + index
+    return ChartSpec(
+        title=f"Loan {index}",
+        series=(Series("Balance", balance), Series("Interest", np.cumsum(balance) * 0.005)),
+    )
+
+
+def test_downsample_short_series_unchanged():
+    x, y = downsample([3.0, 1.0, 2.0], max_points=10)
+
+    np.testing.assert_array_equal(x, [1, 2, 3])
+    np.testing.assert_array_equal(y, [3.0, 1.0, 2.0])
+
+
+def test_downsample_keeps_extremes_and_ends():
+    values: np.ndarray = np.sin(np.linspace(0, 20, 100_000))
+    values[12345] = 5.0
+    values[54321] = -5.0
+
+    x, y = downsample(values, max_points=500)
+
+    assert len(x) <= 502
+    assert np.all(np.diff(x) > 0)
+    assert (x[0], x[-1]) == (1, 100_000)
+    assert y.max() == 5.0 and y.min() == -5.0
+    np.testing.assert_array_equal(y, values[x - 1])
+
+
+def test_build_figure_without_pyplot():
+    # A fresh interpreter shows whether pyplot was pulled in.
+    code: str = (
+        "import sys, io\n"
+        "from loan_utils.mortgage import Mortgage\n"
+        "mortgage = Mortgage(6.5, 5000, 20.0, 400000, 30)\n"
+        "figure = mortgage.mortgage_details(extra_payment=200)\n"
+        "figure.savefig(io.BytesIO(), format='png')\n"
+        "assert 'matplotlib.pyplot' not in sys.modules\n"
+        "print(len(figure.axes[0].lines))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.split()[-1] == "2"
+
+
+def test_build_figure_series():
+    figure = build_figure(make_spec(), max_points=100)
+    lines = figure.axes[0].lines
+
+    assert [line.get_label() for line in lines] == ["Balance", "Interest"]
+    assert len(lines[0].get_xdata()) <= 102
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_charts(tmp_path, workers):
+    jobs = [(make_spec(i), tmp_path / f"loan_{i}.{'svg' if i % 2 else 'png'}") for i in range(5)]
+
+    rendered = render_charts(iter(jobs), workers=workers, chunk_size=2)
+
+    assert rendered == [path for _, path in jobs]
+    assert rendered[0].read_bytes().startswith(PNG_MAGIC)
+    assert b"<svg" in rendered[1].read_bytes()
+
+
+def test_render_charts_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        render_charts([(make_spec(), tmp_path / "loan.jpg")])
+
+
+def test_auto_loan_chart(tmp_path):
+    auto_loan: AutoLoan = AutoLoan(
+        annual_interest_percent=6.99,
+        down_payment_percent=0.0,
+        purchase_price=21893.01,
+        term_years=4,
+    )
+
+    with pytest.raises(ValueError):
+        auto_loan.auto_loan_details().chart()
+
+    spec: ChartSpec = auto_loan.auto_loan_details(monthly_detail=True).chart()
+    assert len(spec.series) == 4
+    assert all(len(series.values) == 48 for series in spec.series)
+    assert render_charts([(spec, tmp_path / "auto.png")])[0].exists()
@@ -0,0 +1,177 @@
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from loan_utils.calendar import accrual_days, payment_dates
+from loan_utils.daily_accrual import YEAR_BASIS, accrue_schedule
+from loan_utils.loan import Loan
+
+FUNDED = np.datetime64("2024-01-01")
+
+
+def reference_schedule(principal, percent, funded, dates, payments, convention):
+    """Accrues one loan a payment at a time with exact Decimal arithmetic."""
+    rate = Decimal(repr(percent)) / 100 / YEAR_BASIS[convention]
+    balance, unpaid, start = principal, 0, funded
+    rows = []
+    for k, (paid_on, amount) in enumerate(zip(dates, payments)):
+        days = int(accrual_days(start, paid_on, convention))
+        interest = int((balance * rate * days).quantize(Decimal(1), rounding="ROUND_HALF_UP"))
+        due = unpaid + interest
+        amount = balance + due if k == len(dates) - 1 else min(amount, balance + due)
+        to_interest = min(amount, due)
+        balance -= amount - to_interest
+        unpaid = due - to_interest
+        rows.append((interest, amount, balance, unpaid))
+        start = paid_on
+        if balance == 0 and unpaid == 0:
+            break
+    return rows
+
+
+@pytest.mark.parametrize("convention", ["ACT/365", "ACT/360", "30/360"])
+@pytest.mark.parametrize("percent", [6.99, 4.5, 0.1 + 0.2])
+def test_accrue_schedule_matches_reference(convention, percent):
+    dates = payment_dates(date(2024, 1, 31), 24)
+    schedule = accrue_schedule([2_500_000], percent, FUNDED, dates[None, :], [110_000], convention)
+    expected = reference_schedule(2_500_000, percent, FUNDED, dates, [110_000] * 24, convention)
+
+    n = len(expected)
+    assert schedule.payoff_payments.tolist() == [n]
+    assert schedule.interest[0, :n].tolist() == [row[0] for row in expected]
+    assert schedule.payment[0, :n].tolist() == [row[1] for row in expected]
+    assert schedule.balance[0, :n].tolist() == [row[2] for row in expected]
+    assert schedule.unpaid_interest[0, :n].tolist() == [row[3] for row in expected]
+    assert schedule.balance[0, -1] == 0
+
+
+def test_late_payments_cost_interest_and_early_payments_save_it():
+    scheduled = payment_dates(date(2024, 2, 1), 12)
+    late = scheduled + 10
+    early = scheduled - 10
+
+    def total(dates):
+        return accrue_schedule([1_000_000], 7.5, FUNDED, dates[None, :], [90_000]).total_interest()
+
+    assert total(early)[0] < total(scheduled)[0] < total(late)[0]
+
+
+def test_partial_payment_carries_unpaid_interest():
+    dates = np.array(["2024-02-01", "2024-03-01", "2024-04-01"], dtype="datetime64[D]")
+    schedule = accrue_schedule([1_000_000], 12.0, FUNDED, dates[None, :], [[5_000, 50_000, 0]])
+
+    first_interest = schedule.interest[0, 0]
+    assert schedule.principal[0, 0] == 0
+    assert schedule.unpaid_interest[0, 0] == first_interest - 5_000
+    assert schedule.balance[0, 0] == 1_000_000
+    # Unpaid interest is paid before principal and never itself accrues interest.
+    assert schedule.interest[0, 1] == round(1_000_000 * 0.12 * 29 / 365)
+    assert schedule.unpaid_interest[0, 1] == 0
+    assert schedule.balance[0, -1] == 0 and schedule.unpaid_interest[0, -1] == 0
+
+
+def test_batch_matches_single_loans():
+    rng = np.random.default_rng(7)
+    n_loans, n_payments = 40, 36
+    principal = rng.integers(100_000, 50_000_000, n_loans)
+    percents = rng.uniform(0.0, 15.0, n_loans).round(3)
+    funded = FUNDED + rng.integers(0, 60, n_loans)
+    dates = funded[:, None] + np.cumsum(rng.integers(20, 40, (n_loans, n_payments)), axis=1)
+    payments = principal // 30
+    dates[::5, 30:] = np.datetime64("NaT")
+
+    batch = accrue_schedule(principal, percents, funded, dates, payments, "ACT/360")
+
+    for i in range(n_loans):
+        single = accrue_schedule(
+            principal[i : i + 1], percents[i], funded[i], dates[i : i + 1], payments[i], "ACT/360"
+        )
+        np.testing.assert_array_equal(batch.interest[i], single.interest[0])
+        np.testing.assert_array_equal(batch.balance[i], single.balance[0])
+        np.testing.assert_array_equal(batch.payoff_payments[i], single.payoff_payments[0])
+
+    assert np.all(batch.payoff_payments[::5] <= 30)
+    assert np.all(batch.balance[:, -1] == 0)
+
+
+def test_wide_rates_only_affect_their_own_loans():
+    dates = payment_dates(date(2024, 1, 31), 24)
+    percents = np.array([6.99, 0.1 + 0.2, 4.5, float(np.linspace(1.0, 9.0, 10)[3])])
+    principal = np.array([2_500_000, 40_000_000, 900_000, 3_000_000_000])
+    payments = principal // 20
+    batch = accrue_schedule(principal, percents, FUNDED, np.tile(dates, (4, 1)), payments)
+
+    for i in range(4):
+        expected = reference_schedule(
+            int(principal[i]), float(percents[i]), FUNDED, dates, [payments[i]] * 24, "ACT/365"
+        )
+        n = len(expected)
+        assert batch.interest[i, :n].tolist() == [row[0] for row in expected]
+        assert batch.balance[i, :n].tolist() == [row[2] for row in expected]
+
+
+def test_missing_payments_leave_the_balance_open_without_pay_off_final():
+    dates = np.array([["2024-02-01", "2024-03-01", "NaT"]], dtype="datetime64[D]")
+    schedule = accrue_schedule([1_000_000], 6.0, FUNDED, dates, [10_000], pay_off_final=False)
+
+    assert schedule.payoff_payments.tolist() == [2]
+    assert schedule.days[0].tolist() == [31, 29, 0]
+    assert schedule.payment[0, 2] == 0
+    assert schedule.balance[0, 2] == schedule.balance[0, 1] > 0
+
+
+@pytest.mark.parametrize(
+    "dates, convention",
+    [
+        (["2024-02-01", "NaT", "2024-04-01"], "ACT/365"),
+        (["2024-02-01", "2024-01-15", "2024-04-01"], "ACT/365"),
+        (["2024-02-01", "2024-03-01", "2024-04-01"], "ACT/366"),
+    ],
+)
+def test_accrue_schedule_rejects_invalid_input(dates, convention):
+    with pytest.raises(ValueError):
+        accrue_schedule(
+            [1_000_000], 6.0, FUNDED, np.array([dates], dtype="datetime64[D]"), [1_000], convention
+        )
+
+
+def test_loan_daily_accrual_30_360_matches_monthly_schedule():
+    loan = Loan(6.0, 20.0, 300_000, 30)
+    schedule = loan.daily_accrual_schedule(date(2024, 2, 1), convention="30/360")
+    monthly = [row.interest.cents for row in loan.iter_schedule(date(2024, 2, 1))]
+
+    assert schedule.interest[0].tolist()[:-1] == monthly[:-1]
+    assert schedule.payoff_payments.tolist() == [loan.term_months]
+    assert schedule.balance[0, -1] == 0
+
+
+def test_loan_daily_accrual_with_paid_dates():
+    loan = Loan(5.0, 0.0, 10_000, 1)
+    scheduled = loan.payment_dates(date(2024, 2, 1))
+    on_time = loan.daily_accrual_schedule(date(2024, 2, 1))
+    late = loan.daily_accrual_schedule(date(2024, 2, 1), paid_dates=scheduled + 5)
+    funded = loan.daily_accrual_schedule(date(2024, 2, 1), funding_date=date(2024, 1, 15))
+
+    assert on_time.days[0, 0] == 31
+    assert funded.days[0, 0] == 17
+    assert late.total_interest()[0] > on_time.total_interest()[0] > funded.total_interest()[0]
+
+
+def test_loan_daily_accrual_payment_history_leaves_the_balance_open():
+    loan = Loan(6.0, 20.0, 400_000, 30)
+    scheduled = loan.payment_dates(date(2024, 2, 1))
+    history = loan.daily_accrual_schedule(
+        date(2024, 2, 1), paid_dates=scheduled[:12], convention="30/360"
+    )
+    expected = [row.balance.cents for row in loan.iter_schedule(date(2024, 2, 1))][:12]
+
+    assert history.payment[0].tolist() == [loan.monthly_payment.cents] * 12
+    assert history.balance[0].tolist() == expected
+    assert history.payoff_payments.tolist() == [12]
+
+    settled = loan.daily_accrual_schedule(
+        date(2024, 2, 1), paid_dates=scheduled[:12], pay_off_final=True
+    )
+    assert settled.balance[0, -1] == 0
+    assert settled.payment[0, -1] > loan.monthly_payment.cents
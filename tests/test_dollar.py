@@ -674,3 +674,55 @@ def test_multiply_by_invalid(invalid_rate_case):
 
     with pytest.raises(Exception):
         dollar.multiply_by(invalid_rate_case)
+
+
+# --------------------
+# Integer cents
+# --------------------
+@pytest.mark.parametrize(
+    "cents, expected",
+    [
+        (0, "0.00"),  # zero
+        (1, "0.01"),  # one cent
+        (-5057, "-50.57"),  # negative
+        (10**22, "100000000000000000000.00"),  # very large
+    ],
+)
+def test_from_cents(cents, expected):
+    dollar: Dollar = Dollar.from_cents(cents)
+
+    assert dollar.cents == cents
+    assert dollar.amount == Decimal(expected)
+    assert str(dollar.amount) == expected
+
+
+def test_dollar_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Dollar(1).__dict__
+
+
+def test_unary_operators_do_not_mutate():
+    dollar: Dollar = Dollar(-100)
+
+    assert abs(dollar) == Dollar(100)
+    assert -dollar == Dollar(100)
+    assert dollar == Dollar(-100)
+
+
+@pytest.mark.parametrize(
+    "amount, multiplier, expected",
+    [
+        ("320000.00", 0.005416666666666667, "1733.33"),  # monthly mortgage rate
+        ("0.01", 0.5, "0.01"),  # exact half rounds up
+        ("-0.01", 0.5, "-0.01"),  # exact half rounds away from zero
+        ("100.00", Decimal("0.125"), "12.50"),  # Decimal multiplier
+        ("100.00", 1e-20, "0.00"),  # tiny multiplier
+    ],
+)
+def test_multiply_by_rounds_half_up(amount, multiplier, expected):
+    assert Dollar(amount).multiply_by(multiplier).amount == Decimal(expected)
+
+
+def test_divide_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        Dollar(100).divide_by(0)
@@ -0,0 +1,126 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from loan_utils.dollar import Dollar
+from loan_utils.dollar_array import DollarArray
+
+
+@pytest.fixture
+def amounts() -> DollarArray:
+    return DollarArray([100, "50.25", -0.005, 2.675])
+
+
+def test_dollar_array_init(amounts):
+    assert amounts.cents.dtype == np.int64
+    assert amounts.cents.tolist() == [10000, 5025, -1, 268]
+
+
+def test_dollar_array_init_invalid():
+    with pytest.raises(TypeError):
+        DollarArray([100, Decimal("1.00")])
+
+
+def test_dollar_array_from_cents_shares_memory():
+    cents = np.arange(360 * 4, dtype=np.int64).reshape(4, 360)
+    amounts = DollarArray.from_cents(cents)
+
+    assert np.shares_memory(amounts.cents, cents)
+    assert amounts.shape == (4, 360)
+    assert np.shares_memory(amounts[1].cents, cents)
+
+
+def test_dollar_array_indexing(amounts):
+    assert amounts[1] == Dollar("50.25")
+    assert list(amounts) == [Dollar(100), Dollar("50.25"), Dollar(-0.01), Dollar(2.68)]
+
+    amounts[0] = Dollar(1)
+    assert amounts[0] == Dollar(1)
+
+    with pytest.raises(TypeError):
+        amounts[0] = 1
+
+
+def test_dollar_array_add_sub(amounts):
+    doubled = amounts + amounts
+
+    assert doubled.cents.tolist() == [20000, 10050, -2, 536]
+    assert (doubled - Dollar(1)).cents.tolist() == [19900, 9950, -102, 436]
+
+
+def test_dollar_array_mul_div():
+    amounts = DollarArray(["100.5", "-100.5"])
+
+    assert (amounts * Dollar("50.25")).cents.tolist() == [505013, -505013]
+    assert (amounts / Dollar("60.25")).cents.tolist() == [167, -167]
+
+
+@pytest.mark.parametrize(
+    "multiplier", [0.005416666666666667, 0.5, 3, 1.1, Decimal("0.125"), 1e-20]
+)
+def test_dollar_array_multiply_by_matches_dollar(amounts, multiplier):
+    result = amounts.multiply_by(multiplier)
+
+    assert list(result) == [amount.multiply_by(multiplier) for amount in amounts]
+
+
+@pytest.mark.parametrize("divisor", [12, 0.25, 3, -7.5, 1e3])
+def test_dollar_array_divide_by_matches_dollar(amounts, divisor):
+    result = amounts.divide_by(divisor)
+
+    assert list(result) == [amount.divide_by(divisor) for amount in amounts]
+
+
+@pytest.mark.parametrize("other", [1, 1.5, "1", None, np.array([1, 2, 3, 4])])
+def test_dollar_array_rejects_non_dollars(amounts, other):
+    with pytest.raises(TypeError):
+        amounts + other
+    with pytest.raises(TypeError):
+        other + amounts
+    with pytest.raises(TypeError):
+        amounts < other
+
+
+def test_dollar_array_comparisons(amounts):
+    assert (amounts > Dollar(50)).tolist() == [True, True, False, False]
+    assert (amounts == DollarArray([100, 0, 0, 2.68])).tolist() == [True, False, False, True]
+
+
+def test_dollar_array_reductions(amounts):
+    assert amounts.sum() == Dollar("152.92")
+    assert amounts.cumsum().cents.tolist() == [10000, 15025, 15024, 15292]
+    assert amounts.diff().cents.tolist() == [-4975, -5026, 269]
+
+    grid = DollarArray.from_cents(np.ones((3, 4), dtype=np.int64))
+    assert grid.sum(axis=1).cents.tolist() == [4, 4, 4]
+
+
+def test_dollar_array_formatting(amounts):
+    assert amounts.format().tolist() == ["$100.00", "$50.25", "-$0.01", "$2.68"]
+    assert str(amounts) == "[$100.00, $50.25, -$0.01, $2.68]"
+    assert repr(amounts) == "DollarArray([100.00, 50.25, -0.01, 2.68])"
+    np.testing.assert_array_equal(np.asarray(amounts), [100.0, 50.25, -0.01, 2.68])
+
+
+@pytest.mark.parametrize("cents", [10_000, 32_000_000, 9_000_000_000_000, -123_456_789_012])
+@pytest.mark.parametrize("factor", [0.005416666666666667, 0.0045833333333333334, 1 / 3, 12, 1e6])
+def test_dollar_array_large_amounts_match_dollar(cents, factor):
+    amounts = DollarArray.from_cents([cents, 1, -cents])
+    dollars = [Dollar.from_cents(value) for value in (cents, 1, -cents)]
+
+    assert list(amounts.divide_by(factor)) == [dollar.divide_by(factor) for dollar in dollars]
+    assert list(amounts.multiply_by(factor)) == [
+        dollar.multiply_by(factor) for dollar in dollars
+    ]
+    assert list(amounts.multiply_by(1e-30)) == [dollar.multiply_by(1e-30) for dollar in dollars]
+
+
+def test_dollar_array_mul_div_large_amounts_match_dollar():
+    amounts = DollarArray.from_cents([9_000_000_000_000, -31_999_999, 7])
+    rate = Dollar("0.0054")
+    payment = Dollar("1234.56")
+
+    assert list(amounts * payment) == [amount * payment for amount in amounts]
+    assert list(amounts / rate) == [amount / rate for amount in amounts]
+    with pytest.raises(OverflowError):
+        DollarArray.from_cents([9_000_000_000_000_000]) * Dollar(10_000)
@@ -0,0 +1,175 @@
+import numpy as np
+import pytest
+from loan_utils.events import (
+    EventSchedule,
+    LumpSum,
+    PaymentChange,
+    PaymentHoliday,
+    RateChange,
+    Recast,
+)
+from loan_utils.loan import Loan
+from loan_utils.portfolio import amortize_portfolio
+
+EVENTS: list = [
+    LumpSum(13, 20000),
+    PaymentHoliday(24, 3),
+    Recast(27),
+    RateChange(61, 7.5),
+    RateChange(85, 5.0, recast=False),
+    PaymentChange(100, 3000),
+]
+
+
+def simulate(principal: float, annual_percent: float, term: int, events: list) -> list:
+    """Reference month-by-month loop with the same event rules."""
+    rate = annual_percent / 100 / 12
+    payment = principal * rate / (1 - (1 + rate) ** -term)
+    balance, holiday_end, rows = principal, 1, []
+
+    for month in range(1, 10 * term):
+        prepayment = 0.0
+        for event in [e for e in events if e.month == month]:
+            if isinstance(event, LumpSum):
+                prepayment += min(event.amount, balance)
+                balance -= min(event.amount, balance)
+            elif isinstance(event, PaymentHoliday):
+                holiday_end = month + event.months
+            elif isinstance(event, PaymentChange):
+                payment = event.payment
+            else:
+                if isinstance(event, RateChange):
+                    rate = event.annual_interest_percent / 100 / 12
+                    if not event.recast:
+                        continue
+                remaining = term - month + 1
+                payment = balance * rate / (1 - (1 + rate) ** -remaining)
+        if balance <= 0:
+            rows.append((month, 0.0, prepayment, 0.0))
+            break
+        interest = balance * rate
+        paid = 0.0 if month < holiday_end else min(payment, balance + interest)
+        balance += interest - paid
+        rows.append((month, interest, prepayment, balance))
+        if balance <= 1e-6:
+            break
+
+    return rows
+
+
+def test_event_schedule_without_events_matches_portfolio():
+    schedule = EventSchedule(320000, 6.5, 360)
+    portfolio = amortize_portfolio(320000, 6.5, 360)
+    rows = list(schedule.iter_rows())
+
+    assert len(schedule.segments) == 1
+    assert schedule.payoff_month == 360
+    np.testing.assert_allclose([row.interest for row in rows], portfolio.interest[0])
+    assert schedule.total_interest == pytest.approx(portfolio.total_interest()[0])
+
+
+def test_event_schedule_matches_monthly_simulation():
+    schedule = EventSchedule(320000, 6.5, 360, EVENTS)
+    expected = simulate(320000, 6.5, 360, EVENTS)
+    rows = list(schedule.iter_rows())
+
+    assert len(schedule.segments) == len(EVENTS) + 1
+    assert schedule.payoff_month == expected[-1][0]
+    np.testing.assert_allclose([row.interest for row in rows], [r[1] for r in expected])
+    np.testing.assert_allclose(
+        [row.balance for row in rows], [r[3] for r in expected], atol=1e-6
+    )
+    assert schedule.total_interest == pytest.approx(sum(r[1] for r in expected))
+
+
+@pytest.mark.parametrize("month", [0, 1, 12, 13, 25, 99, 150, 500])
+def test_event_schedule_balance_after(month):
+    schedule = EventSchedule(320000, 6.5, 360, EVENTS)
+    rows = list(schedule.iter_rows())
+    expected = 320000 if month == 0 else rows[min(month, len(rows)) - 1].balance
+
+    assert schedule.balance_after(month) == pytest.approx(expected, abs=1e-6)
+
+
+def test_event_schedule_lump_sum_pays_off():
+    schedule = EventSchedule(100000, 5.0, 360, [LumpSum(10, 1e9)])
+    rows = list(schedule.iter_rows())
+
+    assert schedule.payoff_month == 10
+    assert rows[-1].prepayment == pytest.approx(schedule.balance_after(9))
+    assert rows[-1].balance == 0.0
+
+
+def test_loan_event_schedule():
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+    schedule = loan.event_schedule([PaymentChange(1, 3000)])
+
+    assert schedule.payoff_month == loan.payoff_with_extra_payment(
+        [3000 - float(loan.monthly_payment.amount)]
+    ).payoff_months[0]
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        [LumpSum(5, 100), LumpSum(2, 100)],  # unsorted
+        [LumpSum(0, 100)],  # before the first payment
+        [PaymentChange(1, 100)],  # payment below interest never pays off
+    ],
+)
+def test_event_schedule_invalid(events):
+    with pytest.raises(ValueError):
+        EventSchedule(100000, 5.0, 360, events)
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        EVENTS,
+        EVENTS[:3],
+        EVENTS + [LumpSum(150, 5000)],
+        EVENTS[:3] + [RateChange(61, 8.0)] + EVENTS[4:],
+        [LumpSum(2, 1000)] + EVENTS,
+        [LumpSum(13, 1e9)],
+        [],
+    ],
+)
+def test_event_schedule_with_events_matches_rebuild(events):
+    original = EventSchedule(320000, 6.5, 360, EVENTS)
+    edited = original.with_events(events)
+    rebuilt = EventSchedule(320000, 6.5, 360, events)
+
+    assert edited.segments == rebuilt.segments
+    assert edited.events == rebuilt.events
+    assert original.segments == EventSchedule(320000, 6.5, 360, EVENTS).segments
+
+
+def test_event_schedule_with_events_reuses_prefix():
+    original = EventSchedule(320000, 6.5, 360, EVENTS)
+    edited = original.add_events(LumpSum(90, 10000))
+
+    # The segments from months 1 to 84 are shared; the one from 85 is re-solved.
+    assert all(a is b for a, b in zip(edited.segments[:5], original.segments[:5]))
+    assert edited.segments[5] is not original.segments[5]
+    assert edited.events[-2] == LumpSum(90, 10000)
+
+
+def test_event_schedule_diff():
+    original = EventSchedule(320000, 6.5, 360)
+    edited = original.add_events(LumpSum(13, 20000))
+    diff = original.diff(edited)
+
+    assert diff.first_changed_month == 13
+    assert diff.payoff_month == edited.payoff_month
+    assert diff.payoff_months_delta == edited.payoff_month - 360
+    assert diff.payoff_months_delta < 0
+    assert diff.interest_delta == pytest.approx(
+        edited.total_interest - original.total_interest
+    )
+    assert original.diff(original).first_changed_month is None
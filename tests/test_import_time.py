@@ -0,0 +1,48 @@
+import re
+import subprocess
+import sys
+
+# Cumulative `python -X importtime` budget for the CLI module. numpy is most of
+# it; pandas or matplotlib alone would exceed it.
+CLI_IMPORT_BUDGET_US: int = 400_000
+
+DEFERRED_MODULES: list[str] = ["pandas", "matplotlib"]
+
+
+def import_cli() -> tuple[dict[str, int], set[str]]:
+    """Imports the CLI in a fresh interpreter and returns cumulative times and modules."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys, loan_utils.loan_analyzer_cli; print('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            cumulative[match.group(3)] = int(match.group(1))
+
+    return cumulative, set(result.stdout.split())
+
+
+def test_cli_does_not_import_plotting_or_dataframes():
+    _, modules = import_cli()
+
+    for module in DEFERRED_MODULES:
+        assert module not in modules
+
+
+def test_cli_import_time_budget():
+    # Take the best of a few runs so a busy machine does not fail the check.
+    best: int = min(
+        import_cli()[0]["loan_utils.loan_analyzer_cli"] for _ in range(3)
+    )
+
+    assert best <= CLI_IMPORT_BUDGET_US
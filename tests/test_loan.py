@@ -0,0 +1,249 @@
+import itertools
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from loan_utils.calendar import add_months
+from loan_utils.dollar import Dollar
+from loan_utils.dollar_array import DollarArray
+from loan_utils.loan import Loan
+
+
+@pytest.fixture
+def loan() -> Loan:
+    return Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+
+def test_amortization_schedule_shape_and_dtypes(loan):
+    schedule = loan.amortization_schedule(first_payment_date=date(2024, 1, 31))
+
+    assert len(schedule) == loan.term_months
+    assert schedule["Payment #"].dtype == "int64"
+    assert schedule["Payment Date"].dtype.kind == "M"
+    assert schedule["Resulting LTV%"].dtype == "float64"
+    assert isinstance(schedule["Ending Balance"].iloc[0], Decimal)
+
+
+def test_amortization_schedule_pays_off_loan(loan):
+    schedule = loan.amortization_schedule(first_payment_date=date(2024, 1, 1))
+
+    assert schedule["Ending Balance"].iloc[-1] == Decimal("0.00")
+    assert sum(schedule["Principal Portion"]) == loan.loan_amount.amount
+    assert schedule["Total Interest"].iloc[-1] == sum(schedule["Interest Portion"])
+
+
+def test_amortization_schedule_does_not_mutate_payment(loan):
+    monthly_payment = loan.monthly_payment
+
+    loan.amortization_schedule(first_payment_date=date(2024, 1, 1))
+
+    assert loan.monthly_payment == monthly_payment
+
+
+def test_amortization_schedule_payment_dates(loan):
+    schedule = loan.amortization_schedule(first_payment_date=date(2024, 1, 31))
+    dates = schedule["Payment Date"].dt.date
+
+    assert dates.iloc[0] == date(2024, 1, 31)
+    assert dates.iloc[1] == date(2024, 2, 29)
+    assert dates.iloc[2] == date(2024, 3, 31)
+
+
+def test_amortization_schedule_reads_today_once(loan, monkeypatch):
+    days = iter([date(2024, 1, 31), date(2024, 2, 1)])
+
+    class MidnightDate(date):
+        @classmethod
+        def today(cls):
+            return next(days)
+
+    monkeypatch.setattr("loan_utils.loan.date", MidnightDate)
+    schedule = loan.amortization_schedule()
+
+    assert schedule["Payment Date"].dt.date.iloc[0] == date(2024, 2, 1)
+    assert next(days) == date(2024, 2, 1)
+
+
+@pytest.mark.parametrize(
+    "start, months, expected",
+    [
+        (date(2024, 1, 15), 0, date(2024, 1, 15)),  # no offset
+        (date(2024, 1, 31), 1, date(2024, 2, 29)),  # leap February
+        (date(2023, 1, 31), 1, date(2023, 2, 28)),  # common February
+        (date(2099, 12, 31), 2, date(2100, 2, 28)),  # 2100 is not a leap year
+        (date(2024, 11, 30), 14, date(2026, 1, 30)),  # crosses years
+    ],
+)
+def test_add_months(start, months, expected):
+    assert add_months(start, months) == expected
+
+
+@pytest.mark.parametrize("month", [0, 1, 12, 180, 359, 360, 500])
+def test_point_queries_exact_match_schedule(loan, month):
+    schedule = loan.amortization_schedule()
+    row = min(month, len(schedule)) - 1
+
+    expected_balance = (
+        schedule["Ending Balance"].iloc[row] if month else loan.loan_amount.amount
+    )
+    expected_interest = schedule["Total Interest"].iloc[row] if month else Decimal(0)
+
+    assert loan.remaining_balance(month, exact=True).amount == expected_balance
+    assert loan.cumulative_interest(month, exact=True).amount == expected_interest
+    assert (
+        loan.cumulative_principal(month, exact=True).amount
+        == loan.loan_amount.amount - expected_balance
+    )
+
+
+@pytest.mark.parametrize(
+    "percent, down, price, years",
+    [
+        (6.5, 20.0, 400000, 30),
+        (0.0, 0.0, 25000, 5),
+        (12.0, 10.0, 1e9, 15),
+        (0.1 + 0.2, 5.0, 333333.33, 10),
+    ],
+)
+def test_point_queries_exact_match_portfolio_kernel(percent, down, price, years):
+    loan = Loan(percent, down, price, years)
+    schedule = loan.exact_schedule()
+    rows = int(schedule.payoff_months[0])
+    months = np.arange(1, loan.term_months + 1)
+    balance = schedule.balance[0, np.minimum(months, rows) - 1]
+
+    assert loan.remaining_balance(months, exact=True).cents.tolist() == balance.tolist()
+    assert (
+        loan.cumulative_interest(months, exact=True).cents.tolist()
+        == np.cumsum(schedule.interest[0]).tolist()
+    )
+
+
+def test_point_queries_closed_form_close_to_schedule(loan):
+    months = np.arange(0, 361, 30)
+
+    closed_form = loan.remaining_balance(months)
+    exact = loan.remaining_balance(months, exact=True)
+
+    assert isinstance(closed_form, DollarArray)
+    assert np.all(np.abs(closed_form.cents - exact.cents) <= 100)
+    assert loan.remaining_balance(360) == Dollar(0)
+    assert loan.cumulative_interest(0) == Dollar(0)
+
+
+def test_point_queries_zero_interest():
+    loan: Loan = Loan(
+        annual_interest_percent=0.0,
+        down_payment_percent=0.0,
+        purchase_price=1200,
+        term_years=1,
+    )
+
+    assert loan.remaining_balance(3) == Dollar(900)
+    assert loan.cumulative_interest(12) == Dollar(0)
+    assert loan.cumulative_principal(6, exact=True) == Dollar(600)
+
+
+def test_point_queries_reject_fractional_months(loan):
+    with pytest.raises(TypeError):
+        loan.remaining_balance(1.5)
+
+
+def test_iter_schedule_matches_dataframe(loan):
+    schedule = loan.amortization_schedule(first_payment_date=date(2024, 1, 1))
+    rows = list(loan.iter_schedule(first_payment_date=date(2024, 1, 1)))
+
+    assert len(rows) == len(schedule)
+    assert [row.balance.amount for row in rows] == list(schedule["Ending Balance"])
+    assert rows[-1].balance == Dollar(0)
+    assert rows[-1].payment_date == date(2053, 12, 1)
+
+
+def test_iter_schedule_is_lazy(loan):
+    first_year = list(itertools.islice(loan.iter_schedule(date(2024, 1, 1)), 12))
+
+    assert [row.payment_number for row in first_year] == list(range(1, 13))
+    assert first_year[-1].total_interest == loan.cumulative_interest(12, exact=True)
+    assert type(first_year[-1].payment_date) is date
+    assert first_year[-1].payment_date == date(2024, 12, 1)
+
+
+def test_iter_schedule_early_payoff(loan):
+    payoff = next(
+        row for row in loan.iter_schedule() if row.balance < loan.loan_amount.divide_by(2)
+    )
+
+    assert payoff.balance == loan.remaining_balance(payoff.payment_number, exact=True)
+
+
+def simulate_extra_payment(loan: Loan, extra: Dollar) -> tuple[int, Dollar]:
+    """Month-by-month payoff with an extra principal payment, in Dollars."""
+    balance: Dollar = loan.loan_amount
+    total_interest: Dollar = Dollar(0)
+
+    for month in range(1, loan.term_months + 1):
+        interest: Dollar = balance.multiply_by(loan.monthly_interest_rate)
+        balance -= loan.monthly_payment + extra - interest
+        total_interest += interest
+        if balance <= Dollar(0):
+            return month, total_interest
+
+    return loan.term_months, total_interest
+
+
+def test_payoff_with_extra_payment_matches_simulation(loan):
+    extras = DollarArray([0, 100, 512.5, 2000, 250000])
+
+    payoff = loan.payoff_with_extra_payment(extras)
+
+    for index, extra in enumerate(extras):
+        months, total_interest = simulate_extra_payment(loan, extra)
+        assert payoff.payoff_months[index] == months
+        assert abs(payoff.total_interest[index].amount - total_interest.amount) < 1
+    assert payoff.interest_saved[0] == Dollar(0)
+    assert payoff.months_saved[0] == 0
+    assert np.all(np.diff(payoff.payoff_months) <= 0)
+
+
+def test_payoff_with_extra_payment_grid(loan):
+    payoff = loan.payoff_with_extra_payment(np.linspace(0, 5000, 1000))
+
+    assert payoff.payoff_months.shape == (1000,)
+    assert np.all(np.diff(payoff.interest_saved.cents) >= 0)
+
+
+def test_payoff_with_extra_payment_without_a_loan_amount():
+    payoff = Loan(6.5, 100, 400000, 30).payoff_with_extra_payment([0, 100])
+
+    assert payoff.payoff_months.tolist() == [0, 0]
+    assert payoff.total_interest.cents.tolist() == [0, 0]
+    assert payoff.interest_saved.cents.tolist() == [0, 0]
+    assert payoff.months_saved.tolist() == [0, 0]
+
+
+def test_payoff_with_extra_payment_invalid(loan):
+    with pytest.raises(ValueError):
+        loan.payoff_with_extra_payment([-1.0])
+
+
+@pytest.mark.parametrize("months", [60, 120, 180, 359])
+def test_extra_payment_for_payoff(loan, months):
+    extra = loan.extra_payment_for_payoff(months)
+
+    assert loan.payoff_with_extra_payment([float(extra.amount)]).payoff_months[0] <= months
+    assert simulate_extra_payment(loan, extra)[0] <= months
+    assert extra > Dollar(0)
+
+
+def test_extra_payment_for_payoff_vectorized(loan):
+    extras = loan.extra_payment_for_payoff(np.array([120, 360, 480]))
+
+    assert isinstance(extras, DollarArray)
+    assert extras[1] == Dollar(0)
+    assert extras[2] == Dollar(0)
@@ -0,0 +1,139 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from loan_utils.cents import multiplier_arrays, multiply_round_half_up
+from loan_utils.dollar import Dollar
+from loan_utils.loan import Loan
+from loan_utils.portfolio import amortize_portfolio, amortize_portfolio_cents
+
+
+def test_amortize_portfolio_matches_loan_schedule():
+    loan: Loan = Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+    schedule = loan.amortization_schedule()
+    portfolio = amortize_portfolio(float(loan.loan_amount.amount), 6.5, 360)
+
+    expected = np.array(schedule["Interest Portion"], dtype=np.float64)
+    # The Decimal path rounds every month, so the two only agree to cents.
+    np.testing.assert_allclose(portfolio.interest[0], expected, atol=0.05)
+
+
+def test_amortize_portfolio_mixed_terms():
+    portfolio = amortize_portfolio([100000, 25000, 5000], [6.0, 0.0, 12.0], [360, 60, 12])
+
+    assert portfolio.interest.shape == (3, 360)
+    np.testing.assert_array_equal(portfolio.payoff_months, [360, 60, 12])
+    np.testing.assert_array_equal(portfolio.active.sum(axis=1), [360, 60, 12])
+    np.testing.assert_allclose(portfolio.principal.sum(axis=1), [100000, 25000, 5000])
+    assert np.all(portfolio.balance[~portfolio.active] == 0.0)
+    assert portfolio.balance[1, 59] == 0.0
+    assert portfolio.interest[1].sum() == 0.0
+    assert portfolio.masked("payment")[2].count() == 12
+
+
+def test_amortize_portfolio_final_payment_clamp():
+    portfolio = amortize_portfolio(1000.0, 5.0, 12)
+
+    assert np.all(portfolio.balance >= 0.0)
+    assert portfolio.balance[0, -1] == 0.0
+    assert portfolio.payment[0, -1] == pytest.approx(portfolio.payment[0, 0])
+
+
+@pytest.mark.parametrize(
+    "principal, rate, term",
+    [
+        (-1.0, 5.0, 12),  # negative principal
+        (1000.0, 5.0, 0),  # zero term
+        (1000.0, 5.0, 12.5),  # fractional term
+        ([[1000.0]], 5.0, 12),  # not 1-D
+    ],
+)
+def test_amortize_portfolio_invalid(principal, rate, term):
+    with pytest.raises(ValueError):
+        amortize_portfolio(principal, rate, term)
+
+
+@pytest.mark.parametrize(
+    "annual_interest_percent, down_payment_percent, purchase_price, term_years",
+    [
+        (6.5, 20.0, 400000, 30),  # typical mortgage
+        (2.875, 3.5, 289999.99, 15),  # small down payment
+        (6.99, 0.0, 21893.01, 4),  # auto loan
+        (0.0, 10.0, 12345.67, 5),  # zero interest leaves a rounding remainder
+        (18.0, 0.0, 999.99, 1),  # high rate, short term
+        (6.5, 0.0, 200_000_000, 30),  # balances past int64 split multiply range
+    ],
+)
+def test_amortize_portfolio_cents_matches_loan_schedule(
+    annual_interest_percent, down_payment_percent, purchase_price, term_years
+):
+    loan: Loan = Loan(
+        annual_interest_percent=annual_interest_percent,
+        down_payment_percent=down_payment_percent,
+        purchase_price=purchase_price,
+        term_years=term_years,
+    )
+    schedule = loan.amortization_schedule()
+    portfolio = amortize_portfolio_cents(
+        int(loan.loan_amount.amount * 100), annual_interest_percent, loan.term_months
+    )
+
+    def cents(column: str) -> list[int]:
+        return [int(amount * 100) for amount in schedule[column]]
+
+    rows: int = len(schedule)
+    assert portfolio.payoff_months[0] == rows
+    assert portfolio.payment.dtype == np.int64
+    assert portfolio.payment[0, :rows].tolist() == cents("Payment Amount")
+    assert portfolio.interest[0, :rows].tolist() == cents("Interest Portion")
+    assert portfolio.principal[0, :rows].tolist() == cents("Principal Portion")
+    assert portfolio.balance[0, :rows].tolist() == cents("Ending Balance")
+    assert portfolio.interest[0].sum() == cents("Total Interest")[-1]
+
+
+def test_amortize_portfolio_cents_many_loans():
+    rng = np.random.default_rng(7)
+    principal_cents = rng.integers(100_000, 100_000_000, size=200)
+    annual_interest_percent = rng.choice([3.25, 4.5, 5.125, 6.875, 7.0], size=200)
+    term_months = rng.choice([120, 180, 360], size=200)
+
+    portfolio = amortize_portfolio_cents(
+        principal_cents, annual_interest_percent, term_months
+    )
+
+    final_balance = portfolio.balance[np.arange(200), portfolio.payoff_months - 1]
+
+    np.testing.assert_array_equal(
+        portfolio.principal.sum(axis=1) + final_balance, principal_cents
+    )
+    assert np.all(portfolio.payoff_months <= term_months)
+    np.testing.assert_array_equal(portfolio.active.sum(axis=1), portfolio.payoff_months)
+
+
+@pytest.mark.parametrize(
+    "cents, multiplier",
+    [
+        (32000000, 0.005416666666666667),  # 6.5% monthly
+        (-5055, 0.1),  # negative amount
+        (1, 0.5),  # exact half rounds up
+        (-1, 0.5),  # exact half rounds away from zero
+        (10050, 50.25),  # multiplier above one
+        (12345, 3),  # whole multiplier
+        (99999999999, 0.0000000001),  # many decimals
+        (123456789, 0.000002291666666666667),  # tiny rate
+    ],
+)
+def test_multiply_round_half_up_matches_dollar(cents, multiplier):
+    expected: Dollar = Dollar._from_decimal(Decimal(cents) / 100).multiply_by(
+        multiplier
+    )
+    coefficients, decimals = multiplier_arrays([multiplier])
+
+    result = multiply_round_half_up(np.array([cents]), coefficients, decimals)
+
+    assert result[0] == int(expected.amount * 100)
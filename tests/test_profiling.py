@@ -0,0 +1,117 @@
+import io
+
+import pytest
+from loan_utils.batch import read_loans, run_batch
+from loan_utils.loan import Loan
+from loan_utils.profiling import PROFILER, Profiler, phase
+
+LOANS_CSV: str = """id,price,annual_interest_percentage,down_payment_percentage,term_years
+a,400000,6.5,20,30
+b,21893.01,6.99,0,4
+c,abc,6.5,20,30
+"""
+
+
+@pytest.fixture
+def profiler():
+    PROFILER.reset()
+    PROFILER.enable()
+    yield PROFILER
+    PROFILER.disable()
+    PROFILER.reset()
+
+
+def make_loan() -> Loan:
+    return Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+
+def test_profiler_disabled_records_nothing():
+    profiler: Profiler = Profiler()
+
+    with profiler.phase("work"):
+        profiler.count("items", 3)
+
+    assert profiler.phases == {}
+    assert profiler.counters == {}
+    assert profiler.phase("work") is profiler.phase("other")
+
+
+def test_profiler_phases_and_counters():
+    profiler: Profiler = Profiler()
+    profiler.enable()
+
+    for _ in range(3):
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                profiler.count("items", 2)
+    profiler.disable()
+
+    assert profiler.phases["outer"].calls == 3
+    assert profiler.phases["outer"].seconds >= profiler.phases["inner"].seconds
+    assert profiler.counters == {"items": 6}
+    assert profiler.elapsed >= profiler.phases["outer"].seconds
+
+    report: str = profiler.report()
+    assert report.index("outer") < report.index("inner")
+    assert "items" in report
+
+
+def test_profiler_merge():
+    worker: Profiler = Profiler()
+    worker.enable()
+    with worker.phase("schedule"):
+        worker.count("loans", 5)
+
+    profiler: Profiler = Profiler()
+    profiler.merge(worker.snapshot())
+    profiler.merge(worker.snapshot())
+
+    assert profiler.phases["schedule"].calls == 2
+    assert profiler.counters == {"loans": 10}
+
+
+def test_profiler_records_exceptions():
+    profiler: Profiler = Profiler()
+    profiler.enable()
+
+    with pytest.raises(ValueError):
+        with profiler.phase("failing"):
+            raise ValueError
+
+    assert profiler.phases["failing"].calls == 1
+
+
+def test_loan_phases(profiler):
+    loan: Loan = make_loan()
+    loan.amortization_schedule()
+
+    assert {"payment", "schedule", "dataframe"} <= set(profiler.phases)
+    assert profiler.counters["schedule_rows"] == 360
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_phases(profiler, workers):
+    run_batch(
+        read_loans(io.StringIO(LOANS_CSV), "csv"),
+        io.StringIO(),
+        errors=io.StringIO(),
+        workers=workers,
+        chunk_size=1,
+    )
+
+    assert {"batch_parse", "schedule", "formatting", "output"} <= set(profiler.phases)
+    assert profiler.phases["schedule"].calls == 2
+    assert profiler.counters["batch_loans"] == 2
+    assert profiler.counters["batch_errors"] == 1
+
+
+def test_module_phase_uses_global_profiler(profiler):
+    with phase("global"):
+        pass
+
+    assert profiler.phases["global"].calls == 1
@@ -0,0 +1,159 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from loan_utils import schedule_cache
+from loan_utils.loan import Loan
+from loan_utils.portfolio import amortize_portfolio_cents
+from loan_utils.schedule_cache import ScheduleCache, library_version, schedule_key
+
+SCHEDULE_COLUMNS: list[str] = ["payment", "interest", "principal", "balance"]
+
+
+@pytest.fixture
+def loan() -> Loan:
+    return Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20.0,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ScheduleCache(tmp_path / "schedules.sqlite3") as cache:
+        yield cache
+
+
+def fill_cache(path, start: int, count: int) -> int:
+    """Computes loans through a cache opened in a worker process."""
+    with ScheduleCache(path) as cache:
+        for principal in range(start, start + count):
+            cache.schedule(principal * 100, 6.5, 60, 20000)
+
+    return count
+
+
+def test_schedule_key_is_canonical():
+    key: str = schedule_key(32000000, 6.5, 360, 202263)
+
+    assert key == schedule_key(32000000.0, 6.5, 360, 202263)
+    assert key != schedule_key(32000000, 6.5, 360, 202264)
+    assert key != schedule_key(32000000, 6.51, 360, 202263)
+    assert len(key) == 64
+
+
+def test_schedule_key_changes_with_the_revision(monkeypatch):
+    key: str = schedule_key(32000000, 6.5, 360, 202263)
+    monkeypatch.setattr(schedule_cache, "SCHEDULE_REVISION", schedule_cache.SCHEDULE_REVISION + 1)
+
+    assert schedule_key(32000000, 6.5, 360, 202263) != key
+
+
+def test_schedule_key_reads_the_version_once():
+    schedule_key(32000000, 6.5, 360, 202263)
+    before = library_version.cache_info()
+    schedule_key(32000000, 6.5, 360, 202264)
+
+    assert library_version.cache_info().hits == before.hits + 1
+    assert library_version.cache_info().misses == before.misses
+
+
+def test_schedule_cache_hits_are_read_only_until_flushed(cache, loan):
+    loan.exact_schedule(cache)
+    changes = cache._connection.total_changes
+
+    for _ in range(10):
+        loan.exact_schedule(cache)
+    assert cache._connection.total_changes == changes
+
+    cache.flush()
+    assert cache._connection.total_changes > changes
+    assert cache.stats().hits == 10
+
+    for _ in range(64):
+        loan.exact_schedule(cache)
+    assert cache._connection.total_changes > changes + 2
+
+
+def test_schedule_cache_round_trip(cache, loan):
+    expected = loan.exact_schedule()
+    first = loan.exact_schedule(cache)
+    second = loan.exact_schedule(cache)
+
+    for name in SCHEDULE_COLUMNS + ["payoff_months"]:
+        np.testing.assert_array_equal(getattr(first, name), getattr(expected, name))
+        np.testing.assert_array_equal(getattr(second, name), getattr(expected, name))
+
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_schedule_cache_persists(tmp_path, loan):
+    with ScheduleCache(tmp_path / "schedules.sqlite3") as cache:
+        loan.exact_schedule(cache)
+
+    with ScheduleCache(tmp_path / "schedules.sqlite3") as cache:
+        key: str = schedule_key(
+            loan.loan_amount.cents,
+            loan.annual_interest_percent,
+            loan.term_months,
+            loan.monthly_payment.cents,
+        )
+        assert cache.get(key) is not None
+        assert cache.stats().hits == 1
+
+
+def test_schedule_cache_evicts_least_recently_used(tmp_path):
+    schedule = amortize_portfolio_cents(32000000, 6.5, 360)
+    keys: list[str] = [f"key-{index}" for index in range(4)]
+
+    with ScheduleCache(tmp_path / "schedules.sqlite3") as probe:
+        probe.put(keys[0], schedule)
+        entry_size: int = probe.stats().size_bytes
+
+    with ScheduleCache(tmp_path / "schedules.sqlite3", max_bytes=3 * entry_size) as cache:
+        for key in keys[1:3]:
+            cache.put(key, schedule)
+        cache.get(keys[0])
+        cache.put(keys[3], schedule)
+
+        stats = cache.stats()
+        assert stats.entries == 3
+        assert stats.evictions == 1
+        assert stats.size_bytes <= 3 * entry_size
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+
+
+def test_schedule_cache_clear(cache, loan):
+    loan.exact_schedule(cache)
+    cache.clear()
+
+    stats = cache.stats()
+    assert (stats.entries, stats.size_bytes, stats.hits, stats.misses) == (0, 0, 0, 0)
+
+
+def test_schedule_cache_concurrent_writers(tmp_path):
+    path = tmp_path / "schedules.sqlite3"
+
+    # Overlapping ranges so processes race to write the same keys.
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        counts = list(executor.map(fill_cache, [path] * 4, [1000, 1010, 1020, 1030], [20] * 4))
+
+    with ScheduleCache(path) as cache:
+        stats = cache.stats()
+        assert stats.entries == 50
+        assert stats.hits + stats.misses == sum(counts)
+        assert stats.misses >= 50
+
+        schedule = cache.schedule(104000, 6.5, 60, 20000)
+        expected = amortize_portfolio_cents(104000, 6.5, 60, 20000)
+        np.testing.assert_array_equal(schedule.balance, expected.balance)
+
+
+def test_schedule_cache_rejects_portfolios(cache):
+    with pytest.raises(ValueError):
+        cache.put("key", amortize_portfolio_cents([100000, 200000], 6.5, 12))
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from loan_utils.portfolio import amortize_portfolio_cents
+from loan_utils.schedule_store import (
+    FORMAT_VERSION,
+    STORE_COLUMNS,
+    ScheduleStore,
+    ScheduleWriter,
+    write_schedules,
+)
+
+PRINCIPAL_CENTS: list[int] = [32000000, 2189301, 22500000, 0, 1500000]
+ANNUAL_PERCENTS: list[float] = [6.5, 6.99, 0.0, 5.0, 12.0]
+TERM_MONTHS: list[int] = [360, 48, 180, 12, 60]
+
+
+@pytest.fixture
+def portfolio():
+    return amortize_portfolio_cents(PRINCIPAL_CENTS, ANNUAL_PERCENTS, TERM_MONTHS)
+
+
+def test_schedule_store_round_trip(tmp_path, portfolio):
+    write_schedules(tmp_path / "schedules.bin", portfolio)
+    store = ScheduleStore(tmp_path / "schedules.bin")
+
+    assert (len(store), store.n_months) == (5, 360)
+    np.testing.assert_array_equal(store.payoff_months, portfolio.payoff_months)
+    for name in STORE_COLUMNS:
+        assert isinstance(store.column(name), np.memmap)
+        np.testing.assert_array_equal(store.column(name), getattr(portfolio, name))
+
+
+@pytest.mark.parametrize("index", [0, 1, 4, -1])
+def test_schedule_store_loan(tmp_path, portfolio, index):
+    write_schedules(tmp_path / "schedules.bin", portfolio)
+    loan = ScheduleStore(tmp_path / "schedules.bin").loan(index)
+
+    assert loan.n_loans == 1
+    for name in ["payment", *STORE_COLUMNS, "payoff_months"]:
+        np.testing.assert_array_equal(getattr(loan, name)[0], getattr(portfolio, name)[index])
+    assert not loan.balance.flags.owndata
+
+
+@pytest.mark.parametrize("month_major", [True, False])
+@pytest.mark.parametrize("month", [1, 48, 360])
+def test_schedule_store_month(tmp_path, portfolio, month, month_major):
+    write_schedules(tmp_path / "schedules.bin", portfolio, month_major=month_major)
+    store = ScheduleStore(tmp_path / "schedules.bin")
+    section = store.month(month)
+
+    assert store.month_major == month_major
+    assert section.month == month
+    assert section.balance.flags.c_contiguous == month_major
+    np.testing.assert_array_equal(section.interest, portfolio.interest[:, month - 1])
+    np.testing.assert_array_equal(section.principal, portfolio.principal[:, month - 1])
+    np.testing.assert_array_equal(section.balance, portfolio.balance[:, month - 1])
+
+
+def test_schedule_store_month_major_doubles_the_columns(tmp_path, portfolio):
+    write_schedules(tmp_path / "both.bin", portfolio)
+    write_schedules(tmp_path / "loans.bin", portfolio, month_major=False)
+    column_bytes = portfolio.balance.nbytes * len(STORE_COLUMNS)
+
+    extra = (tmp_path / "both.bin").stat().st_size - (tmp_path / "loans.bin").stat().st_size
+    assert column_bytes <= extra < column_bytes + 64 * len(STORE_COLUMNS)
+
+
+def test_schedule_writer_chunks(tmp_path, portfolio):
+    with ScheduleWriter(tmp_path / "schedules.bin", n_loans=5, n_months=360) as writer:
+        for start in range(0, 5, 2):
+            writer.write(
+                amortize_portfolio_cents(
+                    PRINCIPAL_CENTS[start : start + 2],
+                    ANNUAL_PERCENTS[start : start + 2],
+                    TERM_MONTHS[start : start + 2],
+                )
+            )
+    store = ScheduleStore(tmp_path / "schedules.bin")
+
+    for name in STORE_COLUMNS:
+        np.testing.assert_array_equal(store.column(name), getattr(portfolio, name))
+    np.testing.assert_array_equal(store.month(48).balance, portfolio.balance[:, 47])
+
+
+def test_schedule_writer_checks_counts(tmp_path, portfolio):
+    with pytest.raises(ValueError):
+        with ScheduleWriter(tmp_path / "schedules.bin", n_loans=6, n_months=360) as writer:
+            writer.write(portfolio)
+
+    with ScheduleWriter(tmp_path / "schedules.bin", n_loans=5, n_months=360) as writer:
+        writer.write(portfolio)
+        with pytest.raises(ValueError):
+            writer.write(portfolio)
+
+
+def test_schedule_store_rejects_other_files(tmp_path, portfolio):
+    (tmp_path / "other.bin").write_bytes(b"not a schedule store" * 10)
+    with pytest.raises(ValueError):
+        ScheduleStore(tmp_path / "other.bin")
+
+    write_schedules(tmp_path / "schedules.bin", portfolio)
+    data: bytes = (tmp_path / "schedules.bin").read_bytes()
+    (tmp_path / "truncated.bin").write_bytes(data[: len(data) // 2])
+    with pytest.raises(ValueError):
+        ScheduleStore(tmp_path / "truncated.bin")
+
+    newer = bytearray(data)
+    newer[8:10] = (FORMAT_VERSION + 1).to_bytes(2, "little")
+    (tmp_path / "newer.bin").write_bytes(bytes(newer))
+    with pytest.raises(ValueError):
+        ScheduleStore(tmp_path / "newer.bin")
+
+    store = ScheduleStore(tmp_path / "schedules.bin")
+    with pytest.raises(IndexError):
+        store.loan(5)
+    with pytest.raises(IndexError):
+        store.month(0)
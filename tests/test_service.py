@@ -0,0 +1,209 @@
+import asyncio
+import json
+
+import pytest
+from loan_utils.loan import Loan
+from loan_utils.service import LoanService, start_server
+
+MORTGAGE: dict = {
+    "price": 400000,
+    "annual_interest_percentage": 6.5,
+    "down_payment_percentage": 20,
+    "term_years": 30,
+}
+
+
+def make_loan() -> Loan:
+    return Loan(
+        annual_interest_percent=6.5,
+        down_payment_percent=20,
+        purchase_price=400000,
+        term_years=30,
+    )
+
+
+async def request(port: int, method: str, target: str, body: dict | None = None):
+    """Sends one HTTP request on a new connection and returns status and JSON."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    content: bytes = json.dumps(body).encode() if body is not None else b""
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        f"Content-Length: {len(content)}\r\n\r\n".encode()
+        + content
+    )
+    await writer.drain()
+    response: bytes = await reader.read()
+    writer.close()
+
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+
+def run_with_server(scenario, **service_options):
+    async def main():
+        async with LoanService(**service_options) as service:
+            server = await start_server(service, port=0)
+            async with server:
+                return await scenario(service, server.sockets[0].getsockname()[1])
+
+    return asyncio.run(main())
+
+
+def test_service_payment_and_summary():
+    loan: Loan = make_loan()
+    schedule = loan.amortization_schedule()
+
+    async def scenario(service, port):
+        payment = await request(port, "GET", "/payment?price=400000&annual_interest_percentage=6.5"
+                                "&down_payment_percentage=20&term_years=30")
+        summary = await request(port, "POST", "/summary", MORTGAGE)
+        return payment, summary
+
+    (payment_status, payment), (summary_status, summary) = run_with_server(
+        scenario, workers=0
+    )
+
+    assert payment_status == summary_status == 200
+    assert payment["monthly_payment"] == str(loan.monthly_payment.amount)
+    assert summary["payoff_month"] == len(schedule)
+    assert summary["total_interest"] == str(schedule["Total Interest"].iloc[-1])
+
+
+def test_service_schedule_matches_loan():
+    schedule = make_loan().amortization_schedule()
+
+    async def scenario(service, port):
+        return await request(port, "POST", "/schedule", MORTGAGE)
+
+    status, body = run_with_server(scenario, workers=1)
+
+    assert status == 200
+    assert body["payment_number"] == list(range(1, 361))
+    assert body["interest"] == [str(value) for value in schedule["Interest Portion"]]
+    assert body["balance"] == [str(value) for value in schedule["Ending Balance"]]
+
+
+def test_service_coalesces_and_batches():
+    loans: list[dict] = [dict(MORTGAGE, price=price) for price in (300000, 400000, 500000)]
+
+    async def scenario(service, port):
+        # Twelve concurrent requests for three distinct loans, then repeats.
+        await asyncio.gather(
+            *(request(port, "POST", "/summary", loans[i % 3]) for i in range(12))
+        )
+        await request(port, "POST", "/summary", loans[0])
+        return (await request(port, "GET", "/stats"))[1]
+
+    stats = run_with_server(scenario, workers=0, batch_window=0.05)
+
+    assert stats["computed"] == 3
+    assert stats["batches"] == 1
+    assert stats["coalesced"] + stats["cache_hits"] == 10
+    assert stats["requests"] == {"summary": 13}
+    assert stats["latency_ms"]["max"] >= stats["latency_ms"]["p50"] > 0
+
+
+def test_service_cache_evicts():
+    loans: list[dict] = [dict(MORTGAGE, price=price) for price in (300000, 400000, 500000)]
+
+    async def scenario(service, port):
+        for loan in loans + loans[:1]:
+            await request(port, "POST", "/summary", loan)
+        return service.stats.to_json()
+
+    stats = run_with_server(scenario, workers=0, cache_bytes=2048, batch_window=0.0)
+
+    assert stats["computed"] == 4
+    assert stats["cache_hits"] == 0
+
+
+def test_service_caches_summaries_and_schedules_separately():
+    async def scenario(service, port):
+        await request(port, "POST", "/summary", MORTGAGE)
+        summary_only = service._cached_bytes
+        await request(port, "POST", "/schedule", MORTGAGE)
+        await request(port, "POST", "/schedule", MORTGAGE)
+        return summary_only, service._cached_bytes, service.stats.to_json()
+
+    summary_only, both, stats = run_with_server(scenario, workers=0, batch_window=0.0)
+
+    # A summary does not hold the schedule; the schedule is kept as int64 cents.
+    assert summary_only < 2048
+    assert both - summary_only < 2048 + 4 * 360 * 8
+    assert stats["computed"] == 2
+    assert stats["cache_hits"] == 1
+
+
+@pytest.mark.parametrize(
+    "method, target, body, status",
+    [
+        ("POST", "/summary", {"price": 400000}, 400),
+        ("POST", "/summary", dict(MORTGAGE, price=-1), 400),
+        ("GET", "/unknown", None, 404),
+        ("DELETE", "/summary", None, 405),
+    ],
+)
+def test_service_errors(method, target, body, status):
+    async def scenario(service, port):
+        return await request(port, method, target, body)
+
+    response_status, response = run_with_server(scenario, workers=0)
+
+    assert response_status == status
+    assert "error" in response
+
+
+def test_service_records_failed_requests():
+    async def scenario(service, port):
+        await request(port, "POST", "/summary", MORTGAGE)
+        await request(port, "POST", "/summary", {"price": 400000})
+        await request(port, "GET", "/unknown")
+        return (await request(port, "GET", "/stats"))[1]
+
+    stats = run_with_server(scenario, workers=0)
+
+    assert stats["requests"] == {"summary": 2, "unknown": 1}
+    assert stats["errors"] == 2
+    assert stats["latency_ms"]["max"] > 0
+
+
+def test_service_replaces_a_broken_process_pool():
+    async def scenario(service, port):
+        broken = service._executor
+        for process in list(broken._processes.values()):
+            process.kill()
+            process.join()
+        failed = await request(port, "POST", "/summary", MORTGAGE)
+        recovered = await request(port, "POST", "/summary", MORTGAGE)
+        return broken is not service._executor, failed, recovered, service.stats.errors
+
+    replaced, failed, recovered, errors = run_with_server(scenario, workers=1, batch_window=0.0)
+
+    assert replaced
+    assert failed[0] == 500
+    assert recovered[0] == 200
+    assert recovered[1]["payoff_month"] == 360
+    assert errors == 1
+
+
+def test_service_keep_alive():
+    async def scenario(service, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        bodies: list[dict] = []
+        for _ in range(3):
+            content: bytes = json.dumps(MORTGAGE).encode()
+            writer.write(
+                f"POST /payment HTTP/1.1\r\nContent-Length: {len(content)}\r\n\r\n".encode()
+                + content
+            )
+            await writer.drain()
+            head: bytes = await reader.readuntil(b"\r\n\r\n")
+            length: int = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            bodies.append(json.loads(await reader.readexactly(length)))
+        writer.close()
+        return bodies
+
+    bodies = run_with_server(scenario, workers=0)
+
+    assert len(bodies) == 3
+    assert bodies[0] == bodies[2]